@@ -6,7 +6,7 @@ Computes:
 - Blast zones from active bombs (including chain reactions)
 - Mob danger zones (predicted positions)
 """
-from typing import Dict, Set, Tuple, List
+from typing import Dict, FrozenSet, Set, Tuple, List, Optional
 from dataclasses import dataclass
 import logging
 
@@ -15,6 +15,16 @@ from bot.config import DEFAULT_BOMB_FUSE, MOB_GHOST, MOB_PATROL
 
 logger = logging.getLogger(__name__)
 
+# Blast ray directions: N, E, S, W
+_DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+# Awake-mob danger diamond: (dx, dy, danger) for cells within 2 steps, danger 1/(distance+1)
+_MOB_DANGER_OFFSETS = tuple(
+    (dx, dy, 1.0 / (abs(dx) + abs(dy) + 1))
+    for dx in range(-2, 3) for dy in range(-2, 3)
+    if abs(dx) + abs(dy) <= 2
+)
+
 
 @dataclass
 class BlastZone:
@@ -44,6 +54,20 @@ class DangerMap:
         self.blast_zones: List[BlastZone] = []
         self.unsafe_cells: Set[Tuple[int, int]] = set()
         self.mob_danger: Dict[Tuple[int, int], float] = {}  # pos -> danger level
+        
+        # Row-major (y * width + x) grid of the earliest explode time of any blast
+        # covering each cell (inf if none), so is_safe() is one index instead of a
+        # membership test per blast zone
+        self._map_size: Tuple[int, int] = (0, 0)
+        self._blast_time: List[float] = []
+        # Indices written into _blast_time by the last update, reset to inf on the next
+        # one instead of reallocating the whole grid
+        self._blast_touched: List[int] = []
+        
+        # Obstacle/wall tiles stopping blast rays, rebuilt only when the state's sets
+        # change (parsing reuses them while walls/obstacles are unchanged)
+        self._geometry: Tuple[Optional[FrozenSet[Tuple[int, int]]], ...] = (None, None)
+        self._geometry_stops: FrozenSet[Tuple[int, int]] = frozenset()
     
     def update(self, state: ArenaState, current_time: float = 0.0):
         """
@@ -51,23 +75,47 @@ class DangerMap:
         
         Args:
             state: Current arena state
-            current_time: Current game time (seconds)
+            current_time: Current game time (seconds); unused, bomb timers are
+                already seconds remaining and are compared directly
         """
         self.blast_zones = []
         self.unsafe_cells = set()
         self.mob_danger = {}
+        map_w, map_h = state.map_size
+        inf = float('inf')
+        if (map_w, map_h) != self._map_size:
+            self._map_size = (map_w, map_h)
+            self._blast_time = [inf] * (map_w * map_h)
+        else:
+            for idx in self._blast_touched:
+                self._blast_time[idx] = inf
+        blast_time = self._blast_time
+        self._blast_touched = touched = []
+        
+        if not state.bombs:
+            # Common mid-round tick: no blasts to propagate, so the ray-stop geometry
+            # is not even refreshed (it is checked again once bombs appear)
+            self._compute_mob_danger(state)
+            return
+        
+        if state.obstacle_set is not self._geometry[0] or state.wall_set is not self._geometry[1]:
+            self._geometry = (state.obstacle_set, state.wall_set)
+            self._geometry_stops = state.obstacle_set | state.wall_set
         
         # Compute blast zones for all bombs
         processed_bombs: Set[Tuple[int, int]] = set()
+        # Bombs a blast ray chains into, first bomb per cell (obstacles/walls are checked
+        # first: a bomb on such a tile just stops the ray)
+        bomb_at: Dict[Tuple[int, int], Bomb] = {}
+        for bomb in state.bombs:
+            bomb_at.setdefault(bomb.pos.to_tuple(), bomb)
         
         for bomb in state.bombs:
             if bomb.pos.to_tuple() in processed_bombs:
                 continue
             
             # Compute blast zone (including chain reactions)
-            blast_cells = self._compute_blast_zone(
-                bomb, state, processed_bombs, current_time
-            )
+            blast_cells = self._compute_blast_zone(bomb, state, processed_bombs, bomb_at)
             
             explode_time = bomb.timer
             self.blast_zones.append(BlastZone(
@@ -80,6 +128,13 @@ class DangerMap:
             # Mark cells as unsafe if explosion is soon
             if explode_time <= 8.0:  # Within fuse time
                 self.unsafe_cells.update(blast_cells)
+            
+            for x, y in blast_cells:
+                if 0 <= x < map_w and 0 <= y < map_h:  # A bomb's own cell is not bounds-checked
+                    idx = y * map_w + x
+                    if explode_time < blast_time[idx]:
+                        blast_time[idx] = explode_time
+                        touched.append(idx)
         
         # Compute mob danger
         self._compute_mob_danger(state)
@@ -89,7 +144,7 @@ class DangerMap:
         bomb: Bomb,
         state: ArenaState,
         processed_bombs: Set[Tuple[int, int]],
-        current_time: float
+        bomb_at: Dict[Tuple[int, int], Bomb]
     ) -> Set[Tuple[int, int]]:
         """
         Compute blast zone including chain reactions.
@@ -98,49 +153,33 @@ class DangerMap:
         """
         affected = {bomb.pos.to_tuple()}
         processed_bombs.add(bomb.pos.to_tuple())
+        map_w, map_h = state.map_size
+        geometry_stops = self._geometry_stops
+        bx, by = bomb.pos.x, bomb.pos.y
         
-        # Directions: N, E, S, W
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        
-        for dx, dy in directions:
+        for dx, dy in _DIRECTIONS:
             for dist in range(1, bomb.range + 1):
-                x = bomb.pos.x + dx * dist
-                y = bomb.pos.y + dy * dist
+                x = bx + dx * dist
+                y = by + dy * dist
                 
                 # Bounds check
-                if (x < 0 or x >= state.map_size[0] or
-                    y < 0 or y >= state.map_size[1]):
+                if x < 0 or x >= map_w or y < 0 or y >= map_h:
                     break
                 
                 cell = (x, y)
                 affected.add(cell)
                 
-                # Check if ray stops (obstacle or bomb)
-                # Check for obstacles (ray stops at first obstacle)
-                if any(o.x == x and o.y == y for o in state.obstacles):
-                    break  # Ray stops at obstacle
-                
-                # Check for walls (ray stops at wall)
-                if any(w.x == x and w.y == y for w in state.walls):
-                    break  # Ray stops at wall
-                
-                # Check for other bombs (chain reaction)
-                for other_bomb in state.bombs:
-                    if other_bomb.pos.x == x and other_bomb.pos.y == y:
-                        if other_bomb.pos.to_tuple() not in processed_bombs:
-                            # Chain reaction: this bomb will explode early
-                            # Recursively compute its blast zone
-                            chain_cells = self._compute_blast_zone(
-                                other_bomb, state, processed_bombs, current_time
-                            )
-                            affected.update(chain_cells)
-                        break  # Ray stops at bomb
-                else:
-                    # No obstacle/wall/bomb, ray continues
-                    continue
-                
-                # Ray stopped
-                break
+                # Ray stops at the first obstacle, wall or bomb
+                if cell in geometry_stops:
+                    break
+                other_bomb = bomb_at.get(cell)
+                if other_bomb is not None:
+                    if cell not in processed_bombs:
+                        # Chain reaction: this bomb will explode early
+                        # Recursively compute its blast zone
+                        chain_cells = self._compute_blast_zone(other_bomb, state, processed_bombs, bomb_at)
+                        affected.update(chain_cells)
+                    break
         
         return affected
     
@@ -152,35 +191,21 @@ class DangerMap:
         Ghost: can pass obstacles, larger vision
         Patrol: normal movement
         """
+        map_w, map_h = state.map_size
+        mob_danger = self.mob_danger
         for mob in state.mobs:
             if mob.safe_time > 0:
                 continue  # Sleeping, not dangerous
             
-            pos = mob.pos
-            danger_radius = 2  # Cells within 2 steps are dangerous
-            
-            # Mark nearby cells as dangerous
-            for dx in range(-danger_radius, danger_radius + 1):
-                for dy in range(-danger_radius, danger_radius + 1):
-                    if abs(dx) + abs(dy) > danger_radius:
-                        continue
-                    
-                    x = pos.x + dx
-                    y = pos.y + dy
-                    
-                    # Bounds check
-                    if (x < 0 or x >= state.map_size[0] or
-                        y < 0 or y >= state.map_size[1]):
-                        continue
-                    
+            # Mark cells within 2 steps, higher danger closer to the mob (max over mobs)
+            px, py = mob.pos.x, mob.pos.y
+            for dx, dy, danger in _MOB_DANGER_OFFSETS:
+                x = px + dx
+                y = py + dy
+                if 0 <= x < map_w and 0 <= y < map_h:
                     cell = (x, y)
-                    # Higher danger if closer to mob
-                    distance = abs(dx) + abs(dy)
-                    danger = 1.0 / (distance + 1)
-                    
-                    if cell not in self.mob_danger:
-                        self.mob_danger[cell] = 0.0
-                    self.mob_danger[cell] = max(self.mob_danger[cell], danger)
+                    if danger > mob_danger.get(cell, 0.0):
+                        mob_danger[cell] = danger
     
     def is_safe(self, pos: Position, time_horizon: float = 8.0) -> bool:
         """
@@ -190,18 +215,15 @@ class DangerMap:
             pos: Position to check
             time_horizon: Time horizon in seconds (default: bomb fuse time)
         """
-        pos_tuple = pos.to_tuple()
-        
-        # Check blast zones
-        for blast in self.blast_zones:
-            if pos_tuple in blast.affected_cells:
-                if blast.explode_time <= time_horizon:
-                    return False
+        # Check blast zones (earliest explosion covering this cell)
+        map_w, map_h = self._map_size
+        if 0 <= pos.x < map_w and 0 <= pos.y < map_h:
+            if self._blast_time[pos.y * map_w + pos.x] <= time_horizon:
+                return False
         
         # Check mob danger (high danger = unsafe)
-        if pos_tuple in self.mob_danger:
-            if self.mob_danger[pos_tuple] > 0.5:  # Threshold
-                return False
+        if self.mob_danger.get(pos.to_tuple(), 0.0) > 0.5:  # Threshold
+            return False
         
         return True
     
@@ -226,52 +248,48 @@ class DangerMap:
         Returns:
             Safe position or None
         """
-        # Compute blast cells
+        map_w, map_h = state.map_size
+        if not (0 <= start_pos.x < map_w and 0 <= start_pos.y < map_h):
+            return None
+        
+        # Blast cells as flat (y * width + x) indices
         blast_cells = set()
-        blast_cells.add(bomb_pos.to_tuple())
+        if 0 <= bomb_pos.x < map_w and 0 <= bomb_pos.y < map_h:
+            blast_cells.add(bomb_pos.y * map_w + bomb_pos.x)
         
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        for dx, dy in directions:
+        for dx, dy in _DIRECTIONS:
             for dist in range(1, bomb_range + 1):
                 x = bomb_pos.x + dx * dist
                 y = bomb_pos.y + dy * dist
                 
-                if (x < 0 or x >= state.map_size[0] or
-                    y < 0 or y >= state.map_size[1]):
+                if x < 0 or x >= map_w or y < 0 or y >= map_h:
                     break
                 
-                blast_cells.add((x, y))
+                blast_cells.add(y * map_w + x)
         
-        # BFS from start_pos to find safe cell outside blast
-        from collections import deque
-        queue = deque([(start_pos, 0)])
-        visited = {start_pos.to_tuple()}
+        # Level-by-level BFS from start_pos over flat indices (same visiting order as a
+        # FIFO queue); only tiles closer than max_steps are checked for safety
+        start_idx = start_pos.y * map_w + start_pos.x
+        frontier = [start_idx]
+        visited = {start_idx}
         
-        while queue:
-            current, steps = queue.popleft()
-            
-            if steps >= max_steps:
-                continue
-            
-            # Check if safe (not in blast, not in danger)
-            if current.to_tuple() not in blast_cells:
-                if self.is_safe(current):
-                    return current
-            
-            # Explore neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                neighbor = Position(current.x + dx, current.y + dy)
-                neighbor_tuple = neighbor.to_tuple()
-                
-                if (neighbor.x < 0 or neighbor.x >= state.map_size[0] or
-                    neighbor.y < 0 or neighbor.y >= state.map_size[1]):
-                    continue
+        for _ in range(max_steps):
+            next_frontier = []
+            for idx in frontier:
+                x, y = idx % map_w, idx // map_w
                 
-                if neighbor_tuple in visited:
-                    continue
+                # Check if safe (not in blast, not in danger)
+                if idx not in blast_cells:
+                    current = Position(x, y)
+                    if self.is_safe(current):
+                        return current
                 
-                visited.add(neighbor_tuple)
-                queue.append((neighbor, steps + 1))
+                # Explore neighbors: down, up, right, left
+                for n, ok in ((idx + map_w, y + 1 < map_h), (idx - map_w, y > 0),
+                              (idx + 1, x + 1 < map_w), (idx - 1, x > 0)):
+                    if ok and n not in visited:
+                        visited.add(n)
+                        next_frontier.append(n)
+            frontier = next_frontier
         
         return None
-
@@ -7,19 +7,21 @@ Schemas extracted from OpenAPI spec:
 - command.Booster: POST /api/booster request
 - view.AvailableBoosterResponse: GET /api/booster response
 """
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple, Dict, Any
 from pydantic import BaseModel, Field
 
 
-@dataclass
-class Position:
-    """2D position on map"""
+class Position(NamedTuple):
+    """
+    2D position on map. A NamedTuple: immutable, slot-free, hashes and compares as
+    the (x, y) tuple it is, so to_tuple() allocates nothing.
+    """
     x: int
     y: int
     
     def to_tuple(self) -> Tuple[int, int]:
-        return (self.x, self.y)
+        return self
     
     @classmethod
     def from_list(cls, data: List[int]) -> 'Position':
@@ -36,6 +38,29 @@ class Position:
         return abs(self.x - other.x) + abs(self.y - other.y)
 
 
+# Last parsed walls/obstacles: kind -> (raw [[x, y], ...] list, Positions, (x, y) set).
+# GET /api/arena resends the full geometry every tick although it rarely changes.
+_geometry_pool: Dict[str, Tuple[List[Any], List[Position], FrozenSet[Tuple[int, int]]]] = {}
+
+
+def _pooled_positions(kind: str, raw: List[Any]) -> List[Position]:
+    """Positions for raw walls/obstacles, the pooled list itself if the raw list is unchanged"""
+    pooled = _geometry_pool.get(kind)
+    if pooled is not None and pooled[0] == raw:
+        return pooled[1]
+    positions = [Position.from_list(p) for p in raw]
+    _geometry_pool[kind] = (raw, positions, frozenset(positions))
+    return positions
+
+
+def _position_set(positions: List[Position]) -> FrozenSet[Tuple[int, int]]:
+    """(x, y) set of a position list; pooled lists get their already-built set"""
+    for _, pooled_positions, pooled_set in _geometry_pool.values():
+        if pooled_positions is positions:
+            return pooled_set
+    return frozenset(positions)
+
+
 @dataclass
 class Bomb:
     """Active bomb on arena"""
@@ -79,13 +104,23 @@ class ArenaState:
     bombers: List[Bomber]
     enemies: List[EnemyBomber]
     mobs: List[Mob]
-    obstacles: List[Position]  # Destructible obstacles
-    walls: List[Position]  # Indestructible walls
+    # Destructible obstacles / indestructible walls: pooled lists shared across ticks
+    # while unchanged (see _pooled_positions), so treat them as read-only
+    obstacles: List[Position]
+    walls: List[Position]
     bombs: List[Bomb]
     map_size: Tuple[int, int]  # (width, height)
     round_name: str
     raw_score: int
     player_name: str
+    # (x, y) membership sets built once at parse time, so tile checks in the world
+    # model, danger map and planner are O(1) probes instead of list scans
+    obstacle_set: FrozenSet[Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    wall_set: FrozenSet[Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.obstacle_set = _position_set(self.obstacles)  # Positions are (x, y) tuples
+        self.wall_set = _position_set(self.walls)
 
 
 class BoosterResponse(BaseModel):
@@ -157,8 +192,8 @@ def parse_arena_response(data: Dict[str, Any]) -> ArenaState:
     ]
     
     arena = data.get("arena", {})
-    obstacles = [Position.from_list(obs) for obs in arena.get("obstacles", [])]
-    walls = [Position.from_list(w) for w in arena.get("walls", [])]
+    obstacles = _pooled_positions("obstacles", arena.get("obstacles", []))
+    walls = _pooled_positions("walls", arena.get("walls", []))
     
     bombs = [
         Bomb(
@@ -8,15 +8,17 @@ Handles:
 - Max path length (30 from spec)
 """
 from typing import List, Optional, Set, Tuple
-from collections import deque
 import logging
 
 from bot.models import Position, ArenaState, Bomb, Mob
-from bot.world_model import WorldModel
+from bot.world_model import TileType, WorldModel
 from bot.config import MAX_PATH_LENGTH, MOB_SLEEP_TIME_MS
 
 logger = logging.getLogger(__name__)
 
+# Neighbor expansion order: down, up, right, left
+_NEIGHBORS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
 
 def bfs_path(
     start: Position,
@@ -47,58 +49,62 @@ def bfs_path(
     if start.x == goal.x and start.y == goal.y:
         return [start]
     
-    queue = deque([(start, [start])])
-    visited: Set[Tuple[int, int]] = {start.to_tuple()}
+    map_w, map_h = state.map_size
+    tiles = world.tiles
+    goal_xy = (goal.x, goal.y)
     
-    while queue:
-        current, path = queue.popleft()
-        
-        # Check path length limit
-        if len(path) > max_length:
-            continue
-        
-        # Check if reached goal
-        if current.x == goal.x and current.y == goal.y:
-            return path
-        
-        # Explore neighbors
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = Position(current.x + dx, current.y + dy)
-            neighbor_tuple = neighbor.to_tuple()
-            
-            # Bounds check
-            if (neighbor.x < 0 or neighbor.x >= state.map_size[0] or
-                neighbor.y < 0 or neighbor.y >= state.map_size[1]):
-                continue
-            
-            # Skip if already visited
-            if neighbor_tuple in visited:
-                continue
-            
-            # Check if blocked
-            if world.is_wall(neighbor) and not can_pass_walls:
-                continue
-            
-            if world.is_obstacle(neighbor) and not can_pass_obstacles:
-                # Can pass if it's the goal and we're bombing it
-                if neighbor.x != goal.x or neighbor.y != goal.y:
+    # Bomb / awake-mob tiles built once instead of scanning the lists per neighbor
+    bomb_xy = set() if can_pass_bombs else {b.pos.to_tuple() for b in state.bombs}
+    mob_xy = {m.pos.to_tuple() for m in state.mobs if m.safe_time <= 0}
+    
+    # Level-by-level BFS with parent links (same visiting order as a FIFO queue);
+    # the path is rebuilt once at the goal instead of copied on every push.
+    # Paths include start, so at most max_length - 1 steps.
+    start_xy = (start.x, start.y)
+    parent = {start_xy: start_xy}
+    frontier = [start_xy]
+    
+    for _ in range(max_length - 1):
+        next_frontier = []
+        for cx, cy in frontier:
+            for dx, dy in _NEIGHBORS:
+                nx, ny = cx + dx, cy + dy
+                
+                # Bounds check
+                if nx < 0 or nx >= map_w or ny < 0 or ny >= map_h:
                     continue
-            
-            # Check for bombs
-            if not can_pass_bombs:
-                if any(b.pos.x == neighbor.x and b.pos.y == neighbor.y for b in state.bombs):
+                
+                # Skip if already visited
+                neighbor = (nx, ny)
+                if neighbor in parent:
                     continue
-            
-            # Check for awake mobs (contact kills)
-            for mob in state.mobs:
-                if mob.safe_time <= 0:  # Awake
-                    if mob.pos.x == neighbor.x and mob.pos.y == neighbor.y:
-                        # Skip if mob is at neighbor (contact kill)
-                        break
-            else:
-                # No mob blocking, add to queue
-                visited.add(neighbor_tuple)
-                queue.append((neighbor, path + [neighbor]))
+                
+                # Check if blocked
+                tile = tiles.get(neighbor)
+                if tile is not None:
+                    if tile.tile_type == TileType.WALL and not can_pass_walls:
+                        continue
+                    # Can pass an obstacle if it's the goal and we're bombing it
+                    if (tile.tile_type == TileType.OBSTACLE and not can_pass_obstacles
+                            and neighbor != goal_xy):
+                        continue
+                
+                # Bombs, and awake mobs (contact kills)
+                if neighbor in bomb_xy or neighbor in mob_xy:
+                    continue
+                
+                parent[neighbor] = (cx, cy)
+                if neighbor == goal_xy:
+                    path = [goal]
+                    while neighbor != start_xy:
+                        neighbor = parent[neighbor]
+                        path.append(Position(*neighbor))
+                    path.reverse()
+                    return path
+                next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        frontier = next_frontier
     
     return None
 
@@ -21,6 +21,9 @@ class RateLimiter:
     Handles 429 responses with exponential backoff and Retry-After header.
     """
     
+    # Backoff multipliers by consecutive 429 count (2^0 .. 2^5), indexed instead of pow()
+    _BACKOFF_STEPS = tuple(1 << i for i in range(6))
+    
     def __init__(self, rate: float = 3.0, capacity: float = 3.0):
         """
         Args:
@@ -46,9 +49,9 @@ class RateLimiter:
             if now < self.backoff_until:
                 return False
             
-            # Refill tokens
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            # Refill tokens (a full bucket only needs its timestamp moved)
+            if self.tokens < self.capacity:
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
             self.last_update = now
             
             # Check if can acquire
@@ -66,6 +69,10 @@ class RateLimiter:
             if now < self.backoff_until:
                 return self.backoff_until - now
             
+            # Enough tokens already: refill is lazy, so it can wait for the next acquire
+            if self.tokens >= 1.0:
+                return 0.0
+            
             # Refill tokens
             elapsed = now - self.last_update
             self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
@@ -99,7 +106,7 @@ class RateLimiter:
                 logger.warning(f"Rate limited (429), Retry-After={retry_after:.1f}s")
             else:
                 # Exponential backoff with jitter
-                wait_time = base_backoff * (2 ** min(self.consecutive_429s - 1, 5))
+                wait_time = base_backoff * self._BACKOFF_STEPS[min(self.consecutive_429s - 1, 5)]
                 jitter = random.uniform(0, wait_time * 0.1)
                 wait_time += jitter
                 logger.warning(
@@ -69,6 +69,10 @@ class Planner:
         self.beta = 10.0  # Risk penalty
         self.gamma = 5.0  # Interference penalty
         self.delta = 20.0  # Info gain bonus (for scouts)
+        
+        # Bomb tile evaluations for the state being planned (see _evaluate_bomb_tile)
+        self._bomb_eval_state: Optional[ArenaState] = None
+        self._bomb_eval_cache: Dict[Tuple[int, int], Optional[Tuple[Position, Optional[Position], int, float]]] = {}
     
     def assign_roles(self, bombers: List[Bomber]):
         """Assign roles to bombers (persistent assignment)"""
@@ -257,9 +261,28 @@ class Planner:
         """
         Evaluate bomb placement at obstacle position.
         
+        The result depends only on the tile, the state and the danger map built from
+        it, so it is memoized per state: every bomber planning this tick shares the
+        cross scan and retreat search instead of repeating them.
+        
         Returns:
             (bomb_pos, retreat_pos, k, expected_points) or None
         """
+        if self._bomb_eval_state is not state:
+            self._bomb_eval_state = state
+            self._bomb_eval_cache = {}
+        key = obstacle_pos.to_tuple()
+        if key not in self._bomb_eval_cache:
+            self._bomb_eval_cache[key] = self._search_bomb_tile(obstacle_pos, state, danger)
+        return self._bomb_eval_cache[key]
+    
+    def _search_bomb_tile(
+        self,
+        obstacle_pos: Position,
+        state: ArenaState,
+        danger: DangerMap
+    ) -> Optional[Tuple[Position, Optional[Position], int, float]]:
+        """Uncached bomb placement evaluation behind _evaluate_bomb_tile()"""
         # Count obstacles in cross pattern
         bomb_range = 1  # Default, should get from bomber stats
         k = 0
@@ -275,7 +298,7 @@ class Planner:
                     break
                 
                 # Check if obstacle in this direction
-                if any(o.x == x and o.y == y for o in state.obstacles):
+                if (x, y) in state.obstacle_set:
                     k += 1
                     break  # Ray stops at first obstacle
         
@@ -122,9 +122,9 @@ class WorldModel:
                 
                 # Determine tile type
                 tile_type = TileType.EMPTY
-                if any(w.x == x and w.y == y for w in state.walls):
+                if pos_tuple in state.wall_set:
                     tile_type = TileType.WALL
-                elif any(o.x == x and o.y == y for o in state.obstacles):
+                elif pos_tuple in state.obstacle_set:
                     tile_type = TileType.OBSTACLE
                 
                 # Update tile info
@@ -1,6 +1,7 @@
 """
 Bomber decision-making logic
 """
+from collections import deque
 from typing import List, Tuple, Optional, Dict
 from core.state import Bomber, GameState
 from utils.time import get_current_time
@@ -36,6 +37,17 @@ def get_neighbors(pos: Tuple[int, int], map_size: Tuple[int, int]) -> List[Tuple
     return neighbors
 
 
+def _rebuild_path(parent: Dict[Tuple[int, int], Tuple[int, int]],
+                  end: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Walk BFS parent pointers back from end; returns the path excluding the start"""
+    path = []
+    while end in parent:
+        path.append(end)
+        end = parent[end]
+    path.reverse()
+    return path
+
+
 def find_safe_path(start: Tuple[int, int], target: Tuple[int, int], 
                    explosions: List[Tuple[int, int]], map_size: Tuple[int, int],
                    max_length: int = 10) -> Optional[List[Tuple[int, int]]]:
@@ -43,19 +55,24 @@ def find_safe_path(start: Tuple[int, int], target: Tuple[int, int],
     if start == target:
         return []
     
-    queue = [(start, [start])]
-    visited = {start}
+    # deque + flat visited mask (y * width + x); parent pointers instead of per-node path copies
+    width = map_size[0]
+    queue = deque([(start, 0)])
+    visited = bytearray(map_size[0] * map_size[1])
+    parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
     
-    while queue and len(queue[0][1]) <= max_length:
-        current, path = queue.pop(0)
+    while queue and queue[0][1] < max_length:
+        current, steps = queue.popleft()
         
         if current == target:
-            return path[1:]  # Exclude start position
+            return _rebuild_path(parent, current)  # Exclude start position
         
         for neighbor in get_neighbors(current, map_size):
-            if neighbor not in visited and is_position_safe(neighbor, explosions, map_size):
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+            idx = neighbor[1] * width + neighbor[0]
+            if not visited[idx] and neighbor != start and is_position_safe(neighbor, explosions, map_size):
+                visited[idx] = 1
+                parent[neighbor] = current
+                queue.append((neighbor, steps + 1))
     
     return None
 
@@ -67,19 +84,24 @@ def find_escape_path(pos: Tuple[int, int], explosions: List[Tuple[int, int]],
         return None  # Already safe
     
     # Try to find a safe position within max_length
-    queue = [(pos, [pos])]
-    visited = {pos}
-    
-    while queue and len(queue[0][1]) <= max_length:
-        current, path = queue.pop(0)
+    # deque + flat visited mask (y * width + x); parent pointers instead of per-node path copies
+    width = map_size[0]
+    queue = deque([(pos, 0)])
+    visited = bytearray(map_size[0] * map_size[1])
+    parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    
+    while queue and queue[0][1] < max_length:
+        current, steps = queue.popleft()
         
         if is_position_safe(current, explosions, map_size):
-            return path[1:]  # Exclude start position
+            return _rebuild_path(parent, current)  # Exclude start position
         
         for neighbor in get_neighbors(current, map_size):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+            idx = neighbor[1] * width + neighbor[0]
+            if not visited[idx] and neighbor != pos:
+                visited[idx] = 1
+                parent[neighbor] = current
+                queue.append((neighbor, steps + 1))
     
     return None
 
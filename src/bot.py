@@ -39,6 +39,12 @@ class Bot:
         self.cached_state: Optional[ArenaState] = None
         self.cached_tick = -1
         self.arena_version = 0  # Track arena changes
+        self.round_name: Optional[str] = None  # World memory and planner state belong to this round
+        # Set when an arena fetch fails; the next _rl_ttl ticks return at entry
+        # without fetching or planning (tick_count is not advanced)
+        self.rate_limited = False
+        self._rl_ttl = 1
+        self._rl_skip = 0
     
     def run(self):
         """Main loop"""
@@ -69,6 +75,9 @@ class Bot:
     
     def tick(self):
         """Execute one tick"""
+        if self._rl_skip:
+            self._rl_skip -= 1
+            return
         self.tick_count += 1
         
         # Fetch arena state (only once per tick, use cache if available)
@@ -87,6 +96,8 @@ class Bot:
             if not arena_data:
                 # Check if it was a 429 - handle via rate limiter
                 logger.warning(f"⚠️  Failed to fetch arena state for tick {self.tick_count} (may be rate limited)")
+                self.rate_limited = True
+                self._rl_skip = self._rl_ttl
                 return
             
             try:
@@ -94,12 +105,21 @@ class Bot:
                 self.cached_state = state
                 self.cached_tick = self.tick_count
                 self.arena_version += 1
+                self.rate_limited = False
                 self.rate_limiter.reset_429()  # Reset on successful fetch
                 logger.debug(f"✅ Fetched arena state for tick {self.tick_count} (version={self.arena_version})")
             except Exception as e:
                 logger.error(f"❌ Failed to parse arena response: {e}")
                 return
         
+        # New round, new map: drop the previous round's memory but keep the instances
+        if state.round_name != self.round_name:
+            if self.round_name is not None:
+                logger.info(f"🔁 Round changed {self.round_name} → {state.round_name}, resetting world memory and planner")
+                self.world.reset()
+                self.planner.reset_round()
+            self.round_name = state.round_name
+        
         # Reset SOFT reservations for new tick (HARD reservations persist with TTL)
         self.planner.reset_soft_reservations()
         
@@ -115,6 +135,7 @@ class Bot:
         # Log round and score info (every 10 ticks or at start)
         if self.tick_count % 10 == 1 or self.tick_count == 1:
             self._log_round_status(state)
+            self.planner.log_strategy_stats()
         
         # Process boosters
         self._process_boosters(state.raw_score)
@@ -122,7 +143,7 @@ class Bot:
         # Plan moves for ready bombers only (skip MOVING units to avoid API spam)
         # Each agent plans ONCE per tick using the same arena snapshot
         bomber_commands = []
-        ready_count = 0
+        ready_bombers = []
         skipped_moving = 0
         planned_agents = set()  # Track which agents have planned
         
@@ -141,9 +162,16 @@ class Bot:
                 logger.debug(f"⏸️  {bomber.id[:8]}: Already planned this tick, skipping")
                 continue
             
-            ready_count += 1
-            path, bomb_pos = self.planner.plan_move(bomber, state, self.world, self.tick_count)
             planned_agents.add(bomber.id)
+            ready_bombers.append(bomber)
+        
+        # One batch against the shared tick snapshot; earlier bombers' reservations
+        # constrain later ones
+        ready_count = len(ready_bombers)
+        plans = self.planner.plan_all(ready_bombers, state, self.world, self.tick_count)
+        
+        for bomber in ready_bombers:
+            path, bomb_pos = plans[bomber.id]
             
             # path=None means no action, path=[] means already at target, path=[...] means move
             if path is not None:
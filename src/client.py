@@ -4,13 +4,34 @@ HTTP client with rate limiting and retry logic
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 from collections import deque
 import logging
 
+try:
+    import orjson  # Optional: faster arena decode and move encode
+except ImportError:
+    orjson = None
+
+from src.rate_limiter import parse_retry_after
+
 logger = logging.getLogger(__name__)
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Response body as JSON. Uses orjson when installed; decode errors are raised as
+    requests' JSONDecodeError either way, so _request() retries them as before.
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
 class TokenBucket:
     """Token bucket rate limiter"""
     
@@ -23,14 +44,16 @@ class TokenBucket:
         self.rate = rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_update = time.time()
+        self.last_update = time.monotonic()  # Monotonic: wall-clock jumps can't skew refill
+    
+    def _refill(self, now: float):
+        """Add tokens earned since last_update (credit accumulates while idle, up to capacity)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+        self.last_update = now
     
     def acquire(self, tokens: float = 1.0) -> bool:
         """Try to acquire tokens, returns True if successful"""
-        now = time.time()
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-        self.last_update = now
+        self._refill(time.monotonic())
         
         if self.tokens >= tokens:
             self.tokens -= tokens
@@ -39,15 +62,28 @@ class TokenBucket:
     
     def wait_time(self, tokens: float = 1.0) -> float:
         """Calculate wait time needed for tokens"""
-        now = time.time()
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-        self.last_update = now
+        self._refill(time.monotonic())
         
         if self.tokens >= tokens:
             return 0.0
         return (tokens - self.tokens) / self.rate
     
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens now and return how long to sleep before using them (0.0 if the
+        bucket had them). The shortfall is paid off by that sleep, so the caller
+        never has to re-acquire afterwards.
+        """
+        self._refill(time.monotonic())
+        
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        wait = (tokens - self.tokens) / self.rate
+        self.tokens = 0.0
+        self.last_update += wait  # Tokens earned during the sleep are already spent
+        return wait
+    
     def reset_429(self):
         """Reset after successful request - restore normal rate"""
         pass  # Token bucket auto-recovers, no action needed
@@ -66,6 +102,11 @@ class APIClient:
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        # One keep-alive pool for the single arena host; retries stay in _request() so
+        # 429/Retry-After handling sees every response. urllib3 already sets TCP_NODELAY.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         # Don't set Content-Type manually - requests.post(json=...) will set it correctly
         
         # Support both Authorization: Bearer (default) and X-Auth-Token
@@ -81,12 +122,10 @@ class APIClient:
         self.base_backoff = 0.5
     
     def _wait_for_rate_limit(self):
-        """Wait if rate limit would be exceeded"""
-        if not self.rate_limiter.acquire():
-            wait_time = self.rate_limiter.wait_time()
-            if wait_time > 0:
-                time.sleep(wait_time)
-                self.rate_limiter.acquire()
+        """Wait if rate limit would be exceeded (only when the bucket is short of a token)"""
+        wait_time = self.rate_limiter.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
     
     def _request(self, method: str, endpoint: str, json_data: Optional[Dict] = None,
                 rate_limiter=None) -> Optional[Dict[str, Any]]:
@@ -113,8 +152,9 @@ class APIClient:
                 else:
                     self._wait_for_rate_limit()
                 
-                # Debug logging for POST requests (especially booster)
-                if method == "POST" and json_data is not None:
+                # Debug logging for POST requests (especially booster); the preview is
+                # only serialized when DEBUG is on
+                if method == "POST" and json_data is not None and logger.isEnabledFor(logging.DEBUG):
                     body_preview = json.dumps(json_data)[:200]
                     logger.debug(
                         f"POST {url}\n"
@@ -130,13 +170,18 @@ class APIClient:
                     if json_data is not None and not isinstance(json_data, dict):
                         logger.error(f"json_data must be dict, got {type(json_data)}")
                         return None
-                    # Use json= parameter (requests will serialize and set Content-Type)
-                    response = self.session.post(url, json=json_data, timeout=10)
+                    if orjson is not None and json_data is not None:
+                        # Pre-serialized body; json= would run stdlib json inside requests
+                        response = self.session.post(url, data=orjson.dumps(json_data), timeout=10,
+                                                     headers={"Content-Type": "application/json"})
+                    else:
+                        # Use json= parameter (requests will serialize and set Content-Type)
+                        response = self.session.post(url, json=json_data, timeout=10)
                 else:
                     raise ValueError(f"Unsupported method: {method}")
                 
                 # Debug response
-                if method == "POST":
+                if method == "POST" and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         f"Response: {response.status_code}\n"
                         f"  Body: {response.text[:200]}"
@@ -145,15 +190,10 @@ class APIClient:
                 if response.status_code == 200:
                     if limiter:
                         limiter.reset_429()
-                    return response.json()
+                    return _decode_json(response)
                 elif response.status_code == 429:
                     # Rate limited - check Retry-After header
-                    retry_after = None
-                    if "Retry-After" in response.headers:
-                        try:
-                            retry_after = float(response.headers["Retry-After"])
-                        except ValueError:
-                            pass
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
                     
                     # Handle via rate limiter if provided
                     if limiter:
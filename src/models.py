@@ -1,23 +1,49 @@
 """
 Data models for API responses and game state
 """
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple, Dict, Any
 from pydantic import BaseModel, Field
 
 
-@dataclass
-class Position:
-    """2D position"""
+class Position(NamedTuple):
+    """
+    2D position. A NamedTuple, so it hashes and compares like the (x, y) tuple it
+    is: usable directly as a dict/set key, and to_tuple() is free.
+    """
     x: int
     y: int
     
     def to_tuple(self) -> Tuple[int, int]:
-        return (self.x, self.y)
+        return self
     
     @classmethod
     def from_list(cls, data: List[int]) -> 'Position':
-        return cls(x=data[0], y=data[1])
+        return cls(data[0], data[1])
+
+
+# Walls never change within a round and obstacles only when one is destroyed, so the
+# last raw list of each kind is kept with its parsed Positions and set; an equal list
+# on the next tick reuses them instead of allocating thousands of Positions again
+_geometry_pool: Dict[str, Tuple[List[Any], List[Position], FrozenSet[Tuple[int, int]]]] = {}
+
+
+def _pooled_positions(kind: str, raw: List[Any]) -> List[Position]:
+    """Parsed Positions for a raw [[x, y], ...] list, shared while it stays unchanged"""
+    pooled = _geometry_pool.get(kind)
+    if pooled is not None and pooled[0] == raw:
+        return pooled[1]
+    positions = [Position.from_list(p) for p in raw]
+    _geometry_pool[kind] = (raw, positions, frozenset(positions))
+    return positions
+
+
+def _position_set(positions: List[Position]) -> FrozenSet[Tuple[int, int]]:
+    """Membership set for a position list, reusing the pooled one for pooled lists"""
+    for _, pooled_positions, pooled_set in _geometry_pool.values():
+        if pooled_positions is positions:
+            return pooled_set
+    return frozenset(positions)
 
 
 @dataclass
@@ -63,13 +89,24 @@ class ArenaState:
     bombers: List[Bomber]
     enemies: List[EnemyBomber]
     mobs: List[Mob]
-    obstacles: List[Position]  # Destructible obstacles
-    walls: List[Position]  # Indestructible walls
+    # Destructible obstacles / indestructible walls. parse_arena_response() hands out the
+    # same pooled lists tick after tick while they are unchanged: never mutate them, or
+    # the pooled obstacle_set/wall_set silently go stale
+    obstacles: List[Position]
+    walls: List[Position]
     bombs: List[Bomb]
     map_size: Tuple[int, int]
     round_name: str
     raw_score: int
     player_name: str
+    # (x, y) membership sets built once at parse time and shared by world memory and
+    # the planner (Positions hash as plain tuples)
+    obstacle_set: FrozenSet[Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    wall_set: FrozenSet[Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.obstacle_set = _position_set(self.obstacles)
+        self.wall_set = _position_set(self.walls)
 
 
 class BoosterResponse(BaseModel):
@@ -121,8 +158,8 @@ def parse_arena_response(data: Dict[str, Any]) -> ArenaState:
     ]
     
     arena = data.get("arena", {})
-    obstacles = [Position.from_list(obs) for obs in arena.get("obstacles", [])]
-    walls = [Position.from_list(w) for w in arena.get("walls", [])]
+    obstacles = _pooled_positions("obstacles", arena.get("obstacles", []))
+    walls = _pooled_positions("walls", arena.get("walls", []))
     
     bombs = [
         Bomb(
@@ -1,11 +1,15 @@
 """
 Tactical planning: role assignment, target selection, pathing
 """
-from typing import List, Optional, Tuple, Dict, Set
-from collections import deque
+from typing import Callable, Deque, FrozenSet, List, Optional, Tuple, Dict, Set
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from dataclasses import dataclass
 from enum import Enum
+import bisect
+import heapq
 import logging
+import time
 
 from src.models import Bomber, ArenaState, Position, Bomb
 from src.world import WorldMemory
@@ -30,19 +34,98 @@ class BombTarget:
     escape_pos: Optional[Position] = None
 
 
+@dataclass
+class _PlanContext:
+    """Per-call state shared by the plan_move strategies"""
+    tag: str  # "<id[:8]> [<role>]" log prefix
+    bid8: str
+    id_hash: int
+    current_tick: int
+    alive_count: int
+    stuck_count: int  # no_target_count, refreshed after find_best_target
+    is_stuck: bool = False
+    explore: bool = False  # No bomb target this tick: exploration/stuck fallbacks may run
+
+
+# Direction tables (module-level so hot loops don't rebuild list literals)
+_DIRS4 = ((0, -1), (0, 1), (-1, 0), (1, 0))  # up, down, left, right
+_DIR_NAMES = ("UP", "DOWN", "LEFT", "RIGHT")  # parallel to _DIRS4
+_NEIGHBORS4 = ((0, 1), (0, -1), (1, 0), (-1, 0))  # BFS expansion order
+_ESCAPE_CANDIDATES = (
+    # Diagonals (safe from cross pattern)
+    (1, 1), (-1, 1), (1, -1), (-1, -1),
+    # Distance 2 on cardinals (outside range=1 blast)
+    (0, 2), (0, -2), (2, 0), (-2, 0),
+    # L-shapes
+    (1, 2), (-1, 2), (1, -2), (-1, -2),
+    (2, 1), (-2, 1), (2, -1), (-2, -1),
+)
+
+# Spacing penalty by Manhattan distance (index = dist, only dist < _SPACING_RADIUS penalized)
+_SPACING_RADIUS = 4
+_SPACING_PENALTY = 6.0  # stronger spacing penalty
+_ALLY_SPACING_TABLE = tuple(
+    # harsh penalty when clustered (dist <= 2)
+    _SPACING_PENALTY * (_SPACING_RADIUS - d + (1 if d <= 2 else 0)) for d in range(_SPACING_RADIUS)
+)
+_RESERVATION_SPACING_TABLE = tuple(_SPACING_PENALTY * (_SPACING_RADIUS - d) for d in range(_SPACING_RADIUS))
+
+_DISC_OFFSETS: Dict[int, List[Tuple[int, int]]] = {}
+
+# Bits of the per-tick tile flags grid (see Planner._tile_flags)
+_TILE_BLOCKED = 1   # world memory: known wall/obstacle
+_TILE_OBSTACLE = 2  # obstacle in the current state
+_TILE_BOMB = 4      # bomb in the current state
+_TILE_WALL = 8      # wall in the current state
+
+
+def _rebuild_path(parent: List[int], end: int, map_w: int) -> List[Position]:
+    """
+    Walk flat-index BFS parent pointers back from end (the start tile is its own
+    parent); returns the path excluding the start tile
+    """
+    path: List[Position] = []
+    idx = end
+    while parent[idx] != idx:
+        path.append(Position(idx % map_w, idx // map_w))
+        idx = parent[idx]
+    path.reverse()
+    return path
+
+
+def _recent(history: Deque, n: int) -> list:
+    """Last n entries of a history deque (deques don't support slicing)"""
+    return list(islice(history, max(0, len(history) - n), None))
+
+
+def _manhattan_disc(radius: int) -> List[Tuple[int, int]]:
+    """(dx, dy) offsets with |dx|+|dy| <= radius, sorted by distance (cached per radius)"""
+    offsets = _DISC_OFFSETS.get(radius)
+    if offsets is None:
+        offsets = [
+            (dx, dy)
+            for dx in range(-radius, radius + 1)
+            for dy in range(-radius, radius + 1)
+            if abs(dx) + abs(dy) <= radius
+        ]
+        offsets.sort(key=lambda d: abs(d[0]) + abs(d[1]))
+        _DISC_OFFSETS[radius] = offsets
+    return offsets
+
+
 class Planner:
     """Tactical planner"""
     
     def __init__(self, reservation_manager: Optional[ReservationManager] = None):
         self.roles: Dict[str, BomberRole] = {}
-        self.failed_destinations: Dict[str, List[Tuple[int, int]]] = {}  # bomber_id -> failed dests
+        self._last_roster_sig: Optional[Tuple[str, ...]] = None  # Sorted alive ids at last assignment
+        # bomber_id -> last failed dests (only the newest few are ever consulted)
+        self.failed_destinations: Dict[str, Deque[Tuple[int, int]]] = {}
+        self.failed_destination_memory = 3
         self.destination_cooldown = 20  # Ticks before retrying failed destination
         # Track consecutive "no target found" failures per bomber
         self.no_target_count: Dict[str, int] = {}  # bomber_id -> consecutive failures
         self.stuck_threshold = 5  # N ticks before fallback triggers
-        # Track consecutive "no target found" failures per bomber
-        self.no_target_count: Dict[str, int] = {}  # bomber_id -> consecutive failures
-        self.stuck_threshold = 5  # N ticks before fallback triggers
         # Reservation manager (2-phase system)
         self.reservation_manager = reservation_manager or ReservationManager()
         # Track last step per bomber to avoid reversing
@@ -50,9 +133,10 @@ class Planner:
         # Track planned actions per bomber (to prevent replanning in same tick)
         self.planned_actions: Dict[str, Tuple[Optional[List[Position]], Optional[Position]]] = {}
         # Stuck detection: track progress per bomber
-        self.last_targets: Dict[str, List[Tuple[int, int]]] = {}  # bomber_id -> list of recent targets
-        self.last_positions: Dict[str, List[Tuple[int, int]]] = {}  # bomber_id -> list of recent positions
-        self.last_points: Dict[str, List[int]] = {}  # bomber_id -> list of recent points
+        # Histories are deque(maxlen=stuck_window), so appends trim themselves
+        self.last_targets: Dict[str, Deque[Tuple[int, int]]] = {}  # bomber_id -> recent targets
+        self.last_positions: Dict[str, Deque[Tuple[int, int]]] = {}  # bomber_id -> recent positions
+        self.last_points: Dict[str, Deque[int]] = {}  # bomber_id -> recent points
         self.target_blacklist: Dict[Tuple[int, int], int] = {}  # target -> until_tick (cooldown)
         # Shorter blacklist to avoid over-pruning viable tiles
         self.target_cooldown = 12  # Ticks to blacklist a target
@@ -62,9 +146,65 @@ class Planner:
         # Cells rejected by API as walls/invalid placements (with TTL)
         self.invalid_bomb_cells: Dict[Tuple[int, int], int] = {}
         self.invalid_cell_ttl = 60  # ticks to avoid cells rejected by server
+        # Expiry min-heaps (until_tick, tile) so cleanup only touches expired entries
+        self._blacklist_heap: List[Tuple[int, Tuple[int, int]]] = []
+        self._invalid_heap: List[Tuple[int, Tuple[int, int]]] = []
         # Rejection counters for periodic logging
         self.rejection_stats: Dict[str, int] = {}
-    
+        # Cross-tick caches for pure geometry (k-scan, escape search), keyed by world signature
+        self._target_cache: Dict[Tuple[int, int, Tuple],
+                                 Tuple[int, Tuple[int, Tuple[str, ...], FrozenSet[Tuple[int, int]]]]] = {}
+        self._escape_cache: Dict[Tuple, Tuple[int, Optional[Position]]] = {}
+        self._path_cache: Dict[Tuple, Tuple[int, Optional[List[Position]]]] = {}
+        self.geometry_cache_ttl = 2  # Ticks to keep unused cache entries
+        self.escape_fallback_attempts = 5  # Max path checks in relaxed escape fallback
+        self._world_sig_state: Optional[ArenaState] = None  # Held, compared by identity
+        self._world_sig_tick: Optional[int] = None
+        self._world_sig: Tuple = ()
+        # Per-tick lookup sets (obstacles, walls, bombs, awake mobs, allies), see _lookups()
+        # Keyed on the state object itself (held, so its id() can't be reused) plus tick
+        self._tick_cache: Dict[str, object] = {}
+        self._tick_cache_state: Optional[ArenaState] = None
+        self._tick_cache_tick: Optional[int] = None
+        # Spatial index of obstacles: (x // size, y // size) -> [(state index, obstacle)]
+        self.obstacle_bucket_size = 8
+        # Rebuilt when state.obstacles is a different list (parsing shares unchanged ones)
+        self._obs_buckets: Dict[Tuple[int, int], List[Tuple[int, Position]]] = {}
+        self._obs_buckets_src: Optional[List[Position]] = None
+        # Scratch arrays shared by the flat-index BFS searches, see _bfs_buffers()
+        self._bfs_marks: List[int] = []
+        self._bfs_parent: List[int] = []
+        self._bfs_depth: List[int] = []
+        self._bfs_epoch = 0
+        # bomber_id -> sum of ord() over its first 8 chars (spreads bombers across directions)
+        self._id_hashes: Dict[str, int] = {}
+        # plan_move strategies per role, tried in priority order until one yields an action
+        farmer_strategies = (
+            self._strat_immediate_bomb,
+            self._strat_target,
+            self._strat_cluster,
+            self._strat_bombable,
+            self._strat_frontier,
+            self._strat_open_space,
+            self._strat_center_escape,
+            self._strat_desperate_escape,
+            self._strat_stuck_safe_step,
+            self._strat_final_safe_step,
+        )
+        # strategy name -> [calls, hits, seconds], collected only while DEBUG logging is on
+        self.strategy_stats: Dict[str, List[float]] = {}
+        self._strategies: Dict[BomberRole, Tuple[Callable, ...]] = {
+            BomberRole.ANCHOR: farmer_strategies,
+            BomberRole.FARMER: farmer_strategies,
+            BomberRole.SCOUT: (
+                self._strat_immediate_bomb,
+                self._strat_scout_explore,
+                self._strat_scout_open_space,
+                self._strat_scout_safe_step,
+                self._strat_final_safe_step,
+            ),
+        }
+
     def assign_roles(self, bombers: List[Bomber]):
         """
         Assign roles:
@@ -75,9 +215,11 @@ class Planner:
         if not alive_bombers:
             return
 
-        # Only reassign if headcount changed
-        if len(self.roles) == len(alive_bombers):
+        # Only reassign if the alive roster changed (identities, not just headcount)
+        roster_sig = tuple(sorted(b.id for b in alive_bombers))
+        if roster_sig == self._last_roster_sig:
             return
+        self._last_roster_sig = roster_sig
 
         sorted_bombers = sorted(alive_bombers, key=lambda b: b.id)
         old_roles = self.roles.copy()
@@ -111,43 +253,61 @@ class Planner:
     
     def score_bomb_tile(self, pos: Position, state: ArenaState, 
                        world: WorldMemory, bomber_id: str = "", min_k: int = 2,
-                       require_escape: bool = True, bomber: Optional[Bomber] = None) -> Optional[BombTarget]:
+                       require_escape: bool = True, bomber: Optional[Bomber] = None,
+                       reserved_positions: Optional[List[Tuple[int, int]]] = None,
+                       ally_positions: Optional[List[Tuple[int, int]]] = None) -> Optional[BombTarget]:
         """
         Score a bomb tile by counting obstacle "first hits" in 4 directions.
         Returns k in [0..4] and escape position.
+        
+        reserved_positions / ally_positions may be precomputed once per tick by the
+        caller (see _spacing_inputs); they are derived from state when omitted.
         """
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # up, down, left, right
-        obstacle_hits = 0
         bomb_range = 1  # Default range is 1 (from spec: start radius R=1)
-        hit_directions = []
-        
-        # Count obstacles that would be "first hit" in each direction
-        for dx, dy in directions:
-            hit_obstacle = False
-            for r in range(1, bomb_range + 1):
-                check_pos = Position(pos.x + dx * r, pos.y + dy * r)
-                
-                # Check bounds
-                if (check_pos.x < 0 or check_pos.x >= state.map_size[0] or
-                    check_pos.y < 0 or check_pos.y >= state.map_size[1]):
-                    break
-                
-                # Stop at wall
-                if world.is_blocked(check_pos):
-                    break
-                
-                # Check for obstacle (first hit)
-                if check_pos in state.obstacles:
-                    obstacle_hits += 1
-                    hit_obstacle = True
-                    dir_name = ["UP", "DOWN", "LEFT", "RIGHT"][directions.index((dx, dy))]
-                    hit_directions.append(f"{dir_name}@{r}")
-                    break
-                
-                # Stop at existing bomb
-                if any(b.pos.x == check_pos.x and b.pos.y == check_pos.y for b in state.bombs):
-                    break
-        
+        world_sig = self._get_world_signature(state, world)
+        scan_key = (pos.x, pos.y, world_sig)
+        cached_scan = self._target_cache.get(scan_key)
+        if cached_scan is not None:
+            obstacle_hits, hit_directions, bomb_blast = cached_scan[1]
+            self._target_cache[scan_key] = (world.current_tick, cached_scan[1])
+        else:
+            obstacle_hits = 0
+            hit_directions = []
+            map_w, map_h = state.map_size
+            flags = self._tile_flags(state, world)
+
+            if bomb_range == 1:
+                obstacle_hits, hit_directions = self._scan_range1(pos.x, pos.y, map_w, map_h, flags)
+            else:
+                # Count obstacles that would be "first hit" in each direction
+                for dir_name, (dx, dy) in zip(_DIR_NAMES, _DIRS4):
+                    for r in range(1, bomb_range + 1):
+                        cx, cy = pos.x + dx * r, pos.y + dy * r
+
+                        # Check bounds
+                        if not (0 <= cx < map_w and 0 <= cy < map_h):
+                            break
+
+                        tile = flags[cy * map_w + cx]
+                        # Stop at wall
+                        if tile & _TILE_BLOCKED:
+                            break
+
+                        # Check for obstacle (first hit)
+                        if tile & _TILE_OBSTACLE:
+                            obstacle_hits += 1
+                            hit_directions.append(f"{dir_name}@{r}")
+                            break
+
+                        # Stop at existing bomb
+                        if tile & _TILE_BOMB:
+                            break
+
+            hit_directions = tuple(hit_directions)
+            # Blast cross is shared by the escape search and the stuck-mode fallback below
+            bomb_blast = self._compute_bomb_blast(pos, state, world, bomb_range)
+            self._target_cache[scan_key] = (world.current_tick, (obstacle_hits, hit_directions, bomb_blast))
+
         # Check minimum k requirement (adaptive)
         if obstacle_hits < min_k:
             if bomber_id:
@@ -174,7 +334,8 @@ class Planner:
             escape_pos = self._find_escape_position(
                 pos, state, world, bomb_range, 
                 relaxed=is_stuck, 
-                start_pos=bomber.pos if bomber else bomber_current_pos
+                start_pos=bomber.pos if bomber else bomber_current_pos,
+                blast_positions=bomb_blast
             )
             if not escape_pos:
                 # KAMIKAZE MODE: Even with require_escape=True, allow kamikaze if very stuck
@@ -188,38 +349,24 @@ class Planner:
                     return None  # No safe escape
         else:
             # Very stuck: find any safe tile outside blast zone (blast is cross-shaped!)
-            new_bomb_blast = {pos.to_tuple()}
-            for ddx, ddy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                for r in range(1, bomb_range + 1):
-                    bp = Position(pos.x + ddx * r, pos.y + ddy * r)
-                    if world.is_blocked(bp) or bp in state.obstacles:
-                        break  # Blast stops at obstacles
-                    new_bomb_blast.add(bp.to_tuple())
+            flags = self._tile_flags(state, world)
             
             # Search in order: diagonals first (always safe from cross blast), then distance 2
-            escape_candidates = [
-                # Diagonals (safe from cross pattern)
-                (1, 1), (-1, 1), (1, -1), (-1, -1),
-                # Distance 2 on cardinals (outside range=1 blast)
-                (0, 2), (0, -2), (2, 0), (-2, 0),
-                # L-shapes
-                (1, 2), (-1, 2), (1, -2), (-1, -2),
-                (2, 1), (-2, 1), (2, -1), (-2, -1),
-            ]
-            for dx, dy in escape_candidates:
-                neighbor = Position(pos.x + dx, pos.y + dy)
-                if (neighbor.x < 0 or neighbor.x >= state.map_size[0] or
-                    neighbor.y < 0 or neighbor.y >= state.map_size[1]):
+            map_w, map_h = state.map_size
+            for dx, dy in _ESCAPE_CANDIDATES:
+                cx, cy = pos.x + dx, pos.y + dy
+                if not (0 <= cx < map_w and 0 <= cy < map_h):
                     continue
-                if world.is_blocked(neighbor) or neighbor in state.obstacles:
+                if flags[cy * map_w + cx] & (_TILE_BLOCKED | _TILE_OBSTACLE):
                     continue
                 # CRITICAL: Must be outside blast of NEW bomb
-                if neighbor.to_tuple() in new_bomb_blast:
+                if (cx, cy) in bomb_blast:
                     continue
+                neighbor = Position(cx, cy)
                 # Check safety from current bombs
                 safe = True
                 for bomb in state.bombs:
-                    if bomb.timer <= 1.0 and self._in_bomb_blast(neighbor, bomb, state):
+                    if bomb.timer <= 1.0 and self._in_bomb_blast(neighbor, bomb, state, world):
                         safe = False
                         break
                 if safe:
@@ -239,25 +386,20 @@ class Planner:
                     return None
         
         # Spacing penalties to reduce stacking on same area
-        spacing_radius = 4
-        spacing_penalty = 6.0  # stronger spacing penalty
+        if reserved_positions is None or ally_positions is None:
+            reserved_positions, ally_positions = self._spacing_inputs(state, bomber_id)
+        px, py = pos.x, pos.y
         ally_penalty = 0.0
-        for ally in state.bombers:
-            if ally.id == bomber_id or not ally.alive:
-                continue
-            dist = abs(ally.pos.x - pos.x) + abs(ally.pos.y - pos.y)
-            if dist <= 2:
-                ally_penalty += spacing_penalty * (spacing_radius - dist + 1)  # harsh penalty when clustered
-            elif dist < spacing_radius:
-                ally_penalty += spacing_penalty * (spacing_radius - dist)
+        for ax, ay in ally_positions:
+            dist = abs(ax - px) + abs(ay - py)
+            if dist < _SPACING_RADIUS:
+                ally_penalty += _ALLY_SPACING_TABLE[dist]
         
         reservation_penalty = 0.0
-        if self.reservation_manager:
-            reserved_positions = list(self.reservation_manager.soft_reservations.keys()) + list(self.reservation_manager.hard_reservations.keys())
-            for rx, ry in reserved_positions:
-                dist = abs(rx - pos.x) + abs(ry - pos.y)
-                if dist < spacing_radius:
-                    reservation_penalty += spacing_penalty * (spacing_radius - dist)
+        for rx, ry in reserved_positions:
+            dist = abs(rx - px) + abs(ry - py)
+            if dist < _SPACING_RADIUS:
+                reservation_penalty += _RESERVATION_SPACING_TABLE[dist]
         
         # Calculate score using ACTUAL game point values:
         # k=1: 1pt, k=2: 3pts (1+2), k=3: 6pts (1+2+3), k=4: 10pts (1+2+3+4)
@@ -283,115 +425,299 @@ class Planner:
             escape_pos=escape_pos
         )
     
-    def _find_escape_position(self, bomb_pos: Position, state: ArenaState,
-                              world: WorldMemory, bomb_range: int, 
-                              relaxed: bool = False, start_pos: Optional[Position] = None) -> Optional[Position]:
+    @staticmethod
+    def _scan_range1(px: int, py: int, map_w: int, map_h: int, flags: bytearray) -> Tuple[int, List[str]]:
         """
-        Find safe escape position outside blast lines using BFS.
-        SIMPLIFIED: Just find any tile outside blast zone that's not blocked.
-        NO reservation checks - we just need physical reachability.
+        k-scan specialized for bomb_range=1: the four probes are unrolled and each
+        only bounds-checks the axis it moves along (pos itself is in bounds). A
+        neighbor is a hit if it is a state obstacle not blocked in world memory.
         """
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        blast_positions: Set[Tuple[int, int]] = {bomb_pos.to_tuple()}
-        
-        # Calculate all blast positions from the bomb we're placing
-        for dx, dy in directions:
+        hits: List[str] = []
+        idx = py * map_w + px
+        mask = _TILE_BLOCKED | _TILE_OBSTACLE
+        if py > 0 and (flags[idx - map_w] & mask) == _TILE_OBSTACLE:
+            hits.append("UP@1")
+        if py + 1 < map_h and (flags[idx + map_w] & mask) == _TILE_OBSTACLE:
+            hits.append("DOWN@1")
+        if px > 0 and (flags[idx - 1] & mask) == _TILE_OBSTACLE:
+            hits.append("LEFT@1")
+        if px + 1 < map_w and (flags[idx + 1] & mask) == _TILE_OBSTACLE:
+            hits.append("RIGHT@1")
+        return len(hits), hits
+    
+    def _spacing_inputs(self, state: ArenaState,
+                        bomber_id: str) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Reserved tiles and other alive allies' positions used by spacing penalties"""
+        reserved_positions: List[Tuple[int, int]] = []
+        if self.reservation_manager:
+            reserved_positions = list(self.reservation_manager.reservations.keys())
+        ally_positions = [
+            ally.pos.to_tuple() for ally in state.bombers
+            if ally.alive and ally.id != bomber_id
+        ]
+        return reserved_positions, ally_positions
+
+    def _lookups(self, state: ArenaState, world: WorldMemory) -> Dict[str, object]:
+        """
+        Tile lookup sets built once per (tick, state) so hot loops do O(1) membership
+        checks instead of scanning state lists: obstacles, walls, bombs, mobs_awake
+        (frozensets of (x, y)) and allies_by_pos ((x, y) -> alive Bombers on that tile).
+        """
+        if self._tick_cache_state is not state or self._tick_cache_tick != world.current_tick:
+            self._tick_cache = {
+                'bombs': frozenset((b.pos.x, b.pos.y) for b in state.bombs),
+                'obstacles': state.obstacle_set,  # Shared with WorldMemory.update()
+                'walls': state.wall_set,
+                'mobs_awake': frozenset((m.pos.x, m.pos.y) for m in state.mobs if m.safe_time <= 0),
+                'allies_by_pos': {},
+            }
+            for a in state.bombers:
+                if a.alive:
+                    self._tick_cache['allies_by_pos'].setdefault((a.pos.x, a.pos.y), []).append(a)
+            self._tick_cache_state = state
+            self._tick_cache_tick = world.current_tick
+        return self._tick_cache
+
+    def _blocked_tiles(self, state: ArenaState, world: WorldMemory) -> FrozenSet[Tuple[int, int]]:
+        """
+        Tiles world.is_blocked() reports as blocked (known walls/obstacles), snapshotted
+        with the tick's lookups so hot loops do one set probe instead of a tiles
+        lookup plus attribute checks. World memory only changes in update().
+        """
+        lookups = self._lookups(state, world)
+        blocked = lookups.get('blocked')
+        if blocked is None:
+            blocked = frozenset(t for t, tile in world.tiles.items() if tile.is_wall or tile.is_obstacle)
+            lookups['blocked'] = blocked
+        return blocked
+
+    def _ally_blast_risk(self, state: ArenaState, world: WorldMemory) -> Dict[Tuple[int, int], List[str]]:
+        """
+        Bomb tiles whose range-1 cross reaches an alive ally, mapped to those allies' ids.
+        Built once per tick from the ally positions, so candidate scoring does one dict
+        probe instead of walking the cross for every bomb position.
+        """
+        lookups = self._lookups(state, world)
+        risk = lookups.get('ally_blast_risk')
+        if risk is None:
+            map_w, map_h = state.map_size
+            wall_tuples = lookups['walls']
+            risk = defaultdict(list)
+            for (ax, ay), allies in lookups['allies_by_pos'].items():
+                # An ally standing on a wall/obstacle tile shields itself
+                if world.is_obstacle(Position(ax, ay)) or (ax, ay) in wall_tuples:
+                    continue
+                for dx, dy in _NEIGHBORS4:
+                    cx, cy = ax - dx, ay - dy
+                    if 0 <= cx < map_w and 0 <= cy < map_h:
+                        risk[(cx, cy)].extend(a.id for a in allies)
+            risk = dict(risk)
+            lookups['ally_blast_risk'] = risk
+        return risk
+
+    def _get_world_signature(self, state: ArenaState, world: WorldMemory) -> Tuple:
+        """
+        Everything the k-scan and escape search read (map size and frozensets of blocked
+        tiles, obstacles, bombs, awake mobs), built once per (tick, state) and used as
+        cache key part. The sets themselves, not their hash, so a hash collision can't
+        serve another world's entry; frozensets cache their hash, so probes stay cheap.
+        """
+        if self._world_sig_state is state and self._world_sig_tick == world.current_tick:
+            return self._world_sig
+
+        blocked = self._blocked_tiles(state, world)
+        lookups = self._lookups(state, world)
+        self._world_sig = (
+            state.map_size,
+            blocked,
+            lookups['obstacles'],
+            lookups['bombs'],
+            lookups['mobs_awake'],
+        )
+        self._world_sig_state = state
+        self._world_sig_tick = world.current_tick
+
+        # Drop entries not used in the last geometry_cache_ttl ticks
+        oldest = world.current_tick - self.geometry_cache_ttl
+        for cache in (self._target_cache, self._escape_cache, self._path_cache):
+            stale = [k for k, (tick, _) in cache.items() if tick < oldest]
+            for k in stale:
+                del cache[k]
+        return self._world_sig
+
+    def _obstacles_near(self, state: ArenaState, world: WorldMemory,
+                        x: int, y: int, radius: int) -> List[Position]:
+        """
+        Obstacles within Manhattan radius of (x, y), in state.obstacles order.
+        Only probes the grid buckets overlapping the radius; index rebuilt only when
+        state.obstacles is a different list.
+        """
+        size = self.obstacle_bucket_size
+        if state.obstacles is not self._obs_buckets_src:
+            self._obs_buckets = {}
+            for idx, obs in enumerate(state.obstacles):
+                self._obs_buckets.setdefault((obs.x // size, obs.y // size), []).append((idx, obs))
+            self._obs_buckets_src = state.obstacles
+
+        found: List[Tuple[int, Position]] = []
+        for gx in range((x - radius) // size, (x + radius) // size + 1):
+            for gy in range((y - radius) // size, (y + radius) // size + 1):
+                for idx, obs in self._obs_buckets.get((gx, gy), ()):
+                    if abs(obs.x - x) + abs(obs.y - y) <= radius:
+                        found.append((idx, obs))
+        # Keep original order so tie-breaking between equal scores is unchanged
+        found.sort(key=lambda item: item[0])
+        return [obs for _, obs in found]
+
+    def _count_obstacles_near(self, state: ArenaState, world: WorldMemory,
+                              x: int, y: int, radius: int) -> int:
+        """
+        Number of obstacles within a small Manhattan radius of (x, y). Probes the
+        precomputed disc offsets against the tick's obstacle set instead of scanning
+        every obstacle.
+        """
+        obstacle_tuples = self._lookups(state, world)['obstacles']
+        return sum(1 for dx, dy in _manhattan_disc(radius) if (x + dx, y + dy) in obstacle_tuples)
+
+    def _compute_bomb_blast(self, pos: Position, state: ArenaState, world: WorldMemory,
+                            bomb_range: int) -> FrozenSet[Tuple[int, int]]:
+        """
+        Tiles covered by a bomb at pos: a cross of bomb_range, each ray ending on
+        (and including) the first wall/obstacle.
+        """
+        map_w, map_h = state.map_size
+        flags = self._tile_flags(state, world)
+        bx, by = pos.x, pos.y
+        blast = {(bx, by)}
+        for dx, dy in _DIRS4:
             for r in range(1, bomb_range + 1):
-                check_pos = Position(bomb_pos.x + dx * r, bomb_pos.y + dy * r)
-                if (check_pos.x < 0 or check_pos.x >= state.map_size[0] or
-                    check_pos.y < 0 or check_pos.y >= state.map_size[1]):
+                cx, cy = bx + dx * r, by + dy * r
+                if not (0 <= cx < map_w and 0 <= cy < map_h):
                     break
-                blast_positions.add(check_pos.to_tuple())
+                blast.add((cx, cy))
                 # Stop at first obstacle/wall (they block blast)
-                if world.is_blocked(check_pos) or check_pos in state.obstacles:
+                if flags[cy * map_w + cx] & (_TILE_BLOCKED | _TILE_OBSTACLE):
                     break
+        return frozenset(blast)
+
+    def _find_escape_position(self, bomb_pos: Position, state: ArenaState,
+                              world: WorldMemory, bomb_range: int,
+                              relaxed: bool = False, start_pos: Optional[Position] = None,
+                              blast_positions: Optional[FrozenSet[Tuple[int, int]]] = None) -> Optional[Position]:
+        """
+        Find safe escape position outside blast lines (cached by world signature).
+        blast_positions may be passed in when the caller already computed the bomb's cross.
+        """
+        start_key = start_pos.to_tuple() if start_pos else None
+        key = (bomb_pos.x, bomb_pos.y, start_key, bomb_range, relaxed,
+               self._get_world_signature(state, world))
+        cached = self._escape_cache.get(key)
+        if cached is not None:
+            self._escape_cache[key] = (world.current_tick, cached[1])
+            return cached[1]
+
+        escape_pos = self._search_escape_position(bomb_pos, state, world, bomb_range, relaxed, start_pos,
+                                                  blast_positions)
+        self._escape_cache[key] = (world.current_tick, escape_pos)
+        return escape_pos
+
+    def _search_escape_position(self, bomb_pos: Position, state: ArenaState,
+                                world: WorldMemory, bomb_range: int,
+                                relaxed: bool = False, start_pos: Optional[Position] = None,
+                                blast_positions: Optional[FrozenSet[Tuple[int, int]]] = None) -> Optional[Position]:
+        """
+        Find safe escape position outside blast lines using BFS.
+        SIMPLIFIED: Just find any tile outside blast zone that's not blocked.
+        NO reservation checks - we just need physical reachability.
+        """
+        map_w, map_h = state.map_size
+        bx, by = bomb_pos.x, bomb_pos.y
+        flags = self._tile_flags(state, world)
+        # Calculate all blast positions from the bomb we're placing (unless provided)
+        if blast_positions is None:
+            blast_positions = self._compute_bomb_blast(bomb_pos, state, world, bomb_range)
         
         # GENEROUS max steps: 15 normal, 25 relaxed
-        queue = deque()
-        visited: Set[Tuple[int, int]] = {bomb_pos.to_tuple()}
+        # Level-by-level BFS over flat row-major indices (same visiting order as a FIFO
+        # of (x, y, steps)); visited tiles carry this search's epoch in the shared marks,
+        # and Position is only built for the result
+        size = map_w * map_h
+        last_row = size - map_w
+        marks, _, _, epoch = self._bfs_buffers(size)
+        marks[by * map_w + bx] = epoch
         if start_pos:
-            visited.add(start_pos.to_tuple())
+            marks[start_pos.y * map_w + start_pos.x] = epoch
         max_steps = 25 if relaxed else 15
+        blast_idx = {cy * map_w + cx for cx, cy in blast_positions if 0 <= cx < map_w and 0 <= cy < map_h}
         
         # Get starting point for BFS
         search_start = start_pos if start_pos and start_pos != bomb_pos else bomb_pos
-        
-        # Add initial neighbors - ALLOW blast tiles in queue, just don't return them as escape
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = Position(search_start.x + dx, search_start.y + dy)
-            if (neighbor.x >= 0 and neighbor.x < state.map_size[0] and
-                neighbor.y >= 0 and neighbor.y < state.map_size[1]):
-                neighbor_tuple = neighbor.to_tuple()
-                # Skip blocked tiles (walls/obstacles) - can't walk through
-                if world.is_blocked(neighbor) or neighbor in state.obstacles:
-                    continue
-                # Skip tiles with existing bombs
-                if any(b.pos.x == neighbor.x and b.pos.y == neighbor.y for b in state.bombs):
-                    continue
-                # NO reservation check - just physical reachability
-                # NOTE: We allow blast tiles here - we'll check at return time
-                
-                visited.add(neighbor_tuple)
-                queue.append((neighbor, 0))
-        
-        while queue:
-            current, steps = queue.popleft()
-            
-            if steps >= max_steps:
-                continue
-            
-            current_tuple = current.to_tuple()
-            
-            # Check if this is a valid escape position (outside blast, not blocked, no bomb)
-            in_blast = current_tuple in blast_positions
-            is_blocked = world.is_blocked(current) or current in state.obstacles
-            has_bomb = any(b.pos.x == current.x and b.pos.y == current.y for b in state.bombs)
-            
-            if not in_blast and not is_blocked and not has_bomb:
-                # Found valid escape!
-                return current
-            
-            # Even if this tile is not valid escape, explore its neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                neighbor = Position(current.x + dx, current.y + dy)
-                
-                if (neighbor.x < 0 or neighbor.x >= state.map_size[0] or
-                    neighbor.y < 0 or neighbor.y >= state.map_size[1]):
-                    continue
-                
-                neighbor_tuple = neighbor.to_tuple()
-                if neighbor_tuple in visited:
-                    continue
-                
-                # Only add if potentially passable (not wall/obstacle)
-                if world.is_blocked(neighbor) or neighbor in state.obstacles:
-                    visited.add(neighbor_tuple)
-                    continue
+        sx, sy = search_start.x, search_start.y
+        s_idx = sy * map_w + sx
+        
+        # Add initial neighbors (_NEIGHBORS4 order: down, up, right, left) - ALLOW blast
+        # tiles, just don't return them as escape. Skip walls/obstacles and tiles with
+        # existing bombs; NO reservation check - just physical reachability
+        frontier = []
+        for n_idx, in_bounds in ((s_idx + map_w, s_idx < last_row), (s_idx - map_w, s_idx >= map_w),
+                                 (s_idx + 1, sx + 1 < map_w), (s_idx - 1, sx > 0)):
+            if in_bounds and not flags[n_idx] & (_TILE_BLOCKED | _TILE_OBSTACLE | _TILE_BOMB):
+                marks[n_idx] = epoch
+                frontier.append(n_idx)
+        
+        impassable = _TILE_BLOCKED | _TILE_OBSTACLE
+        for _ in range(max_steps):
+            next_frontier = []
+            for idx in frontier:
+                # Check if this is a valid escape position (outside blast, not blocked, no bomb)
+                if not flags[idx] and idx not in blast_idx:
+                    return Position(idx % map_w, idx // map_w)
                 
-                visited.add(neighbor_tuple)
-                queue.append((neighbor, steps + 1))
+                # Even if this tile is not valid escape, explore its neighbors; a tile is
+                # marked visited even when it is impassable
+                x = idx % map_w
+                n = idx + map_w
+                if idx < last_row and marks[n] != epoch:
+                    marks[n] = epoch
+                    if not flags[n] & impassable:
+                        next_frontier.append(n)
+                n = idx - map_w
+                if idx >= map_w and marks[n] != epoch:
+                    marks[n] = epoch
+                    if not flags[n] & impassable:
+                        next_frontier.append(n)
+                n = idx + 1
+                if x + 1 < map_w and marks[n] != epoch:
+                    marks[n] = epoch
+                    if not flags[n] & impassable:
+                        next_frontier.append(n)
+                n = idx - 1
+                if x > 0 and marks[n] != epoch:
+                    marks[n] = epoch
+                    if not flags[n] & impassable:
+                        next_frontier.append(n)
+            frontier = next_frontier
         
         # FALLBACK: If no escape found in normal BFS, try finding ANY tile outside blast
         # This handles edge cases where paths go through blast zones
         if relaxed:
-            for dx in range(-max_steps, max_steps + 1):
-                for dy in range(-max_steps, max_steps + 1):
-                    if abs(dx) + abs(dy) > max_steps:
-                        continue
-                    check = Position(bomb_pos.x + dx, bomb_pos.y + dy)
-                    if (check.x < 0 or check.x >= state.map_size[0] or
-                        check.y < 0 or check.y >= state.map_size[1]):
-                        continue
-                    check_tuple = check.to_tuple()
-                    if check_tuple in blast_positions:
-                        continue
-                    if world.is_blocked(check) or check in state.obstacles:
-                        continue
-                    # Found a potential escape - verify path exists
-                    start = start_pos if start_pos else bomb_pos
-                    test_path = self.bfs_path(start, check, state, world, max_length=max_steps)
-                    if test_path is not None:
-                        return check
+            start = start_pos if start_pos else bomb_pos
+            attempts = 0
+            # Nearest tiles first; only the closest few survivors get a path check
+            for dx, dy in _manhattan_disc(max_steps):
+                cx, cy = bx + dx, by + dy
+                if not (0 <= cx < map_w and 0 <= cy < map_h):
+                    continue
+                if flags[cy * map_w + cx] & (_TILE_BLOCKED | _TILE_OBSTACLE) or (cx, cy) in blast_positions:
+                    continue
+                check = Position(cx, cy)
+                # Found a potential escape - verify path exists
+                test_path = self.bfs_path(start, check, state, world, max_length=max_steps)
+                if test_path is not None:
+                    return check
+                attempts += 1
+                if attempts >= self.escape_fallback_attempts:
+                    break
         
         return None
     
@@ -399,44 +725,55 @@ class Planner:
         """Check if position is safe from current explosions"""
         for bomb in state.bombs:
             if bomb.timer <= 0.1:  # About to explode
-                # Check if in blast radius
-                if self._in_bomb_blast(pos, bomb, state):
+                # Check if in blast radius (same row/column within range)
+                dx = pos.x - bomb.pos.x
+                dy = pos.y - bomb.pos.y
+                if (dx == 0 or dy == 0) and abs(dx) + abs(dy) <= bomb.range:
                     return False
         return True
     
-    def _in_bomb_blast(self, pos: Position, bomb: Bomb, state: ArenaState) -> bool:
-        """Check if position is in bomb blast radius"""
-        if pos.x == bomb.pos.x and pos.y == bomb.pos.y:
-            return True
-        
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        for dx, dy in directions:
-            if (pos.x - bomb.pos.x) * dx + (pos.y - bomb.pos.y) * dy < 0:
-                continue  # Wrong direction
-            if abs((pos.x - bomb.pos.x) * (1 - abs(dx))) + abs((pos.y - bomb.pos.y) * (1 - abs(dy))) > 0:
-                continue  # Not aligned
-            
-            dist = abs(pos.x - bomb.pos.x) + abs(pos.y - bomb.pos.y)
-            if dist <= bomb.range:
-                return True
-        return False
+    def _in_bomb_blast(self, pos: Position, bomb: Bomb, state: ArenaState,
+                       world: Optional[WorldMemory] = None) -> bool:
+        """
+        Check if position is in bomb blast radius.
+        Blast is a cross: same row or column within range. If world is given,
+        walls/obstacles between bomb and pos stop the ray.
+        """
+        dx = pos.x - bomb.pos.x
+        dy = pos.y - bomb.pos.y
+        if (dx != 0 and dy != 0) or abs(dx) + abs(dy) > bomb.range:
+            return False
+        
+        if world is not None:
+            dist = abs(dx) + abs(dy)
+            step_x = (dx > 0) - (dx < 0)
+            step_y = (dy > 0) - (dy < 0)
+            for r in range(1, dist):
+                if world.is_blocked(Position(bomb.pos.x + step_x * r, bomb.pos.y + step_y * r)):
+                    return False
+        return True
 
     def _is_friendly_fire_risk(self, bomb_pos: Position, bomber_id: str, state: ArenaState, world: WorldMemory) -> bool:
         """
         Check if placing a bomb at bomb_pos would hit a friendly unit or existing bomb.
+        Planned bomb has range 1, so the cross check needs no line-of-sight walk.
         """
-        planned_bomb = Bomb(pos=bomb_pos, range=1, timer=8.0)
+        bx, by = bomb_pos.x, bomb_pos.y
 
         # Friendly units in blast
         for ally in state.bombers:
             if ally.id == bomber_id or not ally.alive:
                 continue
-            if self._in_bomb_blast(ally.pos, planned_bomb, state):
+            dx = ally.pos.x - bx
+            dy = ally.pos.y - by
+            if (dx == 0 or dy == 0) and abs(dx) + abs(dy) <= 1:
                 return True
 
         # Existing bombs that would be triggered
         for b in state.bombs:
-            if self._in_bomb_blast(b.pos, planned_bomb, state):
+            dx = b.pos.x - bx
+            dy = b.pos.y - by
+            if (dx == 0 or dy == 0) and abs(dx) + abs(dy) <= 1:
                 return True
 
         return False
@@ -450,48 +787,56 @@ class Planner:
         current_pos = bomber.pos.to_tuple()
         current_points = state.raw_score
         
-        # Initialize tracking
-        if bomber_id not in self.last_targets:
-            self.last_targets[bomber_id] = []
-        if bomber_id not in self.last_positions:
-            self.last_positions[bomber_id] = []
-        if bomber_id not in self.last_points:
-            self.last_points[bomber_id] = []
+        # Initialize tracking (bounded deques trim themselves on append)
+        targets = self._history(self.last_targets, bomber_id)
+        positions = self._history(self.last_positions, bomber_id)
+        points = self._history(self.last_points, bomber_id)
         
         # Add current state
-        self.last_positions[bomber_id].append(current_pos)
-        self.last_points[bomber_id].append(current_points)
+        positions.append(current_pos)
+        points.append(current_points)
         
-        # Keep only recent history
-        self.last_positions[bomber_id] = self.last_positions[bomber_id][-self.stuck_window:]
-        self.last_points[bomber_id] = self.last_points[bomber_id][-self.stuck_window:]
-        self.last_targets[bomber_id] = self.last_targets[bomber_id][-self.stuck_window:]
-        
-        # Check for stuck conditions
-        if len(self.last_targets[bomber_id]) >= 5:
+        # Check for stuck conditions: last 5 entries all equal to the newest one
+        if len(targets) >= 5:
             # Same target repeated
-            recent_targets = self.last_targets[bomber_id][-5:]
-            if len(set(recent_targets)) == 1:
-                return True, f"same_target={recent_targets[0]}"
+            last = targets[-1]
+            if all(t == last for t in _recent(targets, 5)):
+                return True, f"same_target={last}"
         
-        if len(self.last_positions[bomber_id]) >= 5:
+        if len(positions) >= 5:
             # No movement
-            recent_positions = self.last_positions[bomber_id][-5:]
-            if len(set(recent_positions)) == 1:
-                return True, f"no_movement={recent_positions[0]}"
+            if all(p == current_pos for p in _recent(positions, 5)):
+                return True, f"no_movement={current_pos}"
         
-        if len(self.last_points[bomber_id]) >= 5:
+        if len(points) >= 5:
             # No points growth
-            recent_points = self.last_points[bomber_id][-5:]
-            if len(set(recent_points)) == 1 and recent_points[0] == 0:
-                return True, f"no_points={recent_points[0]}"
+            if current_points == 0 and all(p == 0 for p in _recent(points, 5)):
+                return True, f"no_points={current_points}"
         
         return False, ""
     
+    def _id_hash(self, bomber_id: str) -> int:
+        """Stable per-bomber number used to rotate direction choices (computed once per id)"""
+        id_hash = self._id_hashes.get(bomber_id)
+        if id_hash is None:
+            id_hash = sum(map(ord, bomber_id[:8]))
+            self._id_hashes[bomber_id] = id_hash
+        return id_hash
+    
+    def _failed_dests(self, bomber_id: str) -> Deque[Tuple[int, int]]:
+        """Get (or create) a bomber's bounded failed-destination history"""
+        return self.failed_destinations.setdefault(bomber_id, deque(maxlen=self.failed_destination_memory))
+    
+    def _history(self, store: Dict[str, Deque], bomber_id: str) -> Deque:
+        """Get (or create) a bomber's bounded history deque"""
+        return store.setdefault(bomber_id, deque(maxlen=self.stuck_window))
+    
     def _blacklist_target(self, target_pos: Position, current_tick: int):
         """Add target to blacklist with cooldown"""
         target_tuple = target_pos.to_tuple()
-        self.target_blacklist[target_tuple] = current_tick + self.target_cooldown
+        until_tick = current_tick + self.target_cooldown
+        self.target_blacklist[target_tuple] = until_tick
+        heapq.heappush(self._blacklist_heap, (until_tick, target_tuple))
         logger.warning(f"🚫 Blacklisted target {target_tuple} until tick {self.target_blacklist[target_tuple]}")
     
     def _is_blacklisted(self, target_pos: Position, current_tick: int) -> bool:
@@ -508,24 +853,30 @@ class Planner:
     
     def _cleanup_blacklist(self, current_tick: int):
         """Remove expired blacklist entries"""
-        expired = [t for t, until in self.target_blacklist.items() if current_tick >= until]
-        for target_tuple in expired:
-            del self.target_blacklist[target_tuple]
+        self._pop_expired(self._blacklist_heap, self.target_blacklist, current_tick)
 
         # Cleanup invalid bomb cells
-        expired_invalid = [t for t, until in self.invalid_bomb_cells.items() if current_tick >= until]
-        for cell in expired_invalid:
-            del self.invalid_bomb_cells[cell]
+        self._pop_expired(self._invalid_heap, self.invalid_bomb_cells, current_tick)
+
+    @staticmethod
+    def _pop_expired(heap: List[Tuple[int, Tuple[int, int]]], entries: Dict[Tuple[int, int], int],
+                     current_tick: int):
+        """Pop heap entries whose expiry passed; skip stale ones superseded by a newer expiry"""
+        while heap and heap[0][0] <= current_tick:
+            until, tile = heapq.heappop(heap)
+            if entries.get(tile) == until:
+                del entries[tile]
 
     def mark_invalid_bomb_cell(self, pos: Position, current_tick: int):
         """Mark cell as invalid for bomb placement due to server rejection (wall, etc.)."""
-        self.invalid_bomb_cells[pos.to_tuple()] = current_tick + self.invalid_cell_ttl
+        until_tick = current_tick + self.invalid_cell_ttl
+        self.invalid_bomb_cells[pos.to_tuple()] = until_tick
+        heapq.heappush(self._invalid_heap, (until_tick, pos.to_tuple()))
         logger.warning(f"🚫 Marked bomb cell invalid {pos.to_tuple()} until tick {self.invalid_bomb_cells[pos.to_tuple()]}")
 
-    def _is_invalid_bomb_cell(self, pos: Position, current_tick: int) -> bool:
-        """Check invalid bomb cell TTL."""
-        self._cleanup_blacklist(current_tick)
-        until = self.invalid_bomb_cells.get(pos.to_tuple())
+    def _is_invalid_bomb_cell(self, cell: Tuple[int, int], current_tick: int) -> bool:
+        """Check invalid bomb cell TTL (expired entries are swept once per find_best_target)."""
+        until = self.invalid_bomb_cells.get(cell)
         return until is not None and current_tick < until
     
     def find_best_target(self, bomber: Bomber, state: ArenaState,
@@ -555,10 +906,10 @@ class Planner:
         
         # Adaptive threshold based on stuck_count and lack of points
         stuck_count = self.no_target_count.get(bomber.id, 0)
-        points_history = self.last_points.get(bomber.id, [])
-        stagnant_points = len(points_history) >= 3 and len(set(points_history[-3:])) == 1 and points_history[-1] == state.raw_score
+        points_history = self.last_points.get(bomber.id, ())
+        stagnant_points = len(points_history) >= 3 and len(set(_recent(points_history, 3))) == 1 and points_history[-1] == state.raw_score
         # Strong stagnation flag for aggressive tightening
-        hard_stagnant = len(points_history) >= 6 and len(set(points_history[-6:])) == 1 and points_history[-1] == state.raw_score
+        hard_stagnant = len(points_history) >= 6 and len(set(_recent(points_history, 6))) == 1 and points_history[-1] == state.raw_score
 
         if stuck_count > 10:
             # Very stuck: allow k>=0 and relax escape requirements
@@ -585,7 +936,7 @@ class Planner:
             logger.warning(f"⚠️  {bomber.id[:8]} [{role.value}]: STUCK detected: {stuck_reason}")
             # Blacklist recent targets
             if self.last_targets.get(bomber.id):
-                for target_tuple in set(self.last_targets[bomber.id][-3:]):
+                for target_tuple in set(_recent(self.last_targets[bomber.id], 3)):
                     target_pos = Position(target_tuple[0], target_tuple[1])
                     self._blacklist_target(target_pos, current_tick)
         # If surrounded by enemies, avoid bombing unless stuck forces action
@@ -597,7 +948,23 @@ class Planner:
         
         # Collect all candidates with scores (for top-K selection)
         all_candidates: List[Tuple[BombTarget, float]] = []
-        
+
+        # Tick's tile flags for candidate enumeration (built once, probed per obstacle neighbor)
+        map_w, map_h = state.map_size
+        bx, by = bomber.pos.x, bomber.pos.y
+        tile_flags = self._tile_flags(state, world)
+        ally_blast_risk = self._ally_blast_risk(state, world)
+        enemy_tuples = [(e.pos.x, e.pos.y) for e in state.enemies]
+        danger_radius = 2  # Enemies this close to the bomb or escape tile rule it out
+        # Spacing inputs don't change while this bomber is being scored
+        reserved_positions, ally_positions = self._spacing_inputs(state, bomber.id)
+        # Scored tiles are at most path_limit - 1 steps away, so by the triangle inequality
+        # reservations beyond that plus the spacing radius can never add a penalty
+        path_limit = 14
+        spacing_reach = path_limit - 1 + _SPACING_RADIUS - 1
+        reserved_positions = [(rx, ry) for rx, ry in reserved_positions
+                              if abs(rx - bx) + abs(ry - by) <= spacing_reach]
+
         # Try with preferred min_obstacles first, then lower if no results
         for attempt_min in min_obstacles_list:
             logger.debug(f"🔍 {bomber.id[:8]} [{role.value}]: Searching for targets (min_k={attempt_min})")
@@ -606,7 +973,7 @@ class Planner:
             best_score = -1.0
             candidates_checked = 0
             candidates_rejected = 0
-            rejection_reasons: Dict[str, int] = {}
+            rejection_reasons: Counter = Counter()
             
             # Search nearby obstacles and find adjacent empty tiles for bomb placement
             # CRITICAL: Bombs must be placed on EMPTY tiles adjacent to obstacles, NOT on obstacles themselves!
@@ -615,89 +982,77 @@ class Planner:
                 search_radius = 6
             else:
                 search_radius = 6 if (stagnant_points or alive_count <= 1) else 8
-            bomb_candidates: Dict[Tuple[int, int], List[Position]] = {}  # bomb_pos -> list of obstacles it hits
             
             # CRITICAL: Always consider bomber's current position first!
             # The bomber is STANDING on an empty tile, so it's always valid for bombing
             bomber_pos_key = bomber.pos.to_tuple()
-            bomb_candidates: Dict[Tuple[int, int], List[Position]] = {}
+            # bomb_pos -> list of obstacles it hits
+            bomb_candidates: Dict[Tuple[int, int], List[Position]] = defaultdict(list)
             bomb_candidates[bomber_pos_key] = []
             
             # Check what obstacles the bomber's current position can hit
             bomb_range = 1  # Default range is 1 (spec)
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                for r in range(1, bomb_range + 1):
-                    check_pos = Position(bomber.pos.x + dx * r, bomber.pos.y + dy * r)
-                    if (check_pos.x < 0 or check_pos.x >= state.map_size[0] or
-                        check_pos.y < 0 or check_pos.y >= state.map_size[1]):
-                        break
-                    if world.is_blocked(check_pos):
-                        break
-                    if check_pos in state.obstacles:
-                        bomb_candidates[bomber_pos_key].append(check_pos)
-                        break
-            
-            for obstacle in state.obstacles:
-                dist = abs(obstacle.x - bomber.pos.x) + abs(obstacle.y - bomber.pos.y)
-                if dist > search_radius:
-                    continue
-                
+            for dx, dy in _NEIGHBORS4:
+                r = self._first_obstacle_on_ray(state, world, bx, by, dx, dy, bomb_range)
+                if r is not None:
+                    bomb_candidates[bomber_pos_key].append(Position(bx + dx * r, by + dy * r))
+
+            # Only obstacles in grid buckets around the bomber can be within search_radius
+            nearby_obstacles = self._obstacles_near(state, world, bx, by, search_radius)
+
+            for obstacle in nearby_obstacles:
+
                 candidates_checked += 1
                 
                 # Check blacklist (for the obstacle, not bomb pos)
                 if self._is_blacklisted(obstacle, current_tick):
-                    rejection_reasons["blacklisted"] = rejection_reasons.get("blacklisted", 0) + 1
+                    rejection_reasons["blacklisted"] += 1
                     candidates_rejected += 1
                     continue
                 
                 # Check if pending explosion
                 if obstacle.to_tuple() in self.pending_explosions:
-                    rejection_reasons["pending_explosion"] = rejection_reasons.get("pending_explosion", 0) + 1
+                    rejection_reasons["pending_explosion"] += 1
                     candidates_rejected += 1
                     continue
                 
                 # Find adjacent empty tiles where we can place a bomb to hit this obstacle
                 # Bomb explosion is cross pattern, so we need empty tile adjacent to obstacle
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:  # N, E, S, W
+                for dx, dy in _NEIGHBORS4:  # N, E, S, W
                     # Check if obstacle is in this direction from a potential bomb position
                     # We want to place bomb at (obstacle.x - dx*r, obstacle.y - dy*r) where r=1
-                    bomb_pos = Position(obstacle.x - dx, obstacle.y - dy)
-                    
+                    cx, cy = obstacle.x - dx, obstacle.y - dy
+
                     # Bounds check
-                    if (bomb_pos.x < 0 or bomb_pos.x >= state.map_size[0] or
-                        bomb_pos.y < 0 or bomb_pos.y >= state.map_size[1]):
+                    if not (0 <= cx < map_w and 0 <= cy < map_h):
                         continue
-                    
+
+                    bomb_key = (cx, cy)
+
                     # Bomber's current position is ALWAYS valid (they're standing there!)
-                    if bomb_pos.to_tuple() == bomber_pos_key:
+                    if bomb_key == bomber_pos_key:
                         if obstacle not in bomb_candidates[bomber_pos_key]:
                             bomb_candidates[bomber_pos_key].append(obstacle)
                         continue
-                    
+
                     # Bomb must be on a confirmed empty, observed tile (not wall/obstacle/bomb)
-                    tile_info = world.tiles.get(bomb_pos.to_tuple())
+                    tile_info = world.tiles.get(bomb_key)
                     if not tile_info or not tile_info.is_observed:
                         continue  # unknown → treat as blocked for placement (safe)
-                    if tile_info.is_wall or tile_info.is_obstacle:
-                        continue
-                    if bomb_pos in state.walls:
-                        continue
-                    if any(b.pos.x == bomb_pos.x and b.pos.y == bomb_pos.y for b in state.bombs):
+                    # Known wall/obstacle in memory, or a wall/bomb in the state
+                    if tile_flags[cy * map_w + cx] & (_TILE_BLOCKED | _TILE_WALL | _TILE_BOMB):
                         continue
 
                     # Skip cells the server already rejected as walls
-                    if self._is_invalid_bomb_cell(bomb_pos, current_tick):
-                        rejection_reasons["api_invalid"] = rejection_reasons.get("api_invalid", 0) + 1
+                    if self._is_invalid_bomb_cell(bomb_key, current_tick):
+                        rejection_reasons["api_invalid"] += 1
                         continue
-                    
+
                     # Check if reserved
-                    if self.is_reserved(bomb_pos, bomber.id):
+                    if self.is_reserved_xy(cx, cy, bomber.id):
                         continue
-                    
+
                     # Add to candidates: this bomb_pos can hit this obstacle
-                    bomb_key = bomb_pos.to_tuple()
-                    if bomb_key not in bomb_candidates:
-                        bomb_candidates[bomb_key] = []
                     bomb_candidates[bomb_key].append(obstacle)
             
             # Now score each bomb position based on how many obstacles it can hit
@@ -708,105 +1063,98 @@ class Planner:
                 dist_to_bomber = abs(bomb_pos.x - bomber.pos.x) + abs(bomb_pos.y - bomber.pos.y)
                 k1_max_dist = 8 if hard_stagnant else 6  # More lenient when stuck!
                 if attempt_min == 1 and dist_to_bomber > k1_max_dist:
-                    rejection_reasons["too_far_k1"] = rejection_reasons.get("too_far_k1", 0) + 1
+                    rejection_reasons["too_far_k1"] += 1
                     candidates_rejected += 1
                     continue
 
-                # Score this bomb position
-                target = self.score_bomb_tile(bomb_pos, state, world, bomber.id, 
-                                            min_k=attempt_min, require_escape=require_escape, bomber=bomber)
-                if target and target.obstacle_count >= attempt_min:
-                    # Block friendly blast
-                    if self._is_friendly_fire_risk(target.pos, bomber.id, state, world):
-                        rejection_reasons["ally_in_blast"] = rejection_reasons.get("ally_in_blast", 0) + 1
-                        candidates_rejected += 1
-                        continue
+                # Cheap O(1) rejections first; none of them need the k-scan or escape search
+                # Block friendly blast
+                if self._is_friendly_fire_risk(bomb_pos, bomber.id, state, world):
+                    rejection_reasons["ally_in_blast"] += 1
+                    candidates_rejected += 1
+                    continue
 
-                    # Avoid friendly fire: if any ally in blast cross (range=1, walls/obstacles block)
-                    def ally_in_blast(b_pos: Position) -> bool:
-                        dirs = [(0,1),(0,-1),(1,0),(-1,0)]
-                        for dx,dy in dirs:
-                            for r in range(1, 1+1):  # range=1
-                                cx, cy = b_pos.x + dx*r, b_pos.y + dy*r
-                                if cx < 0 or cx >= state.map_size[0] or cy < 0 or cy >= state.map_size[1]:
-                                    break
-                                cpos = Position(cx, cy)
-                                if world.is_obstacle(cpos) or cpos in state.walls:
-                                    break
-                                for ally in state.bombers:
-                                    if ally.id != bomber.id and ally.alive and ally.pos.x == cx and ally.pos.y == cy:
-                                        return True
-                                # stop if obstacle blocks further (already handled)
-                        return False
-                    if ally_in_blast(bomb_pos):
-                        rejection_reasons["ally_in_blast"] = rejection_reasons.get("ally_in_blast", 0) + 1
-                        candidates_rejected += 1
-                        continue
-                    
-                    # Safety: avoid enemies close to bomb or escape
-                    danger_radius = 2
-                    enemy_near_bomb = any(abs(e.pos.x - bomb_pos.x) + abs(e.pos.y - bomb_pos.y) <= danger_radius for e in state.enemies)
-                    enemy_near_escape = target.escape_pos and any(
-                        abs(e.pos.x - target.escape_pos.x) + abs(e.pos.y - target.escape_pos.y) <= danger_radius
-                        for e in state.enemies
-                    )
-                    if enemy_near_bomb or enemy_near_escape:
-                        rejection_reasons["enemy_near"] = rejection_reasons.get("enemy_near", 0) + 1
-                        candidates_rejected += 1
-                        continue
-                    
-                    # CRITICAL: Verify we can actually REACH the target via path
-                    # Special case: if already at target, path is valid (empty list)
-                    if bomber.pos.x == target.pos.x and bomber.pos.y == target.pos.y:
-                        path_to_target = []  # Already there!
-                    else:
-                        path_to_target = self.bfs_path(bomber.pos, target.pos, state, world, max_length=14)
-                        if path_to_target is None:  # None means no path, [] means already there
-                            rejection_reasons["no_path"] = rejection_reasons.get("no_path", 0) + 1
-                            candidates_rejected += 1
-                            logger.debug(f"  {bomber.id[:8]}: Target ({bomb_pos.x},{bomb_pos.y}) rejected: no path from ({bomber.pos.x},{bomber.pos.y})")
-                            continue
-                    
-                    # Path length check (prefer closer targets)
-                    max_path_len = 10
-                    if target.obstacle_count >= 2:
-                        max_path_len = 12  # Allow longer paths for k>=2
-                    if stuck_count >= 5:
-                        max_path_len = 14  # More lenient when stuck
-                    
-                    if len(path_to_target) > max_path_len:
-                        rejection_reasons["path_too_long"] = rejection_reasons.get("path_too_long", 0) + 1
+                # Avoid friendly fire: if any ally in blast cross (range=1, walls/obstacles block)
+                if any(ally_id != bomber.id for ally_id in ally_blast_risk.get(bomb_pos_tuple, ())):
+                    rejection_reasons["ally_in_blast"] += 1
+                    candidates_rejected += 1
+                    continue
+                
+                # Safety: avoid enemies close to bomb
+                if any(abs(ex - bomb_pos.x) + abs(ey - bomb_pos.y) <= danger_radius for ex, ey in enemy_tuples):
+                    rejection_reasons["enemy_near"] += 1
+                    candidates_rejected += 1
+                    continue
+                
+                # CRITICAL: Verify we can actually REACH the target via path
+                # (before scoring, so unreachable tiles never pay for the escape search)
+                # Special case: if already at target, path is valid (empty list)
+                if bomb_pos_tuple == bomber_pos_key:
+                    path_to_target = []  # Already there!
+                else:
+                    path_to_target = self.bfs_path(bomber.pos, bomb_pos, state, world, max_length=path_limit)
+                    if path_to_target is None:  # None means no path, [] means already there
+                        rejection_reasons["no_path"] += 1
                         candidates_rejected += 1
+                        logger.debug(f"  {bomber.id[:8]}: Target ({bomb_pos.x},{bomb_pos.y}) rejected: no path from ({bomber.pos.x},{bomber.pos.y})")
                         continue
-                    
-                    # Add to candidates - now we know it's reachable!
-                    all_candidates.append((target, target.score))
-                    
-                    if target.score > best_score:
-                        best_score = target.score
-                        best_target = target
-                else:
+
+                # Score this bomb position
+                target = self.score_bomb_tile(bomb_pos, state, world, bomber.id, 
+                                            min_k=attempt_min, require_escape=require_escape, bomber=bomber,
+                                            reserved_positions=reserved_positions,
+                                            ally_positions=ally_positions)
+                if target is None or target.obstacle_count < attempt_min:
                     if target is None:
-                        rejection_reasons["no_escape"] = rejection_reasons.get("no_escape", 0) + 1
+                        rejection_reasons["no_escape"] += 1
                     else:
-                        rejection_reasons["k_too_low"] = rejection_reasons.get("k_too_low", 0) + 1
+                        rejection_reasons["k_too_low"] += 1
+                    candidates_rejected += 1
+                    continue
+                
+                # Safety: avoid enemies close to the escape tile
+                if target.escape_pos and any(
+                    abs(ex - target.escape_pos.x) + abs(ey - target.escape_pos.y) <= danger_radius
+                    for ex, ey in enemy_tuples
+                ):
+                    rejection_reasons["enemy_near"] += 1
+                    candidates_rejected += 1
+                    continue
+                
+                # Path length check (prefer closer targets)
+                max_path_len = 10
+                if target.obstacle_count >= 2:
+                    max_path_len = 12  # Allow longer paths for k>=2
+                if stuck_count >= 5:
+                    max_path_len = 14  # More lenient when stuck
+                
+                if len(path_to_target) > max_path_len:
+                    rejection_reasons["path_too_long"] += 1
                     candidates_rejected += 1
+                    continue
+                
+                # Add to candidates - now we know it's reachable!
+                all_candidates.append((target, target.score))
+                
+                if target.score > best_score:
+                    best_score = target.score
+                    best_target = target
             
             if best_target:
                 # Check if this target was recently used (cooldown check)
                 target_tuple = best_target.pos.to_tuple()
-                if bomber.id in self.last_targets and target_tuple in self.last_targets[bomber.id][-3:]:
+                recent_targets = _recent(self.last_targets.get(bomber.id, ()), 3)
+                if target_tuple in recent_targets:
                     # Recently used, try next best candidate
                     logger.debug(f"⏸️  {bomber.id[:8]}: Target {target_tuple} recently used, trying alternative")
-                    # Sort all candidates by score
-                    all_candidates.sort(key=lambda x: x[1], reverse=True)
-                    # Find next best that's not recently used
-                    for candidate, score in all_candidates:
-                        candidate_tuple = candidate.pos.to_tuple()
-                        if candidate_tuple not in self.last_targets.get(bomber.id, [])[-3:]:
-                            best_target = candidate
-                            best_score = score
-                            break
+                    # Best-scoring candidate that's not recently used (no full sort needed)
+                    alternative = heapq.nlargest(
+                        1,
+                        (c for c in all_candidates if c[0].pos.to_tuple() not in recent_targets),
+                        key=lambda x: x[1]
+                    )
+                    if alternative:
+                        best_target, best_score = alternative[0]
                     else:
                         # All candidates recently used, use best anyway
                         logger.debug(f"⚠️  {bomber.id[:8]}: All candidates recently used, using best")
@@ -815,100 +1163,360 @@ class Planner:
                 self.no_target_count[bomber.id] = 0
                 
                 # Track target
-                if bomber.id not in self.last_targets:
-                    self.last_targets[bomber.id] = []
-                self.last_targets[bomber.id].append(best_target.pos.to_tuple())
-                
-                escape_info = f", escape=({best_target.escape_pos.x},{best_target.escape_pos.y})" if best_target.escape_pos else ""
-                rejection_summary = ", ".join(f"{k}={v}" for k, v in sorted(rejection_reasons.items())[:3])
+                self._history(self.last_targets, bomber.id).append(best_target.pos.to_tuple())
                 
-                if attempt_min < base_min_obstacles:
-                    logger.info(
-                        f"✅ {bomber.id[:8]} [{role.value}]: Selected target (lowered threshold to k>={attempt_min}) "
-                        f"({best_target.pos.x},{best_target.pos.y}) k={best_target.obstacle_count}, "
-                        f"score={best_target.score:.1f}{escape_info} (checked {candidates_checked}, rejected {candidates_rejected}: {rejection_summary})"
-                    )
-                else:
-                    logger.info(
-                        f"✅ {bomber.id[:8]} [{role.value}]: Selected target ({best_target.pos.x},{best_target.pos.y}) "
-                        f"k={best_target.obstacle_count}, score={best_target.score:.1f}{escape_info} "
-                        f"(checked {candidates_checked}, rejected {candidates_rejected}: {rejection_summary})"
-                    )
+                # Summary strings are only built when INFO is actually emitted
+                if logger.isEnabledFor(logging.INFO):
+                    escape_info = f", escape=({best_target.escape_pos.x},{best_target.escape_pos.y})" if best_target.escape_pos else ""
+                    rejection_summary = ", ".join(f"{k}={v}" for k, v in heapq.nsmallest(3, rejection_reasons.items()))
+                    
+                    if attempt_min < base_min_obstacles:
+                        logger.info(
+                            f"✅ {bomber.id[:8]} [{role.value}]: Selected target (lowered threshold to k>={attempt_min}) "
+                            f"({best_target.pos.x},{best_target.pos.y}) k={best_target.obstacle_count}, "
+                            f"score={best_target.score:.1f}{escape_info} (checked {candidates_checked}, rejected {candidates_rejected}: {rejection_summary})"
+                        )
+                    else:
+                        logger.info(
+                            f"✅ {bomber.id[:8]} [{role.value}]: Selected target ({best_target.pos.x},{best_target.pos.y}) "
+                            f"k={best_target.obstacle_count}, score={best_target.score:.1f}{escape_info} "
+                            f"(checked {candidates_checked}, rejected {candidates_rejected}: {rejection_summary})"
+                        )
                 return best_target
         
         # No target found even with k>=1
         # Increment failure counter
         self.no_target_count[bomber.id] = self.no_target_count.get(bomber.id, 0) + 1
         
-        # Log top candidates for debugging
-        if all_candidates:
-            top_candidates = sorted(all_candidates, key=lambda x: x[1], reverse=True)[:3]
-            top_info = ", ".join(
-                f"({c.pos.x},{c.pos.y}) k={c.obstacle_count} score={s:.1f}"
-                for c, s in top_candidates
-            )
-            logger.debug(
-                f"❌ {bomber.id[:8]} [{role.value}]: No valid target found "
-                f"(checked {candidates_checked}, rejected {candidates_rejected}, stuck_count={self.no_target_count[bomber.id]})"
-            )
-            logger.debug(f"   Top candidates: {top_info}")
-        else:
-            logger.debug(
-                f"❌ {bomber.id[:8]} [{role.value}]: No valid target found "
-                f"(checked {candidates_checked}, all rejected, stuck_count={self.no_target_count[bomber.id]})"
-            )
+        # Log top candidates for debugging (skipped entirely unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            if all_candidates:
+                top_candidates = heapq.nlargest(3, all_candidates, key=lambda x: x[1])
+                top_info = ", ".join(
+                    f"({c.pos.x},{c.pos.y}) k={c.obstacle_count} score={s:.1f}"
+                    for c, s in top_candidates
+                )
+                logger.debug(
+                    f"❌ {bomber.id[:8]} [{role.value}]: No valid target found "
+                    f"(checked {candidates_checked}, rejected {candidates_rejected}, stuck_count={self.no_target_count[bomber.id]})"
+                )
+                logger.debug(f"   Top candidates: {top_info}")
+            else:
+                logger.debug(
+                    f"❌ {bomber.id[:8]} [{role.value}]: No valid target found "
+                    f"(checked {candidates_checked}, all rejected, stuck_count={self.no_target_count[bomber.id]})"
+                )
         
         return None
     
     def bfs_path(self, start: Position, goal: Position, state: ArenaState,
                 world: WorldMemory, max_length: int = 30) -> Optional[List[Position]]:
-        """BFS shortest path, max length 30"""
+        """BFS shortest path, max length 30 (cached by world signature across ticks)"""
         if start.x == goal.x and start.y == goal.y:
             return []
         
-        queue = deque([(start, [start])])
-        visited: Set[Tuple[int, int]] = {start.to_tuple()}
+        # A distance field from this start (see _distance_field) answers without searching
+        fields = self._lookups(state, world).get('distance_fields')
+        if fields:
+            map_w, map_h = state.map_size
+            field = fields.get(start.y * map_w + start.x)
+            if field is not None:
+                if not (0 <= goal.x < map_w and 0 <= goal.y < map_h):
+                    return None
+                dist, parent = field
+                goal_idx = goal.y * map_w + goal.x
+                if dist[goal_idx] == -1 or dist[goal_idx] > max_length - 1:
+                    return None
+                return _rebuild_path(parent, goal_idx, map_w)
         
-        while queue:
-            current, path = queue.popleft()
+        key = (start.x, start.y, goal.x, goal.y, max_length, self._get_world_signature(state, world))
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            self._path_cache[key] = (world.current_tick, cached[1])
+            path = cached[1]
+        else:
+            path = self._search_path(start, goal, state, world, max_length)
+            self._path_cache[key] = (world.current_tick, path)
+        # Callers may consume the list, so never hand out the cached one
+        return list(path) if path is not None else None
+    
+    def _distance_field(self, start: Position, state: ArenaState,
+                        world: WorldMemory) -> Tuple[List[int], List[int]]:
+        """
+        Single-source BFS from start over the whole occupancy grid: (dist, parent) as
+        flat row-major lists, dist -1 where unreachable, start is its own parent.
+        Built once per (tick, state, start); afterwards every bfs_path() query from
+        that tile is a lookup plus a parent walk instead of a fresh search.
+        """
+        map_w, map_h = state.map_size
+        start_idx = start.y * map_w + start.x
+        fields = self._lookups(state, world).setdefault('distance_fields', {})
+        field = fields.get(start_idx)
+        if field is None:
+            grid = self._occupancy_grid(state, world)
+            size = map_w * map_h
+            last_row = size - map_w
+            dist = [-1] * size
+            parent = [-1] * size
+            dist[start_idx] = 0
+            parent[start_idx] = start_idx
+            # Flat FIFO: every tile is enqueued at most once, so a list plus a head
+            # index replaces the deque, and the four neighbor checks are unrolled
+            # instead of building a tuple of (index, in-bounds) pairs per tile
+            queue = [start_idx]
+            head = 0
+            while head < len(queue):
+                idx = queue[head]
+                head += 1
+                x = idx % map_w
+                d = dist[idx] + 1
+                # Neighbors in _NEIGHBORS4 order: down, up, right, left
+                n = idx + map_w
+                if idx < last_row and dist[n] == -1 and not grid[n]:
+                    dist[n] = d
+                    parent[n] = idx
+                    queue.append(n)
+                n = idx - map_w
+                if idx >= map_w and dist[n] == -1 and not grid[n]:
+                    dist[n] = d
+                    parent[n] = idx
+                    queue.append(n)
+                n = idx + 1
+                if x + 1 < map_w and dist[n] == -1 and not grid[n]:
+                    dist[n] = d
+                    parent[n] = idx
+                    queue.append(n)
+                n = idx - 1
+                if x > 0 and dist[n] == -1 and not grid[n]:
+                    dist[n] = d
+                    parent[n] = idx
+                    queue.append(n)
+            field = (dist, parent)
+            fields[start_idx] = field
+        return field
+    
+    def _search_path(self, start: Position, goal: Position, state: ArenaState,
+                     world: WorldMemory, max_length: int) -> Optional[List[Position]]:
+        """
+        Uncached bidirectional BFS behind bfs_path(), over flat tile indices of the
+        occupancy grid. Expands the smaller frontier one full level at a time and
+        stops at the first level where the searches meet, so long paths visit
+        roughly two half-radius discs instead of one full one.
+        """
+        map_w, map_h = state.map_size
+        if not (0 <= goal.x < map_w and 0 <= goal.y < map_h):
+            return None
+        grid = self._occupancy_grid(state, world)
+        start_idx = start.y * map_w + start.x
+        goal_idx = goal.y * map_w + goal.x
+        if grid[goal_idx]:
+            return None  # Goal itself is impassable
+        max_steps = max_length - 1  # Same limit as before: paths of at most max_length - 1 steps
+        
+        # Shared per-tile scratch arrays: marks tell which side reached a tile this search.
+        # Forward parents point toward start, backward parents toward goal.
+        marks, parent, depth, fwd_mark = self._bfs_buffers(map_w * map_h)
+        bwd_mark = fwd_mark + 1
+        marks[start_idx] = fwd_mark
+        marks[goal_idx] = bwd_mark
+        parent[goal_idx] = -1
+        depth[start_idx] = depth[goal_idx] = 0
+        fwd_frontier = [start_idx]
+        bwd_frontier = [goal_idx]
+        fwd_level = bwd_level = 0
+        
+        while fwd_frontier and bwd_frontier and fwd_level + bwd_level < max_steps:
+            forward = len(fwd_frontier) <= len(bwd_frontier)
+            if forward:
+                frontier, own, other = fwd_frontier, fwd_mark, bwd_mark
+                fwd_level += 1
+                level = fwd_level
+            else:
+                frontier, own, other = bwd_frontier, bwd_mark, fwd_mark
+                bwd_level += 1
+                level = bwd_level
             
-            if len(path) > max_length:
-                continue  # Too long
+            next_frontier: List[int] = []
+            # Best meeting edge (tile on this side, tile on the other side) of this level
+            meet_from, meet_to, meet_len = -1, -1, max_steps + 1
+            for idx in frontier:
+                x, y = idx % map_w, idx // map_w
+                # Neighbors in _NEIGHBORS4 order: down, up, right, left
+                for n, ok in ((idx + map_w, y + 1 < map_h), (idx - map_w, y > 0),
+                              (idx + 1, x + 1 < map_w), (idx - 1, x > 0)):
+                    if not ok:
+                        continue
+                    n_mark = marks[n]
+                    if n_mark == own:
+                        continue
+                    if n_mark == other:
+                        # Meeting is checked before occupancy: start may hold the bomber's own bomb
+                        if level + depth[n] < meet_len:
+                            meet_from, meet_to, meet_len = idx, n, level + depth[n]
+                        continue
+                    if grid[n]:
+                        continue
+                    marks[n] = own
+                    parent[n] = idx
+                    depth[n] = level
+                    next_frontier.append(n)
             
-            if current.x == goal.x and current.y == goal.y:
-                return path[1:]  # Exclude start
+            if meet_from != -1:
+                fwd_end, bwd_end = (meet_from, meet_to) if forward else (meet_to, meet_from)
+                path: List[Position] = []
+                idx = fwd_end
+                while idx != start_idx:
+                    path.append(Position(idx % map_w, idx // map_w))
+                    idx = parent[idx]
+                path.reverse()
+                idx = bwd_end
+                while idx != -1:
+                    path.append(Position(idx % map_w, idx // map_w))
+                    idx = parent[idx]
+                return path  # Exclude start
             
-            # Check neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                neighbor = Position(current.x + dx, current.y + dy)
-                
-                # Bounds check
-                if (neighbor.x < 0 or neighbor.x >= state.map_size[0] or
-                    neighbor.y < 0 or neighbor.y >= state.map_size[1]):
-                    continue
-                
-                neighbor_tuple = neighbor.to_tuple()
-                if neighbor_tuple in visited:
-                    continue
-                
-                # Blocked check
-                if world.is_blocked(neighbor):
-                    continue
-                
-                # Check for bombs (can't pass through)
-                if any(b.pos.x == neighbor.x and b.pos.y == neighbor.y for b in state.bombs):
-                    continue
-                
-                # Check for mobs (contact kills) - only awake mobs (safe_time <= 0)
-                if any(m.pos.x == neighbor.x and m.pos.y == neighbor.y 
-                      for m in state.mobs if m.safe_time <= 0):  # Only awake mobs
-                    continue
-                
-                visited.add(neighbor_tuple)
-                queue.append((neighbor, path + [neighbor]))
+            if forward:
+                fwd_frontier = next_frontier
+            else:
+                bwd_frontier = next_frontier
         
         return None
     
+    def _first_obstacle_on_ray(self, state: ArenaState, world: WorldMemory, x: int, y: int,
+                               dx: int, dy: int, max_r: int) -> Optional[int]:
+        """
+        Distance r (1..max_r) of the first obstacle hit from (x, y) along (dx, dy),
+        or None if the ray leaves the map or a known blocked tile stops it first.
+        The candidate comes from per-row/column sorted obstacle lists via bisect, so
+        only the tiles up to that obstacle are walked.
+        """
+        lookups = self._lookups(state, world)
+        by_row = lookups.get('obs_by_row')
+        if by_row is None:
+            by_row, by_col = {}, {}
+            for ox, oy in lookups['obstacles']:
+                by_row.setdefault(oy, []).append(ox)
+                by_col.setdefault(ox, []).append(oy)
+            for line in by_row.values():
+                line.sort()
+            for line in by_col.values():
+                line.sort()
+            lookups['obs_by_row'] = by_row
+            lookups['obs_by_col'] = by_col
+        
+        if dy == 0:
+            line, origin, step = by_row.get(y, ()), x, dx
+        else:
+            line, origin, step = lookups['obs_by_col'].get(x, ()), y, dy
+        if step > 0:
+            i = bisect.bisect_right(line, origin)
+            hit = line[i] if i < len(line) else None
+        else:
+            i = bisect.bisect_left(line, origin)
+            hit = line[i - 1] if i > 0 else None
+        if hit is None or abs(hit - origin) > max_r:
+            return None
+        
+        # Known walls/obstacles (including the hit tile itself) stop the ray first
+        r_hit = abs(hit - origin)
+        map_w, map_h = state.map_size
+        blocked = self._blocked_tiles(state, world)
+        for r in range(1, r_hit + 1):
+            cx, cy = x + dx * r, y + dy * r
+            if not (0 <= cx < map_w and 0 <= cy < map_h) or (cx, cy) in blocked:
+                return None
+        return r_hit
+    
+    def _bfs_buffers(self, size: int) -> Tuple[List[int], List[int], List[int], int]:
+        """
+        Reusable per-tile scratch arrays (marks, parent, depth) for the flat-index BFS
+        searches plus a fresh even epoch. A tile is visited only if its mark equals this
+        search's epoch (or epoch + 1 for the backward side), so nothing is cleared or
+        reallocated between searches; parent/depth are only read for visited tiles.
+        """
+        if len(self._bfs_marks) != size:
+            self._bfs_marks = [0] * size
+            self._bfs_parent = [-1] * size
+            self._bfs_depth = [0] * size
+        self._bfs_epoch += 2
+        return self._bfs_marks, self._bfs_parent, self._bfs_depth, self._bfs_epoch
+    
+    def _k_grid(self, state: ArenaState, world: WorldMemory) -> bytearray:
+        """
+        Row-major grid of adjacent-obstacle counts (k in 0..4) for every tile,
+        built once per (tick, state) by stamping each obstacle onto its 4 neighbors.
+        """
+        lookups = self._lookups(state, world)
+        k_grid = lookups.get('k_grid')
+        if k_grid is None:
+            map_w, map_h = state.map_size
+            k_grid = bytearray(map_w * map_h)
+            for ox, oy in lookups['obstacles']:
+                for dx, dy in _NEIGHBORS4:
+                    x, y = ox + dx, oy + dy
+                    if 0 <= x < map_w and 0 <= y < map_h:
+                        k_grid[y * map_w + x] += 1
+            lookups['k_grid'] = k_grid
+        return k_grid
+    
+    def _density_grid(self, state: ArenaState, world: WorldMemory, radius: int = 3) -> bytearray:
+        """
+        Row-major grid of obstacle counts within Manhattan radius of every tile (same
+        numbers as _count_obstacles_near), built once per (tick, state) by stamping
+        each obstacle's diamond instead of probing a disc per candidate tile.
+        """
+        lookups = self._lookups(state, world)
+        key = f'density_r{radius}'
+        grid = lookups.get(key)
+        if grid is None:
+            map_w, map_h = state.map_size
+            grid = bytearray(map_w * map_h)
+            disc = _manhattan_disc(radius)
+            for ox, oy in lookups['obstacles']:
+                for dx, dy in disc:
+                    x, y = ox + dx, oy + dy
+                    if 0 <= x < map_w and 0 <= y < map_h:
+                        grid[y * map_w + x] += 1
+            lookups[key] = grid
+        return grid
+    
+    def _tile_flags(self, state: ArenaState, world: WorldMemory) -> bytearray:
+        """
+        Row-major grid of _TILE_* bits (blocked in world memory, state obstacle/bomb/wall),
+        built once per (tick, state) so searches test walkability with one index and
+        mask instead of probing several tuple sets per neighbor.
+        """
+        lookups = self._lookups(state, world)
+        flags = lookups.get('tile_flags')
+        if flags is None:
+            map_w, map_h = state.map_size
+            flags = bytearray(map_w * map_h)
+            for bit, tiles in ((_TILE_BLOCKED, self._blocked_tiles(state, world)),
+                               (_TILE_OBSTACLE, lookups['obstacles']),
+                               (_TILE_BOMB, lookups['bombs']),
+                               (_TILE_WALL, lookups['walls'])):
+                for x, y in tiles:
+                    if 0 <= x < map_w and 0 <= y < map_h:
+                        flags[y * map_w + x] |= bit
+            lookups['tile_flags'] = flags
+        return flags
+    
+    def _occupancy_grid(self, state: ArenaState, world: WorldMemory) -> bytearray:
+        """
+        Row-major (y * width + x) grid of impassable tiles for path search: known
+        walls/obstacles, bombs and awake mobs are 1. Built once per (tick, state).
+        """
+        lookups = self._lookups(state, world)
+        grid = lookups.get('occupancy')
+        if grid is None:
+            map_w, map_h = state.map_size
+            grid = bytearray(map_w * map_h)
+            for x, y in self._blocked_tiles(state, world) | lookups['bombs'] | lookups['mobs_awake']:
+                if 0 <= x < map_w and 0 <= y < map_h:
+                    grid[y * map_w + x] = 1
+            lookups['occupancy'] = grid
+        return grid
+    
     def _find_open_space(self, bomber: Bomber, state: ArenaState, 
                         world: WorldMemory, exclude_reserved: bool = True) -> Optional[Position]:
         """
@@ -917,51 +1525,49 @@ class Planner:
         """
         # Search in expanding radius for open space
         max_radius = 15
-        best_pos: Optional[Position] = None
+        best_xy: Optional[Tuple[int, int]] = None
         best_score = -1
+        flags = self._tile_flags(state, world)
+        density = self._density_grid(state, world, 3)
+        map_w, map_h = state.map_size
         
+        px, py = bomber.pos.x, bomber.pos.y
+        inner_radius = -1
         for radius in range(3, max_radius + 1, 2):
             for dx in range(-radius, radius + 1):
                 for dy in range(-radius, radius + 1):
-                    # Manhattan distance check
-                    if abs(dx) + abs(dy) > radius:
+                    # Manhattan distance check; tiles of inner rings were already scored
+                    distance_penalty = abs(dx) + abs(dy)
+                    if distance_penalty > radius or distance_penalty <= inner_radius:
                         continue
                     
-                    candidate = Position(bomber.pos.x + dx, bomber.pos.y + dy)
+                    cx, cy = px + dx, py + dy
                     
                     # Bounds check
-                    if (candidate.x < 0 or candidate.x >= state.map_size[0] or
-                        candidate.y < 0 or candidate.y >= state.map_size[1]):
-                        continue
-                    
-                    # Must be walkable
-                    if world.is_blocked(candidate):
+                    if not (0 <= cx < map_w and 0 <= cy < map_h):
                         continue
                     
-                    # Must not have bomb
-                    if any(b.pos.x == candidate.x and b.pos.y == candidate.y for b in state.bombs):
+                    # Must be walkable and must not have bomb
+                    if flags[cy * map_w + cx] & (_TILE_BLOCKED | _TILE_BOMB):
                         continue
                     
                     # Check if reserved by another agent
-                    if exclude_reserved and self.is_reserved(candidate, None):
+                    if exclude_reserved and self.is_reserved_xy(cx, cy, None):
                         continue
                     
                     # Count obstacles in small radius (fewer = better)
-                    obstacle_count = 0
-                    for obs in state.obstacles:
-                        dist = abs(obs.x - candidate.x) + abs(obs.y - candidate.y)
-                        if dist <= 3:
-                            obstacle_count += 1
+                    obstacle_count = density[cy * map_w + cx]
                     
                     # Score: prefer fewer obstacles, closer to current position
-                    distance_penalty = abs(dx) + abs(dy)
                     score = 100.0 - obstacle_count * 10.0 - distance_penalty * 0.5
                     
                     if score > best_score:
                         best_score = score
-                        best_pos = candidate
+                        best_xy = (cx, cy)
+            inner_radius = radius
         
-        return best_pos
+        # Only the winner becomes a Position
+        return Position(best_xy[0], best_xy[1]) if best_xy is not None else None
     
     def _find_safe_step(self, bomber: Bomber, state: ArenaState, 
                        world: WorldMemory, last_step: Optional[Position] = None,
@@ -974,29 +1580,25 @@ class Planner:
             last_step: Previous step position to avoid reversing (if known)
             ignore_reservations: If True, ignore soft reservations (for very stuck units)
         """
+        map_w, map_h = state.map_size
         # SPREAD OUT: Rotate direction order based on bomber ID to avoid clustering
-        base_dirs = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        id_hash = sum(ord(c) for c in bomber.id[:8]) % 4
+        base_dirs = _NEIGHBORS4
+        id_hash = self._id_hash(bomber.id) % 4
         directions = base_dirs[id_hash:] + base_dirs[:id_hash]  # Rotate based on ID
         
-        neighbors = []
-        for dx, dy in directions:
-            neighbor = Position(bomber.pos.x + dx, bomber.pos.y + dy)
-            if (neighbor.x >= 0 and neighbor.x < state.map_size[0] and
-                neighbor.y >= 0 and neighbor.y < state.map_size[1]):
-                neighbors.append(neighbor)
-        
         # Score neighbors: prefer unblocked, unreserved, safe from explosions, not reversing
+        flags = self._tile_flags(state, world)
         scored = []
-        for neighbor in neighbors:
-            # Skip if blocked (walls/obstacles only - NOT allied units)
-            if world.is_blocked(neighbor) or neighbor in state.obstacles:
+        for dx, dy in directions:
+            nx, ny = bomber.pos.x + dx, bomber.pos.y + dy
+            if not (0 <= nx < map_w and 0 <= ny < map_h):
                 continue
-            
-            # Skip if has bomb
-            if any(b.pos.x == neighbor.x and b.pos.y == neighbor.y for b in state.bombs):
+            # Skip if blocked (walls/obstacles only - NOT allied units) or has bomb
+            if flags[ny * map_w + nx] & (_TILE_BLOCKED | _TILE_OBSTACLE | _TILE_BOMB):
                 continue
             
+            neighbor = Position(nx, ny)
+            
             # Skip if reserved by another agent (unless ignoring reservations)
             if not ignore_reservations and self.is_reserved(neighbor, bomber.id):
                 logger.debug(f"  {bomber.id[:8]}: Neighbor ({neighbor.x},{neighbor.y}) reserved, skipping")
@@ -1005,16 +1607,13 @@ class Planner:
             # Check immediate safety from existing bombs
             safe = True
             for bomb in state.bombs:
-                if bomb.timer <= 1.5 and self._in_bomb_blast(neighbor, bomb, state):
+                if bomb.timer <= 1.5 and self._in_bomb_blast(neighbor, bomb, state, world):
                     safe = False
                     break
             
             if safe:
                 # Score: prefer unreserved, fewer nearby obstacles, not reversing
-                obstacle_count = sum(
-                    1 for obs in state.obstacles
-                    if abs(obs.x - neighbor.x) + abs(obs.y - neighbor.y) <= 2
-                )
+                obstacle_count = self._count_obstacles_near(state, world, neighbor.x, neighbor.y, 2)
                 score = 100.0 - obstacle_count * 5.0
                 
                 # Penalty for reversing (if we know last step)
@@ -1038,39 +1637,69 @@ class Planner:
         
         return None
 
+    def _tick_memo(self, state: ArenaState, world: WorldMemory, key: Tuple,
+                   compute: Callable[[], object]) -> object:
+        """
+        Per-tick memo for searches that only depend on the start tile and their limits
+        (frontier, bombable, cluster). Lives in the tick lookups, so it resets with them.
+        """
+        memo = self._lookups(state, world).setdefault('search_memo', {})
+        if key not in memo:
+            memo[key] = compute()
+        return memo[key]
+    
     def _find_frontier_path(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
                             max_length: int = 60) -> Optional[List[Position]]:
         """
-        Find a path to the nearest unobserved (frontier) tile to explore more map area.
-        Unknown tiles are treated as free (world.is_blocked already allows unknown).
+        Find a path to the nearest unobserved (frontier) tile to explore more map area
+        (memoized per tick by start tile, see _search_frontier_path).
+        """
+        path = self._tick_memo(state, world, ('frontier', bomber.pos.x, bomber.pos.y, max_length),
+                               lambda: self._search_frontier_path(bomber, state, world, max_length))
+        # Callers may consume the list, so never hand out the memoized one
+        return list(path) if path is not None else None
+    
+    def _search_frontier_path(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                              max_length: int) -> Optional[List[Position]]:
+        """
+        Uncached BFS behind _find_frontier_path(). Unknown tiles are treated as free
+        (world.is_blocked already allows unknown).
         """
         start = bomber.pos
-        queue = deque([(start, [])])
-        visited = {start.to_tuple()}
         max_x, max_y = state.map_size
-        
-        while queue:
-            current, path = queue.popleft()
-            
-            if len(path) > max_length:
-                continue
-            
-            tile = world.tiles.get(current.to_tuple())
-            if tile is None or not tile.is_observed:
-                return path  # path from start to this frontier tile
-            
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = current.x + dx, current.y + dy
-                if nx < 0 or nx >= max_x or ny < 0 or ny >= max_y:
-                    continue
-                npos = Position(nx, ny)
-                nt = npos.to_tuple()
-                if nt in visited:
-                    continue
-                if world.is_blocked(npos):
-                    continue
-                visited.add(nt)
-                queue.append((npos, path + [npos]))
+        flags = self._tile_flags(state, world)
+        tiles = world.tiles
+        # Flat-index parent pointers in the shared scratch arrays (start is its own parent)
+        marks, parent, _, mark = self._bfs_buffers(max_x * max_y)
+        start_idx = start.y * max_x + start.x
+        marks[start_idx] = mark
+        parent[start_idx] = start_idx
+        
+        # Layer-by-layer BFS: the layer index is the step count, so nothing per node but the parent
+        layer = [start.to_tuple()]
+        for depth in range(max_length + 1):
+            next_layer: List[Tuple[int, int]] = []
+            for x, y in layer:
+                idx = y * max_x + x
+                tile = tiles.get((x, y))
+                if tile is None or not tile.is_observed:
+                    return _rebuild_path(parent, idx, max_x)  # path from start to this frontier tile
+                if depth == max_length:
+                    continue  # Last layer is only checked, not expanded
+                
+                for dx, dy in _NEIGHBORS4:
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < max_x and 0 <= ny < max_y):
+                        continue
+                    n_idx = ny * max_x + nx
+                    if marks[n_idx] == mark or flags[n_idx] & _TILE_BLOCKED:
+                        continue
+                    marks[n_idx] = mark
+                    parent[n_idx] = idx
+                    next_layer.append((nx, ny))
+            if not next_layer:
+                break
+            layer = next_layer
         
         return None
 
@@ -1079,59 +1708,59 @@ class Planner:
         """
         BFS to find nearest position where k>=1 (at least one adjacent obstacle).
         Returns the PATH to that position (empty list if already there).
-        Only returns reachable positions.
+        Only returns reachable positions. Memoized per tick by start tile.
         """
-        from collections import deque
-        
-        # Build obstacle set for fast lookup
-        obstacle_set = {obs.to_tuple() for obs in state.obstacles}
-        
-        def count_adjacent_obstacles(pos: Position) -> int:
-            """Count obstacles adjacent to this position (k value)"""
-            count = 0
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                adj = (pos.x + dx, pos.y + dy)
-                if adj in obstacle_set:
-                    count += 1
-            return count
+        path = self._tick_memo(state, world, ('bombable', bomber.pos.x, bomber.pos.y, max_steps),
+                               lambda: self._search_nearest_bombable_position(bomber, state, world, max_steps))
+        return list(path) if path is not None else None
+    
+    def _search_nearest_bombable_position(self, bomber: Bomber, state: ArenaState,
+                                          world: WorldMemory, max_steps: int) -> Optional[List[Position]]:
+        """Uncached BFS behind _find_nearest_bombable_position()"""
+        # Tile flags and per-tile adjacent-obstacle counts (shared per tick)
+        flags = self._tile_flags(state, world)
+        k_grid = self._k_grid(state, world)
+        map_w, map_h = state.map_size
         
         # Check if already at a bombable position
-        if count_adjacent_obstacles(bomber.pos) >= 1:
+        if k_grid[bomber.pos.y * map_w + bomber.pos.x] >= 1:
             return []  # Already here
         
         # BFS to find nearest bombable position
         start = bomber.pos
-        queue = deque([(start, [])])  # (position, path_to_get_there)
-        visited = {start.to_tuple()}
-        
-        while queue:
-            current, path = queue.popleft()
-            
-            if len(path) > max_steps:
-                continue
-            
-            # Check neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = current.x + dx, current.y + dy
-                if nx < 0 or nx >= state.map_size[0] or ny < 0 or ny >= state.map_size[1]:
-                    continue
-                
-                neighbor = Position(nx, ny)
-                nt = neighbor.to_tuple()
-                
-                if nt in visited:
-                    continue
-                if world.is_blocked(neighbor) or neighbor in state.obstacles:
-                    continue
-                
-                visited.add(nt)
-                new_path = path + [neighbor]
-                
-                # Check if this position has k>=1
-                if count_adjacent_obstacles(neighbor) >= 1:
-                    return new_path
-                
-                queue.append((neighbor, new_path))
+        # Flat-index parent pointers in the shared scratch arrays (start is its own parent)
+        marks, parent, _, mark = self._bfs_buffers(map_w * map_h)
+        start_idx = start.y * map_w + start.x
+        marks[start_idx] = mark
+        parent[start_idx] = start_idx
+        
+        # Layer-by-layer BFS over flat indices: tiles up to max_steps away are expanded,
+        # so goals are found up to max_steps + 1 steps out
+        impassable = _TILE_BLOCKED | _TILE_OBSTACLE
+        last_col = map_w - 1
+        size = map_w * map_h
+        layer = [start_idx]
+        for _ in range(max_steps + 1):
+            next_layer: List[int] = []
+            for idx in layer:
+                x = idx % map_w
+                # Neighbors in _NEIGHBORS4 order (down, up, right, left), bounds checked per axis
+                for n_idx, inside in ((idx + map_w, idx + map_w < size), (idx - map_w, idx >= map_w),
+                                      (idx + 1, x < last_col), (idx - 1, x > 0)):
+                    if not inside or marks[n_idx] == mark or flags[n_idx] & impassable:
+                        continue
+                    
+                    marks[n_idx] = mark
+                    parent[n_idx] = idx
+                    
+                    # Check if this position has k>=1
+                    if k_grid[n_idx] >= 1:
+                        return _rebuild_path(parent, n_idx, map_w)
+                    
+                    next_layer.append(n_idx)
+            if not next_layer:
+                break
+            layer = next_layer
         
         return None  # No bombable position found
 
@@ -1139,43 +1768,52 @@ class Planner:
                                       world: WorldMemory, max_radius: int = 12) -> Optional[Position]:
         """
         Find nearest EMPTY TILE adjacent to obstacle cluster within max_radius.
+        Memoized per tick by start tile.
         """
+        return self._tick_memo(state, world, ('cluster', bomber.pos.x, bomber.pos.y, max_radius),
+                               lambda: self._search_obstacle_cluster_target(bomber, state, world, max_radius))
+    
+    def _search_obstacle_cluster_target(self, bomber: Bomber, state: ArenaState,
+                                        world: WorldMemory, max_radius: int) -> Optional[Position]:
+        """Uncached scan behind _find_obstacle_cluster_target()"""
         if not state.obstacles:
             return None
         
-        best_tile = None
+        best_xy = None
         best_score = -1
-        
-        for obs in state.obstacles:
-            dist = abs(obs.x - bomber.pos.x) + abs(obs.y - bomber.pos.y)
-            if dist > max_radius:
-                continue
-            
+        # Per-tick grids: radius-2 obstacle density and tile flags (no per-probe set lookups)
+        density_grid = self._density_grid(state, world, radius=2)
+        flags = self._tile_flags(state, world)
+        not_empty = _TILE_BLOCKED | _TILE_BOMB  # wall/obstacle in world memory, or bomb
+        map_w, map_h = state.map_size
+        bx, by = bomber.pos.x, bomber.pos.y
+        
+        for obs in self._obstacles_near(state, world, bx, by, max_radius):
+            ox, oy = obs.x, obs.y
             # Score by obstacle density in radius 2
-            density = sum(
-                1 for o in state.obstacles
-                if abs(o.x - obs.x) + abs(o.y - obs.y) <= 2
-            )
+            if 0 <= ox < map_w and 0 <= oy < map_h:
+                density = density_grid[oy * map_w + ox]
+            else:
+                density = self._count_obstacles_near(state, world, ox, oy, 2)
             
             # Find empty tile adjacent to this obstacle
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                adj_pos = Position(obs.x + dx, obs.y + dy)
-                if (adj_pos.x < 0 or adj_pos.x >= state.map_size[0] or
-                    adj_pos.y < 0 or adj_pos.y >= state.map_size[1]):
+            for dx, dy in _NEIGHBORS4:
+                ax, ay = ox + dx, oy + dy
+                if not (0 <= ax < map_w and 0 <= ay < map_h):
                     continue
                 
                 # Must be empty (not wall, not obstacle, not bomb)
-                if world.is_blocked(adj_pos):
-                    continue
-                if any(b.pos.x == adj_pos.x and b.pos.y == adj_pos.y for b in state.bombs):
+                if flags[ay * map_w + ax] & not_empty:
                     continue
                 
-                adj_dist = abs(adj_pos.x - bomber.pos.x) + abs(adj_pos.y - bomber.pos.y)
+                adj_dist = abs(ax - bx) + abs(ay - by)
                 score = density - adj_dist * 0.5
                 
                 if score > best_score:
                     best_score = score
-                    best_tile = adj_pos
+                    best_xy = (ax, ay)
+        
+        best_tile = Position(*best_xy) if best_xy else None
         
         # VERIFY REACHABILITY: Don't return unreachable targets
         if best_tile and (best_tile.x != bomber.pos.x or best_tile.y != bomber.pos.y):
@@ -1187,6 +1825,38 @@ class Planner:
         
         return best_tile
     
+    def prepare_tick(self, state: ArenaState, world: WorldMemory):
+        """
+        Build the tick's shared read-only structures (lookup sets, world signature,
+        occupancy grid) once, before bombers are planned one after another against
+        the same snapshot. Call after world.update().
+        """
+        self._lookups(state, world)
+        self._get_world_signature(state, world)
+        self._occupancy_grid(state, world)
+    
+    def reset_round(self):
+        """
+        Forget everything tied to the previous round's map and units (roles, histories,
+        blacklists, reservations, geometry caches) so one Planner serves every round.
+        Scratch search buffers, strategy tables and logging counters are kept.
+        """
+        for per_round in (self.roles, self.failed_destinations, self.no_target_count,
+                          self.last_steps, self.planned_actions, self.last_targets,
+                          self.last_positions, self.last_points, self.target_blacklist,
+                          self.bomb_placements, self.pending_explosions, self.invalid_bomb_cells,
+                          self._blacklist_heap, self._invalid_heap, self._target_cache,
+                          self._escape_cache, self._path_cache, self._tick_cache, self._obs_buckets):
+            per_round.clear()
+        self._last_roster_sig = None
+        self._world_sig_state = None
+        self._world_sig_tick = None
+        self._world_sig = ()
+        self._tick_cache_state = None
+        self._tick_cache_tick = None
+        self._obs_buckets_src = None
+        self.reservation_manager.clear()
+    
     def reset_soft_reservations(self):
         """Reset SOFT reservations for new tick"""
         self.reservation_manager.reset_soft_reservations()
@@ -1197,6 +1867,11 @@ class Planner:
         """Create SOFT reservation during planning"""
         return self.reservation_manager.soft_reserve(pos, owner, next_step, current_tick)
     
+    def soft_reserve_pair(self, dest: Position, first_step: Optional[Position], owner: str,
+                          current_tick: int = 0) -> bool:
+        """SOFT reserve destination and first step together, or neither"""
+        return self.reservation_manager.soft_reserve_pair(dest, first_step, owner, current_tick)
+    
     def hard_reserve(self, pos: Position, owner: str, next_step: Optional[Position] = None,
                     current_tick: int = 0, ttl: int = 3) -> bool:
         """Create HARD reservation after successful API confirmation"""
@@ -1206,6 +1881,10 @@ class Planner:
         """Check if position is reserved (excluding self-reservations)"""
         return self.reservation_manager.is_reserved(pos, owner)
     
+    def is_reserved_xy(self, x: int, y: int, owner: Optional[str] = None) -> bool:
+        """is_reserved() on raw coordinates, for hot loops that avoid Position allocation"""
+        return self.reservation_manager.is_reserved_xy(x, y, owner)
+    
     def plan_move(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
                  current_tick: int) -> Tuple[Optional[List[Position]], Optional[Position]]:
         """
@@ -1213,425 +1892,503 @@ class Planner:
         Bomb_pos is None if not bombing.
         
         Prevents replanning in same tick if already planned.
+        Strategies for the bomber's role are tried in priority order (see
+        _strategies); the first one that yields an action wins.
         """
         role = self.get_role(bomber.id)
+        # Log prefixes built once per call; debug records below use lazy %-formatting
+        bid8 = bomber.id[:8]
+        tag = f"{bid8} [{role.value}]"
         
         # Check if can move
         if not bomber.can_move:
-            logger.debug(f"⏸️  {bomber.id[:8]} [{role.value}]: Cannot move (already moving)")
+            logger.debug("⏸️  %s: Cannot move (already moving)", tag)
             return None, None
         
         # Check if already planned this tick (prevent replanning)
         if bomber.id in self.planned_actions:
-            logger.debug(f"⏸️  {bomber.id[:8]} [{role.value}]: Already planned this tick, skipping replanning")
+            logger.debug("⏸️  %s: Already planned this tick, skipping replanning", tag)
             return self.planned_actions[bomber.id]
         
-        # Count alive units for adaptive risk/limits
-        alive_count = sum(1 for b in state.bombers if b.alive)
+        # One BFS from the bomber's tile serves every bfs_path() query from it this tick
+        # (bomb targets, clusters, open space, center/desperate escape)
+        self._distance_field(bomber.pos, state, world)
+        
+        ctx = _PlanContext(
+            tag=tag,
+            bid8=bid8,
+            id_hash=self._id_hash(bomber.id),  # Spreads fallback directions per bomber
+            current_tick=current_tick,
+            # Count alive units for adaptive risk/limits
+            alive_count=sum(1 for b in state.bombers if b.alive),
+            stuck_count=self.no_target_count.get(bomber.id, 0),
+        )
+        
+        profile = logger.isEnabledFor(logging.DEBUG)
+        for strategy in self._strategies[role]:
+            started = time.perf_counter() if profile else 0.0
+            result = strategy(bomber, state, world, ctx)
+            if profile:
+                stats = self.strategy_stats.setdefault(strategy.__name__, [0, 0, 0.0])
+                stats[0] += 1
+                stats[1] += result is not None
+                stats[2] += time.perf_counter() - started
+            if result is not None:
+                self.planned_actions[bomber.id] = result
+                return result
+        
+        logger.debug("⏸️  %s: No action planned (truly no safe move)", tag)
+        return None, None
+
+    def plan_all(self, bombers: List[Bomber], state: ArenaState, world: WorldMemory,
+                 current_tick: int) -> Dict[str, Tuple[Optional[List[Position]], Optional[Position]]]:
+        """
+        Plan a batch of bombers against one tick snapshot. Returns bomber id -> (path, bomb_pos)
+        in planning order.
+
+        Prioritized planning: the shared per-tick structures are built once, then each
+        bomber is planned in list order and its SOFT reservations constrain the ones
+        after it, so no two bombers pick the same destination or first step.
+
+        Deliberately serial and single-threaded: the searches are pure Python (a thread
+        pool would just contend for the GIL), each plan depends on the reservations of
+        the ones before it, and the per-tick caches are not locked.
+        """
+        self.prepare_tick(state, world)
+        plans: Dict[str, Tuple[Optional[List[Position]], Optional[Position]]] = {}
+        for bomber in bombers:
+            if bomber.id not in plans:
+                plans[bomber.id] = self.plan_move(bomber, state, world, current_tick)
+        return plans
+
+    def log_strategy_stats(self):
+        """Log and reset per-strategy call/hit counts and time (DEBUG only)"""
+        if not self.strategy_stats:
+            return
+        ranked = sorted(self.strategy_stats.items(), key=lambda item: item[1][2], reverse=True)
+        logger.debug("⏱️  Strategy time: " + ", ".join(
+            f"{name[len('_strat_'):]}={seconds * 1000:.1f}ms ({int(hits)}/{int(calls)})"
+            for name, (calls, hits, seconds) in ranked
+        ))
+        self.strategy_stats.clear()
+    
+    def _strat_immediate_bomb(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                              ctx: "_PlanContext") -> Optional[Tuple[List[Position], Position]]:
+        """
+        CRITICAL FIX: Check if CURRENT position has k>=1 - if so, BOMB IMMEDIATELY!
+        This prevents units from wandering after reaching bombable positions
+        """
+        current_k = self._k_grid(state, world)[bomber.pos.y * state.map_size[0] + bomber.pos.x]
+        if current_k < 1 or bomber.bombs_available <= 0:
+            return None
         
-        # CRITICAL FIX: Check if CURRENT position has k>=1 - if so, BOMB IMMEDIATELY!
-        # This prevents units from wandering after reaching bombable positions
-        obstacle_set = {obs.to_tuple() for obs in state.obstacles}
-        current_k = sum(
-            1 for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            if (bomber.pos.x + dx, bomber.pos.y + dy) in obstacle_set
+        # We're at a bombable position with adjacent obstacles - try to bomb!
+        stuck_count = ctx.stuck_count
+        logger.info(
+            f"🎯 {ctx.tag}: At bombable pos ({bomber.pos.x},{bomber.pos.y}) "
+            f"k={current_k}, bombs={bomber.bombs_available}, stuck={stuck_count}"
+        )
+        # Try with escape first, then without if stuck
+        bomb_target = self.score_bomb_tile(
+            bomber.pos, state, world, bomber.id,
+            min_k=1, require_escape=True, bomber=bomber
         )
-        if current_k >= 1 and bomber.bombs_available > 0:
-            # We're at a bombable position with adjacent obstacles - try to bomb!
-            stuck_count = self.no_target_count.get(bomber.id, 0)
+        # If escape fails but we're stuck, try without escape requirement
+        if not bomb_target and stuck_count >= 3:
+            logger.debug("  %s: Retrying bomb without escape (stuck=%d)", ctx.bid8, stuck_count)
+            bomb_target = self.score_bomb_tile(
+                bomber.pos, state, world, bomber.id,
+                min_k=1, require_escape=False, bomber=bomber
+            )
+        if bomb_target and bomb_target.obstacle_count >= 1:
             logger.info(
-                f"🎯 {bomber.id[:8]} [{role.value}]: At bombable pos ({bomber.pos.x},{bomber.pos.y}) "
-                f"k={current_k}, bombs={bomber.bombs_available}, stuck={stuck_count}"
+                f"💣 {ctx.tag}: IMMEDIATE BOMB at current pos "
+                f"({bomber.pos.x},{bomber.pos.y}) k={bomb_target.obstacle_count}"
             )
-            # Try with escape first, then without if stuck
+            self.no_target_count[bomber.id] = 0  # Reset stuck counter
+            return [], bomb_target.pos
+        
+        logger.warning(
+            f"⚠️  {ctx.tag}: At bombable pos k={current_k} but score_bomb_tile FAILED!"
+        )
+        return None
+    
+    def _strat_target(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                      ctx: "_PlanContext") -> Optional[Tuple[List[Position], Position]]:
+        """Walk to (or bomb at) the best scored bomb target"""
+        tag = ctx.tag
+        # Check if stuck before planning
+        ctx.is_stuck, stuck_reason = self._is_stuck(bomber, state, ctx.current_tick)
+        if ctx.is_stuck:
+            logger.warning(f"⚠️  {tag}: STUCK detected in plan_move: {stuck_reason}")
+        
+        target = self.find_best_target(bomber, state, world, ctx.current_tick)
+        # find_best_target updates the failure counter the fallbacks below key off
+        ctx.stuck_count = self.no_target_count.get(bomber.id, 0)
+        if target:
+            # Check blacklist
+            if self._is_blacklisted(target.pos, ctx.current_tick):
+                logger.debug("⏸️  %s: Target (%d,%d) is blacklisted", tag, target.pos.x, target.pos.y)
+                target = None
+        
+        if not target:
+            # No bomb target found - exploration strategies take over
+            logger.info(f"🔍 {tag}: No reachable bomb targets, exploring...")
+            ctx.explore = True
+            return None
+        
+        # Path to target - [] means already there, None means no path
+        path = self.bfs_path(bomber.pos, target.pos, state, world)
+        if path is None:
+            logger.debug("❌ %s: No path to target (%d,%d)", tag, target.pos.x, target.pos.y)
+            self._failed_dests(bomber.id).append(target.pos.to_tuple())
+            return None
+        
+        # Adaptive max path length - more aggressive when alone or stuck
+        max_bomb_path = 10  # Increased from 8
+        if target.obstacle_count <= 1:
+            max_bomb_path = 8  # k=1 targets: slightly shorter
+        if ctx.alive_count <= 1:
+            max_bomb_path = 12  # Solo: allow longer paths to find targets
+        if ctx.is_stuck:
+            max_bomb_path = 14  # Stuck: be more lenient
+        
+        if len(path) > max_bomb_path:
+            logger.debug(
+                "❌ %s: Path too long (%d>%d) to bomb at (%d,%d), skipping",
+                tag, len(path), max_bomb_path, target.pos.x, target.pos.y
+            )
+            self._failed_dests(bomber.id).append(target.pos.to_tuple())
+            return None
+        
+        # If already at target (path=[]), we should place bomb immediately
+        if not path:
+            logger.info(
+                f"💣 {tag}: Already at bomb position ({target.pos.x},{target.pos.y}), "
+                f"will place bomb (k={target.obstacle_count})"
+            )
+            return [], target.pos  # Empty path = already there
+        
+        # Try to SOFT reserve destination and first step
+        first_step = path[0]
+        if not self.soft_reserve_pair(target.pos, first_step, bomber.id, ctx.current_tick):
+            logger.debug("⏸️  %s: Target (%d,%d) reservation failed", tag, target.pos.x, target.pos.y)
+            return None
+        
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"📍 {tag}: SOFT reserved destination ({target.pos.x},{target.pos.y}) "
+            f"and first step ({first_step.x},{first_step.y})"
+        )
+        return path, target.pos
+    
+    def _strat_cluster(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                       ctx: "_PlanContext") -> Optional[Tuple[List[Position], Optional[Position]]]:
+        """Move to (or bomb at) the densest nearby obstacle cluster"""
+        if not ctx.explore:
+            return None
+        # When very stuck, increase search radius
+        search_radius = 20 if ctx.stuck_count >= 10 else 10
+        cluster_target = self._find_obstacle_cluster_target(bomber, state, world, max_radius=search_radius)
+        if not cluster_target:
+            return None
+        path = self.bfs_path(bomber.pos, cluster_target, state, world, max_length=12)
+        if path is None:
+            return None
+        
+        # CRITICAL: If already at cluster (path=[]), try to place bomb HERE!
+        if len(path) == 0:
+            # We're at a cluster position - try placing bomb with relaxed requirements
             bomb_target = self.score_bomb_tile(
                 bomber.pos, state, world, bomber.id,
-                min_k=1, require_escape=True, bomber=bomber
+                min_k=1, require_escape=False, bomber=bomber
             )
-            # If escape fails but we're stuck, try without escape requirement
-            if not bomb_target and stuck_count >= 3:
-                logger.debug(f"  {bomber.id[:8]}: Retrying bomb without escape (stuck={stuck_count})")
-                bomb_target = self.score_bomb_tile(
-                    bomber.pos, state, world, bomber.id,
-                    min_k=1, require_escape=False, bomber=bomber
-                )
             if bomb_target and bomb_target.obstacle_count >= 1:
-                logger.info(
-                    f"💣 {bomber.id[:8]} [{role.value}]: IMMEDIATE BOMB at current pos "
-                    f"({bomber.pos.x},{bomber.pos.y}) k={bomb_target.obstacle_count}"
-                )
-                self.no_target_count[bomber.id] = 0  # Reset stuck counter
-                result = ([], bomb_target.pos)
-                self.planned_actions[bomber.id] = result
-                return result
-            else:
-                logger.warning(
-                    f"⚠️  {bomber.id[:8]} [{role.value}]: At bombable pos k={current_k} but score_bomb_tile FAILED!"
-                )
+                logger.info(f"💣 {ctx.tag}: AT CLUSTER - placing bomb k={bomb_target.obstacle_count}")
+                return [], bomb_target.pos
+            # Can't bomb here, move away to try elsewhere
+            logger.debug("  %s: At cluster but can't bomb, will try frontier", ctx.bid8)
+            return None
         
-        # Find target based on role
-        if role in [BomberRole.ANCHOR, BomberRole.FARMER]:
-            # Check if stuck before planning
-            is_stuck, stuck_reason = self._is_stuck(bomber, state, current_tick)
-            if is_stuck:
-                logger.warning(f"⚠️  {bomber.id[:8]} [{role.value}]: STUCK detected in plan_move: {stuck_reason}")
-            
-            target = self.find_best_target(bomber, state, world, current_tick)
-            if target:
-                # Check blacklist
-                if self._is_blacklisted(target.pos, current_tick):
-                    logger.debug(f"⏸️  {bomber.id[:8]} [{role.value}]: Target ({target.pos.x},{target.pos.y}) is blacklisted")
-                    target = None
-            
-            # Process valid target
-            if target:
-                # Path to target - [] means already there, None means no path
-                path = self.bfs_path(bomber.pos, target.pos, state, world)
-                if path is not None:  # [] is valid (already at target)!
-                    # Adaptive max path length - more aggressive when alone or stuck
-                    max_bomb_path = 10  # Increased from 8
-                    if target.obstacle_count <= 1:
-                        max_bomb_path = 8  # k=1 targets: slightly shorter
-                    if alive_count <= 1:
-                        max_bomb_path = 12  # Solo: allow longer paths to find targets
-                    if is_stuck:
-                        max_bomb_path = 14  # Stuck: be more lenient
-                    
-                    if len(path) > max_bomb_path:
-                        logger.debug(
-                            f"❌ {bomber.id[:8]} [{role.value}]: Path too long ({len(path)}>{max_bomb_path}) "
-                            f"to bomb at ({target.pos.x},{target.pos.y}), skipping"
-                        )
-                        self.failed_destinations.setdefault(bomber.id, []).append(target.pos.to_tuple())
-                        target = None
-                        path = None
-                    else:
-                        # Try to SOFT reserve destination and first step
-                        first_step = path[0] if path else None  # path=[] means bomber already at target
-                        
-                        # If already at target (path=[]), we should place bomb immediately
-                        if not path:
-                            # Already at target - just return to trigger bomb placement
-                            logger.info(
-                                f"💣 {bomber.id[:8]} [{role.value}]: Already at bomb position ({target.pos.x},{target.pos.y}), "
-                                f"will place bomb (k={target.obstacle_count})"
-                            )
-                            result = ([], target.pos)  # Empty path = already there
-                            self.planned_actions[bomber.id] = result
-                            return result
-                        
-                        if self.soft_reserve(target.pos, bomber.id, first_step, current_tick):
-                            # Also reserve first step if different
-                            if first_step and first_step != target.pos:
-                                self.soft_reserve(first_step, bomber.id, None, current_tick)
-                            
-                            if first_step:
-                                self.last_steps[bomber.id] = first_step
-                            
-                            logger.info(
-                                f"📍 {bomber.id[:8]} [{role.value}]: SOFT reserved destination ({target.pos.x},{target.pos.y}) "
-                                f"and first step ({first_step.x},{first_step.y})" if first_step else 
-                                f"📍 {bomber.id[:8]} [{role.value}]: SOFT reserved destination ({target.pos.x},{target.pos.y})"
-                            )
-                            
-                            # Store planned action to prevent replanning
-                            result = (path, target.pos)
-                            self.planned_actions[bomber.id] = result
-                            return result
-                        else:
-                            logger.debug(
-                                f"⏸️  {bomber.id[:8]} [{role.value}]: Target "
-                                f"({target.pos.x},{target.pos.y}) reservation failed"
-                            )
-                            target = None
-                            path = None
-                else:
-                    # No path to target
-                    logger.debug(f"❌ {bomber.id[:8]} [{role.value}]: No path to target ({target.pos.x},{target.pos.y})")
-                    self.failed_destinations.setdefault(bomber.id, []).append(target.pos.to_tuple())
-                    target = None
-            else:
-                # No bomb target found - try exploration
-                logger.info(f"🔍 {bomber.id[:8]} [{role.value}]: No reachable bomb targets, exploring...")
-                # When very stuck, increase search radius
-                stuck_count = self.no_target_count.get(bomber.id, 0)
-                search_radius = 20 if stuck_count >= 10 else 10
-                cluster_target = self._find_obstacle_cluster_target(bomber, state, world, max_radius=search_radius)
-                if cluster_target:
-                    path = self.bfs_path(bomber.pos, cluster_target, state, world, max_length=12)
-                    if path is not None:  # [] is valid (already at target)
-                        # CRITICAL: If already at cluster (path=[]), try to place bomb HERE!
-                        if len(path) == 0:
-                            # We're at a cluster position - try placing bomb with relaxed requirements
-                            bomb_target = self.score_bomb_tile(
-                                bomber.pos, state, world, bomber.id, 
-                                min_k=1, require_escape=False, bomber=bomber
-                            )
-                            if bomb_target and bomb_target.obstacle_count >= 1:
-                                logger.info(
-                                    f"💣 {bomber.id[:8]} [{role.value}]: AT CLUSTER - placing bomb k={bomb_target.obstacle_count}"
-                                )
-                                result = ([], bomb_target.pos)
-                                self.planned_actions[bomber.id] = result
-                                return result
-                            # Can't bomb here, move away to try elsewhere
-                            logger.debug(f"  {bomber.id[:8]}: At cluster but can't bomb, will try frontier")
-                        else:
-                            # Moving to cluster
-                            first_step = path[0]
-                            if self.soft_reserve(cluster_target, bomber.id, first_step, current_tick):
-                                self.last_steps[bomber.id] = first_step
-                                logger.info(
-                                    f"🧭 {bomber.id[:8]} [{role.value}]: Moving to obstacle cluster at "
-                                    f"({cluster_target.x},{cluster_target.y}) (path {len(path)} steps)"
-                                )
-                                result = (path, None)
-                                self.planned_actions[bomber.id] = result
-                                return result
-
-                # NEW: BFS search for nearest position with k>=1 (guaranteed reachable)
-                bombable_path = self._find_nearest_bombable_position(bomber, state, world, max_steps=30)
-                if bombable_path is not None:
-                    if len(bombable_path) == 0:
-                        # Already at bombable position - place bomb!
-                        bomb_target = self.score_bomb_tile(
-                            bomber.pos, state, world, bomber.id,
-                            min_k=1, require_escape=False, bomber=bomber
-                        )
-                        if bomb_target and bomb_target.obstacle_count >= 1:
-                            logger.info(
-                                f"💣 {bomber.id[:8]} [{role.value}]: AT BOMBABLE POS - placing bomb k={bomb_target.obstacle_count}"
-                            )
-                            result = ([], bomb_target.pos)
-                            self.planned_actions[bomber.id] = result
-                            return result
-                    else:
-                        first_step = bombable_path[0]
-                        dest = bombable_path[-1]
-                        if self.soft_reserve(dest, bomber.id, first_step, current_tick):
-                            self.last_steps[bomber.id] = first_step
-                            logger.info(
-                                f"🎯 {bomber.id[:8]} [{role.value}]: Moving to bombable position "
-                                f"({dest.x},{dest.y}) (path {len(bombable_path)} steps)"
-                            )
-                            result = (bombable_path, None)
-                            self.planned_actions[bomber.id] = result
-                            return result
-
-                frontier_path = self._find_frontier_path(bomber, state, world, max_length=40)
-                if frontier_path is not None and len(frontier_path) > 0:  # Need actual movement
-                    first_step = frontier_path[0]
-                    dest = frontier_path[-1]
-                    if self.soft_reserve(dest, bomber.id, first_step, current_tick):
-                        self.soft_reserve(first_step, bomber.id, None, current_tick)
-                        self.last_steps[bomber.id] = first_step
-                        logger.info(
-                            f"🧭 {bomber.id[:8]} [{role.value}]: Exploring frontier to "
-                            f"({dest.x},{dest.y}) (path {len(frontier_path)} steps)"
-                        )
-                        result = (frontier_path, None)
-                        self.planned_actions[bomber.id] = result
-                        return result
-                
-                # No target found - check if stuck and use fallback
-                stuck_count = self.no_target_count.get(bomber.id, 0)
-                if stuck_count >= self.stuck_threshold:
-                    logger.info(
-                        f"🔄 {bomber.id[:8]} [{role.value}]: STUCK (failures={stuck_count}), "
-                        f"using fallback: move to open space"
-                    )
-                    open_space = self._find_open_space(bomber, state, world, exclude_reserved=True)
-                    if open_space and not self.is_reserved(open_space, bomber.id):
-                        path = self.bfs_path(bomber.pos, open_space, state, world, max_length=30)
-                        if path:
-                            first_step = path[0] if path else None
-                            if self.soft_reserve(open_space, bomber.id, first_step, current_tick):
-                                if first_step:
-                                    self.last_steps[bomber.id] = first_step
-                                logger.info(
-                                    f"🗺️  {bomber.id[:8]} [{role.value}]: Fallback path to open space: "
-                                    f"({bomber.pos.x},{bomber.pos.y}) → ({open_space.x},{open_space.y}) "
-                                    f"({len(path)} steps) [SOFT RESERVED]"
-                                )
-                                # Reset stuck counter on fallback movement
-                                self.no_target_count[bomber.id] = max(0, stuck_count - 2)
-                                result = (path, None)
-                                self.planned_actions[bomber.id] = result
-                                return result
-                    
-                    # If open space fallback failed, try MOVE TO CENTER to escape corner
-                    center_x, center_y = state.map_size[0] // 2, state.map_size[1] // 2
-                    # Direction towards center based on bomber ID to spread out
-                    id_offset = (sum(ord(c) for c in bomber.id[:8]) % 20) - 10
-                    target_x = min(max(5, center_x + id_offset), state.map_size[0] - 5)
-                    target_y = min(max(5, center_y + id_offset), state.map_size[1] - 5)
-                    center_target = Position(target_x, target_y)
-                    path_to_center = self.bfs_path(bomber.pos, center_target, state, world, max_length=50)
-                    if path_to_center and len(path_to_center) > 0:
-                        first_step = path_to_center[0]
-                        if self.soft_reserve(first_step, bomber.id, first_step, current_tick):
-                            self.last_steps[bomber.id] = first_step
-                            logger.info(
-                                f"🏃 {bomber.id[:8]} [{role.value}]: ESCAPE CORNER → center "
-                                f"({target_x},{target_y}) (path {len(path_to_center)} steps)"
-                            )
-                            self.no_target_count[bomber.id] = max(0, stuck_count - 3)
-                            result = (path_to_center, None)
-                            self.planned_actions[bomber.id] = result
-                            return result
-                    
-                    # DESPERATE ESCAPE: When very stuck, find LONGEST safe path in any direction
-                    if stuck_count >= 15:
-                        best_escape_path = None
-                        best_escape_len = 0
-                        # Try different directions based on bomber ID to spread out
-                        dir_options = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1)]
-                        id_hash = sum(ord(c) for c in bomber.id[:8])
-                        for i in range(len(dir_options)):
-                            dx, dy = dir_options[(i + id_hash) % len(dir_options)]
-                            # Try walking 5-20 steps in this direction
-                            for dist in [20, 15, 10, 5]:
-                                target = Position(
-                                    min(max(1, bomber.pos.x + dx * dist), state.map_size[0] - 2),
-                                    min(max(1, bomber.pos.y + dy * dist), state.map_size[1] - 2)
-                                )
-                                if target.x == bomber.pos.x and target.y == bomber.pos.y:
-                                    continue
-                                path = self.bfs_path(bomber.pos, target, state, world, max_length=60)
-                                if path and len(path) > best_escape_len and not self.is_reserved(path[0], bomber.id):
-                                    best_escape_path = path
-                                    best_escape_len = len(path)
-                                    if best_escape_len >= 5:  # Good enough
-                                        break
-                            if best_escape_len >= 5:
-                                break
-                        
-                        if best_escape_path and len(best_escape_path) > 0:
-                            first_step = best_escape_path[0]
-                            if self.soft_reserve(first_step, bomber.id, first_step, current_tick):
-                                self.last_steps[bomber.id] = first_step
-                                dest = best_escape_path[-1]
-                                logger.info(
-                                    f"🆘 {bomber.id[:8]} [{role.value}]: DESPERATE ESCAPE "
-                                    f"→ ({dest.x},{dest.y}) (path {len(best_escape_path)} steps)"
-                                )
-                                self.no_target_count[bomber.id] = max(0, stuck_count - 5)
-                                result = (best_escape_path, None)
-                                self.planned_actions[bomber.id] = result
-                                return result
-                    
-                    # If center fallback failed, try always-act safe step
-                    # CRITICAL: Ignore reservations if VERY stuck (failures >= 20)
-                    ignore_res = stuck_count >= 20
-                    last_step = self.last_steps.get(bomber.id)
-                    safe_step = self._find_safe_step(bomber, state, world, last_step=last_step, 
-                                                    ignore_reservations=ignore_res)
-                    if safe_step:
-                        # Force reserve even if soft_reserve fails when ignoring reservations
-                        reserved = self.soft_reserve(safe_step, bomber.id, safe_step, current_tick)
-                        if reserved or ignore_res:
-                            self.last_steps[bomber.id] = safe_step
-                            mode = "FORCE MOVE (ignoring reservations)" if ignore_res else "SOFT RESERVED"
-                            logger.info(
-                                f"🔄 {bomber.id[:8]} [{role.value}]: Always-act fallback: "
-                                f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
-                            )
-                            self.no_target_count[bomber.id] = max(0, stuck_count - 1)
-                            result = ([safe_step], None)
-                            self.planned_actions[bomber.id] = result
-                            return result
-        
-        # Scout: explore or relocate
-        if role == BomberRole.SCOUT:
-            logger.debug(f"🔎 {bomber.id[:8]} [{role.value}]: Exploring new area")
-            # Move to unexplored area - avoid repeating same path
-            explored = world.get_observed_area()
-            # Try different directions to avoid loops
-            directions = [(5, 0), (-5, 0), (0, 5), (0, -5), (7, 0), (-7, 0), (0, 7), (0, -7)]
-            for dx, dy in directions:
-                target = Position(bomber.pos.x + dx, bomber.pos.y + dy)
-                if (target.x >= 0 and target.x < state.map_size[0] and
-                    target.y >= 0 and target.y < state.map_size[1]):
-                    # Check if we've tried this destination recently
-                    failed_dests = self.failed_destinations.get(bomber.id, [])
-                    target_tuple = target.to_tuple()
-                    if target_tuple in failed_dests[-3:]:  # Avoid last 3 failed destinations
-                        continue
-                    
-                    # Check if destination is reserved by another agent
-                    if self.is_reserved(target, bomber.id):
-                        continue
-                    
-                    path = self.bfs_path(bomber.pos, target, state, world, max_length=15)
-                    if path:
-                        first_step = path[0] if path else None
-                        if self.soft_reserve(target, bomber.id, first_step, current_tick):
-                            logger.debug(
-                                f"🗺️  {bomber.id[:8]} [{role.value}]: Exploration path: "
-                                f"({bomber.pos.x},{bomber.pos.y}) → ({target.x},{target.y}) "
-                                f"({len(path)} steps) [SOFT RESERVED]"
-                            )
-                            result = (path, None)
-                            self.planned_actions[bomber.id] = result
-                            return result
+        # Moving to cluster
+        first_step = path[0]
+        if not self.soft_reserve(cluster_target, bomber.id, first_step, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"🧭 {ctx.tag}: Moving to obstacle cluster at "
+            f"({cluster_target.x},{cluster_target.y}) (path {len(path)} steps)"
+        )
+        return path, None
+    
+    def _strat_bombable(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                        ctx: "_PlanContext") -> Optional[Tuple[List[Position], Optional[Position]]]:
+        """BFS to the nearest position with k>=1 (guaranteed reachable)"""
+        if not ctx.explore:
+            return None
+        bombable_path = self._find_nearest_bombable_position(bomber, state, world, max_steps=30)
+        if bombable_path is None:
+            return None
+        
+        if len(bombable_path) == 0:
+            # Already at bombable position - place bomb!
+            bomb_target = self.score_bomb_tile(
+                bomber.pos, state, world, bomber.id,
+                min_k=1, require_escape=False, bomber=bomber
+            )
+            if bomb_target and bomb_target.obstacle_count >= 1:
+                logger.info(f"💣 {ctx.tag}: AT BOMBABLE POS - placing bomb k={bomb_target.obstacle_count}")
+                return [], bomb_target.pos
+            return None
+        
+        first_step = bombable_path[0]
+        dest = bombable_path[-1]
+        if not self.soft_reserve(dest, bomber.id, first_step, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"🎯 {ctx.tag}: Moving to bombable position "
+            f"({dest.x},{dest.y}) (path {len(bombable_path)} steps)"
+        )
+        return bombable_path, None
+    
+    def _strat_frontier(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                        ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Explore toward the nearest unobserved frontier"""
+        if not ctx.explore:
+            return None
+        frontier_path = self._find_frontier_path(bomber, state, world, max_length=40)
+        if not frontier_path:  # Need actual movement
+            return None
+        first_step = frontier_path[0]
+        dest = frontier_path[-1]
+        if not self.soft_reserve_pair(dest, first_step, bomber.id, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"🧭 {ctx.tag}: Exploring frontier to "
+            f"({dest.x},{dest.y}) (path {len(frontier_path)} steps)"
+        )
+        return frontier_path, None
+    
+    def _strat_open_space(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                          ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Stuck fallback: move to open space"""
+        if not ctx.explore or ctx.stuck_count < self.stuck_threshold:
+            return None
+        stuck_count = ctx.stuck_count
+        logger.info(
+            f"🔄 {ctx.tag}: STUCK (failures={stuck_count}), "
+            f"using fallback: move to open space"
+        )
+        path = self._open_space_path(bomber, state, world, ctx, max_length=30)
+        if path is None:
+            return None
+        # Reset stuck counter on fallback movement
+        self.no_target_count[bomber.id] = max(0, stuck_count - 2)
+        return path, None
+    
+    def _strat_center_escape(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                             ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Stuck fallback: MOVE TO CENTER to escape corner"""
+        if not ctx.explore or ctx.stuck_count < self.stuck_threshold:
+            return None
+        center_x, center_y = state.map_size[0] // 2, state.map_size[1] // 2
+        # Direction towards center based on bomber ID to spread out
+        id_offset = (ctx.id_hash % 20) - 10
+        target_x = min(max(5, center_x + id_offset), state.map_size[0] - 5)
+        target_y = min(max(5, center_y + id_offset), state.map_size[1] - 5)
+        center_target = Position(target_x, target_y)
+        path_to_center = self.bfs_path(bomber.pos, center_target, state, world, max_length=50)
+        if not path_to_center:
+            return None
+        first_step = path_to_center[0]
+        if not self.soft_reserve(first_step, bomber.id, first_step, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"🏃 {ctx.tag}: ESCAPE CORNER → center "
+            f"({target_x},{target_y}) (path {len(path_to_center)} steps)"
+        )
+        self.no_target_count[bomber.id] = max(0, ctx.stuck_count - 3)
+        return path_to_center, None
+    
+    def _strat_desperate_escape(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                                ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """DESPERATE ESCAPE: When very stuck, find LONGEST safe path in any direction"""
+        if not ctx.explore or ctx.stuck_count < max(15, self.stuck_threshold):
+            return None
+        best_escape_path = None
+        best_escape_len = 0
+        # Try different directions based on bomber ID to spread out
+        dir_options = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1)]
+        # All 32 candidates are judged from one BFS: the bomber's distance field
+        field_dist, field_parent = self._distance_field(bomber.pos, state, world)
+        map_w, map_h = state.map_size
+        # Targets are clamped to [1, size - 2] (inline: no min/max calls per candidate)
+        px, py = bomber.pos.x, bomber.pos.y
+        hi_x, hi_y = map_w - 2, map_h - 2
+        for i in range(len(dir_options)):
+            dx, dy = dir_options[(i + ctx.id_hash) % len(dir_options)]
+            # Try walking 5-20 steps in this direction
+            for dist in (20, 15, 10, 5):
+                tx, ty = px + dx * dist, py + dy * dist
+                tx = 1 if tx < 1 else tx
+                tx = hi_x if tx > hi_x else tx
+                ty = 1 if ty < 1 else ty
+                ty = hi_y if ty > hi_y else ty
+                if tx == px and ty == py:
+                    continue
+                if not (0 <= tx < map_w and 0 <= ty < map_h):
+                    continue  # Clamp can't fit on maps narrower than 3 tiles
+                # Same limit as bfs_path(max_length=60); only promising paths are rebuilt
+                steps = field_dist[ty * map_w + tx]
+                if steps == -1 or steps > 59 or steps <= best_escape_len:
+                    continue
+                path = _rebuild_path(field_parent, ty * map_w + tx, map_w)
+                if not self.is_reserved(path[0], bomber.id):
+                    best_escape_path = path
+                    best_escape_len = len(path)
+                    break  # Distances descend: first success is this direction's best
+            if best_escape_len >= 15:  # Long enough to leave the area
+                break
+        
+        if not best_escape_path:
+            return None
+        first_step = best_escape_path[0]
+        if not self.soft_reserve(first_step, bomber.id, first_step, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        dest = best_escape_path[-1]
+        logger.info(
+            f"🆘 {ctx.tag}: DESPERATE ESCAPE "
+            f"→ ({dest.x},{dest.y}) (path {len(best_escape_path)} steps)"
+        )
+        self.no_target_count[bomber.id] = max(0, ctx.stuck_count - 5)
+        return best_escape_path, None
+    
+    def _strat_stuck_safe_step(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                               ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """
+        Stuck fallback: always-act safe step.
+        CRITICAL: Ignore reservations if VERY stuck (failures >= 20)
+        """
+        if not ctx.explore or ctx.stuck_count < self.stuck_threshold:
+            return None
+        safe_step, ignore_res = self._take_safe_step(bomber, state, world, ctx, ctx.stuck_count)
+        if safe_step is None:
+            return None
+        mode = "FORCE MOVE (ignoring reservations)" if ignore_res else "SOFT RESERVED"
+        logger.info(
+            f"🔄 {ctx.tag}: Always-act fallback: "
+            f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
+        )
+        self.no_target_count[bomber.id] = max(0, ctx.stuck_count - 1)
+        return [safe_step], None
+    
+    def _strat_scout_explore(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                             ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Scout: move to unexplored area - avoid repeating same path"""
+        tag = ctx.tag
+        logger.debug("🔎 %s: Exploring new area", tag)
+        # Try different directions to avoid loops
+        map_w, map_h = state.map_size
+        directions = [(5, 0), (-5, 0), (0, 5), (0, -5), (7, 0), (-7, 0), (0, 7), (0, -7)]
+        failed_dests = self.failed_destinations.get(bomber.id, ())
+        for dx, dy in directions:
+            target = Position(bomber.pos.x + dx, bomber.pos.y + dy)
+            if not (0 <= target.x < map_w and 0 <= target.y < map_h):
+                continue
+            # Check if we've tried this destination recently
+            if target.to_tuple() in failed_dests:  # Avoid last 3 failed destinations (bounded deque)
+                continue
             
-            # If all exploration directions failed, try open space fallback
-            logger.debug(f"🔄 {bomber.id[:8]} [{role.value}]: Exploration failed, trying open space fallback")
-            open_space = self._find_open_space(bomber, state, world, exclude_reserved=True)
-            if open_space and not self.is_reserved(open_space, bomber.id):
-                path = self.bfs_path(bomber.pos, open_space, state, world, max_length=20)
-                if path:
-                    first_step = path[0] if path else None
-                    if self.soft_reserve(open_space, bomber.id, first_step, current_tick):
-                        if first_step:
-                            self.last_steps[bomber.id] = first_step
-                        logger.info(
-                            f"🗺️  {bomber.id[:8]} [{role.value}]: Fallback path to open space: "
-                            f"({bomber.pos.x},{bomber.pos.y}) → ({open_space.x},{open_space.y}) "
-                            f"({len(path)} steps) [SOFT RESERVED]"
-                        )
-                        result = (path, None)
-                        self.planned_actions[bomber.id] = result
-                        return result
+            # Check if destination is reserved by another agent
+            if self.is_reserved(target, bomber.id):
+                continue
             
-            # Always-act fallback for scouts too
-            scout_stuck = self.no_target_count.get(bomber.id, 0)
-            ignore_res = scout_stuck >= 20
-            last_step = self.last_steps.get(bomber.id)
-            safe_step = self._find_safe_step(bomber, state, world, last_step=last_step,
-                                            ignore_reservations=ignore_res)
-            if safe_step:
-                reserved = self.soft_reserve(safe_step, bomber.id, safe_step, current_tick)
-                if reserved or ignore_res:
-                    self.last_steps[bomber.id] = safe_step
-                    mode = "FORCE MOVE" if ignore_res else "SOFT RESERVED"
-                    logger.info(
-                        f"🔄 {bomber.id[:8]} [{role.value}]: Always-act fallback: "
-                        f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
-                    )
-                    result = ([safe_step], None)
-                    self.planned_actions[bomber.id] = result
-                    return result
+            path = self.bfs_path(bomber.pos, target, state, world, max_length=15)
+            if path and self.soft_reserve(target, bomber.id, path[0], ctx.current_tick):
+                logger.debug(
+                    "🗺️  %s: Exploration path: (%d,%d) → (%d,%d) (%d steps) [SOFT RESERVED]",
+                    tag, bomber.pos.x, bomber.pos.y, target.x, target.y, len(path)
+                )
+                return path, None
         
-        # Final always-act fallback (should rarely reach here)
-        final_stuck = self.no_target_count.get(bomber.id, 0)
-        ignore_res = final_stuck >= 20
+        # If all exploration directions failed, try open space fallback
+        logger.debug("🔄 %s: Exploration failed, trying open space fallback", tag)
+        return None
+    
+    def _strat_scout_open_space(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                                ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Scout fallback: move to open space"""
+        path = self._open_space_path(bomber, state, world, ctx, max_length=20)
+        return (path, None) if path is not None else None
+    
+    def _strat_scout_safe_step(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                               ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Always-act fallback for scouts too"""
+        safe_step, ignore_res = self._take_safe_step(
+            bomber, state, world, ctx, self.no_target_count.get(bomber.id, 0)
+        )
+        if safe_step is None:
+            return None
+        mode = "FORCE MOVE" if ignore_res else "SOFT RESERVED"
+        logger.info(
+            f"🔄 {ctx.tag}: Always-act fallback: "
+            f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
+        )
+        return [safe_step], None
+    
+    def _strat_final_safe_step(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                               ctx: "_PlanContext") -> Optional[Tuple[List[Position], None]]:
+        """Final always-act fallback (should rarely reach here)"""
+        safe_step, ignore_res = self._take_safe_step(
+            bomber, state, world, ctx, self.no_target_count.get(bomber.id, 0)
+        )
+        if safe_step is None:
+            return None
+        mode = "FORCE MOVE" if ignore_res else "SOFT RESERVED"
+        logger.warning(
+            f"⚠️  {ctx.tag}: Final always-act fallback: "
+            f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
+        )
+        return [safe_step], None
+    
+    def _open_space_path(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                         ctx: "_PlanContext", max_length: int) -> Optional[List[Position]]:
+        """Path to an unreserved open-space tile, SOFT reserved; None if unavailable"""
+        open_space = self._find_open_space(bomber, state, world, exclude_reserved=True)
+        if not open_space or self.is_reserved(open_space, bomber.id):
+            return None
+        path = self.bfs_path(bomber.pos, open_space, state, world, max_length=max_length)
+        if not path:
+            return None
+        first_step = path[0]
+        if not self.soft_reserve(open_space, bomber.id, first_step, ctx.current_tick):
+            return None
+        self.last_steps[bomber.id] = first_step
+        logger.info(
+            f"🗺️  {ctx.tag}: Fallback path to open space: "
+            f"({bomber.pos.x},{bomber.pos.y}) → ({open_space.x},{open_space.y}) "
+            f"({len(path)} steps) [SOFT RESERVED]"
+        )
+        return path
+    
+    def _take_safe_step(self, bomber: Bomber, state: ArenaState, world: WorldMemory,
+                        ctx: "_PlanContext", stuck_count: int) -> Tuple[Optional[Position], bool]:
+        """
+        Single safe step for the always-act fallbacks. Returns (step, ignore_res);
+        when very stuck (failures >= 20) the step is taken even if its SOFT reservation fails.
+        """
+        ignore_res = stuck_count >= 20
         last_step = self.last_steps.get(bomber.id)
         safe_step = self._find_safe_step(bomber, state, world, last_step=last_step,
-                                        ignore_reservations=ignore_res)
-        if safe_step:
-            reserved = self.soft_reserve(safe_step, bomber.id, safe_step, current_tick)
-            if reserved or ignore_res:
-                self.last_steps[bomber.id] = safe_step
-                mode = "FORCE MOVE" if ignore_res else "SOFT RESERVED"
-                logger.warning(
-                    f"⚠️  {bomber.id[:8]} [{role.value}]: Final always-act fallback: "
-                    f"single safe step to ({safe_step.x},{safe_step.y}) [{mode}]"
-                )
-                result = ([safe_step], None)
-                self.planned_actions[bomber.id] = result
-                return result
-        
-        logger.debug(f"⏸️  {bomber.id[:8]} [{role.value}]: No action planned (truly no safe move)")
-        return None, None
-
+                                         ignore_reservations=ignore_res)
+        if not safe_step:
+            return None, ignore_res
+        reserved = self.soft_reserve(safe_step, bomber.id, safe_step, ctx.current_tick)
+        if not (reserved or ignore_res):
+            return None, ignore_res
+        self.last_steps[bomber.id] = safe_step
+        return safe_step, ignore_res
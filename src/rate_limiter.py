@@ -4,9 +4,12 @@ Global rate limiter and request scheduler with 429 handling
 import time
 import random
 import logging
-from typing import Optional, Dict, Any, List
-from collections import deque
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import count
 from threading import Lock
+import heapq
 import requests
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,9 @@ class RateLimiter:
     Supports Retry-After header.
     """
     
+    # Exponential backoff multipliers by consecutive 429 count (2^0 .. 2^5), indexed instead of pow()
+    _BACKOFF_STEPS = tuple(1 << i for i in range(6))
+    
     def __init__(self, base_rate: float = 3.0, capacity: float = 3.0):
         """
         Args:
@@ -27,27 +33,36 @@ class RateLimiter:
         self.base_rate = base_rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_update = time.time()
+        self.last_update = time.monotonic()  # Monotonic: wall-clock jumps can't skew refill/backoff
         self.lock = Lock()
         
-        # 429 backoff state
+        # 429 backoff state (monotonic deadline)
         self.backoff_until = 0.0
         self.consecutive_429s = 0
+        self.max_backoff = 60.0  # Cap for jittered backoff (seconds)
+        self.prev_backoff: Optional[float] = None  # Last jittered backoff, None until a 429
+    
+    def _refill(self, now: float):
+        """Add tokens earned since last_update (caller holds the lock)"""
+        if self.tokens >= self.capacity:
+            self.last_update = now  # Full bucket: refill would only clamp back to capacity
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.base_rate)
+        self.last_update = now
     
     def acquire(self, tokens: float = 1.0) -> bool:
         """Try to acquire tokens, returns True if successful"""
+        now = time.monotonic()
+        # Lock-free early out while backing off: a single float read is atomic under the GIL
+        if now < self.backoff_until:
+            return False
+        
         with self.lock:
-            now = time.time()
-            
-            # Check if we're in backoff period
+            # Re-check: handle_429 may have moved the deadline since the unlocked read
             if now < self.backoff_until:
                 return False
             
-            # Update tokens
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.base_rate)
-            self.last_update = now
-            
+            self._refill(now)
             if self.tokens >= tokens:
                 self.tokens -= tokens
                 return True
@@ -55,18 +70,20 @@ class RateLimiter:
     
     def wait_time(self, tokens: float = 1.0) -> float:
         """Calculate wait time needed for tokens"""
+        now = time.monotonic()
+        # Lock-free early out while backing off
+        backoff_until = self.backoff_until
+        if now < backoff_until:
+            return backoff_until - now
+        
         with self.lock:
-            now = time.time()
-            
-            # Check backoff period
             if now < self.backoff_until:
                 return self.backoff_until - now
             
-            # Update tokens
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.base_rate)
-            self.last_update = now
-            
+            # Enough tokens already: refill is lazy, so it can wait for the next acquire
+            if self.tokens >= tokens:
+                return 0.0
+            self._refill(now)
             if self.tokens >= tokens:
                 return 0.0
             return (tokens - self.tokens) / self.base_rate
@@ -77,7 +94,7 @@ class RateLimiter:
         
         Args:
             retry_after: Retry-After header value in seconds (if provided)
-            base_backoff: Base backoff time for exponential backoff
+            base_backoff: Minimum backoff time for jittered backoff
         """
         with self.lock:
             self.consecutive_429s += 1
@@ -85,81 +102,98 @@ class RateLimiter:
             if retry_after is not None:
                 # Use Retry-After header
                 wait_time = retry_after
-                logger.warning(f"⚠️  Rate limited (429), Retry-After={retry_after:.1f}s")
+                logger.warning("⚠️  Rate limited (429), Retry-After=%.1fs", retry_after)
             else:
-                # Exponential backoff with jitter
-                wait_time = base_backoff * (2 ** min(self.consecutive_429s - 1, 5))
-                jitter = random.uniform(0, wait_time * 0.1)  # 10% jitter
-                wait_time += jitter
+                # Decorrelated jitter: each wait is drawn from [base, 3 * previous wait], so
+                # clients that were throttled together spread out instead of retrying in lockstep.
+                # The exponential schedule bounds the draw (base * 2^n on the n-th 429) so a
+                # streak can't grow faster; bounding rather than clamping keeps every wait random.
+                prev = self.prev_backoff if self.prev_backoff is not None else base_backoff
+                hi = min(self.max_backoff, prev * 3,
+                         base_backoff * self._BACKOFF_STEPS[min(self.consecutive_429s, 5)])
+                wait_time = random.uniform(base_backoff, hi)
+                self.prev_backoff = wait_time
                 logger.warning(
-                    f"⚠️  Rate limited (429), exponential backoff: {wait_time:.2f}s "
-                    f"(consecutive={self.consecutive_429s})"
+                    "⚠️  Rate limited (429), jittered backoff: %.2fs (consecutive=%d)",
+                    wait_time, self.consecutive_429s
                 )
             
-            self.backoff_until = time.time() + wait_time
+            self.backoff_until = time.monotonic() + wait_time
     
     def reset_429(self):
         """Reset 429 counter on successful request"""
         with self.lock:
             if self.consecutive_429s > 0:
-                logger.debug(f"✅ Rate limit recovered (was {self.consecutive_429s} consecutive 429s)")
+                logger.debug("✅ Rate limit recovered (was %d consecutive 429s)", self.consecutive_429s)
                 self.consecutive_429s = 0
+            self.prev_backoff = None
 
 
 class RequestScheduler:
     """
     Request scheduler with queue for /api/move (1 request at a time).
+    The queue is a min-heap of (ready_at, seq, bombers): a request requeued during
+    backoff waits until its ready time while newer ready requests go ahead of it.
+    
+    Single-thread contract: schedule_move and process_queue are both called from the
+    bot's tick loop, so the queue takes no lock. move_in_progress only guards against
+    re-entry from make_request_func. Threaded producers would need a queue.Queue.
     """
     
     def __init__(self, rate_limiter: RateLimiter):
         self.rate_limiter = rate_limiter
-        self.move_queue: deque = deque()
+        self.move_queue: List[Tuple[float, int, List[Dict[str, Any]]]] = []
+        self._seq = count()  # FIFO tie-break among equally ready requests
         self.move_in_progress = False
-        self.lock = Lock()
     
     def schedule_move(self, bombers: List[Dict[str, Any]]) -> bool:
         """
         Schedule a move request. Returns True if queued, False if queue full.
         """
-        with self.lock:
-            if len(self.move_queue) >= 5:  # Max queue size
-                logger.warning(f"⚠️  Move queue full ({len(self.move_queue)}), dropping request")
-                return False
-            
-            self.move_queue.append(bombers)
-            logger.debug(f"📋 Queued move request ({len(bombers)} bombers), queue size: {len(self.move_queue)}")
-            return True
+        if len(self.move_queue) >= 5:  # Max queue size
+            logger.warning("⚠️  Move queue full (%d), dropping request", len(self.move_queue))
+            return False
+        
+        heapq.heappush(self.move_queue, (time.monotonic(), next(self._seq), bombers))
+        logger.debug("📋 Queued move request (%d bombers), queue size: %d", len(bombers), len(self.move_queue))
+        return True
     
     def process_queue(self, make_request_func) -> Optional[Dict[str, Any]]:
         """
         Process next move request from queue.
-        Returns response or None if queue empty or rate limited.
+        Returns response or None if queue empty, head not ready yet or rate limited.
         
         Args:
             make_request_func: Function to make the actual HTTP request
         """
-        with self.lock:
-            if self.move_in_progress:
-                return None  # Already processing
-            
-            if not self.move_queue:
-                return None  # Queue empty
-            
-            self.move_in_progress = True
-            bombers = self.move_queue.popleft()
+        if self.move_in_progress:
+            return None  # Already processing
+        
+        if not self.move_queue:
+            return None  # Queue empty
+        
+        now = time.monotonic()
+        if now < self.rate_limiter.backoff_until:
+            return None  # Whole queue waits out a 429 backoff; nothing is popped
+        
+        if self.move_queue[0][0] > now:
+            return None  # Earliest request is still waiting out its backoff
+        
+        self.move_in_progress = True
+        _, seq, bombers = heapq.heappop(self.move_queue)
         
         try:
             # Wait for rate limit
             wait_time = self.rate_limiter.wait_time()
             if wait_time > 0:
-                logger.debug(f"⏳ Waiting {wait_time:.2f}s for rate limit")
+                logger.debug("⏳ Waiting %.2fs for rate limit", wait_time)
                 time.sleep(wait_time)
             
             if not self.rate_limiter.acquire():
                 logger.warning("⚠️  Rate limit still active, requeuing move request")
-                with self.lock:
-                    self.move_queue.appendleft(bombers)  # Put back at front
-                    self.move_in_progress = False
+                # Ready again once the backoff ends; newer requests may pass it
+                heapq.heappush(self.move_queue, (time.monotonic(), seq, bombers))
+                self._defer_pending()
                 return None
             
             # Make request
@@ -167,9 +201,41 @@ class RequestScheduler:
             
             if response is not None:
                 self.rate_limiter.reset_429()
+            elif self.rate_limiter.backoff_until > time.monotonic():
+                # The request hit a 429: everything still queued waits out the same backoff
+                self._defer_pending()
             
             return response
         finally:
-            with self.lock:
-                self.move_in_progress = False
+            self.move_in_progress = False
+    
+    def _defer_pending(self):
+        """
+        Push every queued request's ready time to the end of the current backoff (plus
+        one small shared jitter), so the cohort waits once instead of each request
+        waking, sleeping and retrying on its own.
+        """
+        ready_at = max(time.monotonic(), self.rate_limiter.backoff_until) + random.uniform(0, 0.05)
+        self.move_queue = [(max(entry_ready, ready_at), seq, bombers)
+                           for entry_ready, seq, bombers in self.move_queue]
+        heapq.heapify(self.move_queue)
 
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After header value in seconds. Accepts both forms from RFC 9110:
+    delay-seconds ("2.5") and an HTTP-date. Returns None if missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -1,14 +1,26 @@
 """
 ReservationManager: 2-phase reservation system (SOFT/HARD) with TTL and rollback
 """
-from typing import Dict, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import heapq
 import logging
 from src.models import Position
 
 logger = logging.getLogger(__name__)
 
+# Bomber ids are stable for a whole game, so their 8-char log prefixes are sliced once
+_SHORT_OWNER: Dict[str, str] = {}
+
+
+def _short(owner: str) -> str:
+    """owner[:8] for log messages, memoized per owner id"""
+    short = _SHORT_OWNER.get(owner)
+    if short is None:
+        short = _SHORT_OWNER[owner] = owner[:8]
+    return short
+
 
 class ReservationType(Enum):
     """Reservation type"""
@@ -16,15 +28,19 @@ class ReservationType(Enum):
     HARD = "HARD"  # After successful API confirmation (persists with TTL)
 
 
-@dataclass
+@dataclass(slots=True)
 class Reservation:
-    """Reservation entry"""
+    """Reservation entry (slotted: no per-instance __dict__, faster attribute reads)"""
     pos: Tuple[int, int]
     owner: str  # bomber_id
     reservation_type: ReservationType
     tick_created: int
     ttl: int = 3  # Time to live in ticks
     next_step: Optional[Tuple[int, int]] = None  # First step position if applicable
+    expiry_tick: int = field(init=False)  # tick_created + ttl, the tick the entry expires at
+    
+    def __post_init__(self):
+        self.expiry_tick = self.tick_created + self.ttl
 
 
 class ReservationManager:
@@ -35,19 +51,84 @@ class ReservationManager:
     """
     
     def __init__(self):
-        # SOFT reservations (cleared each tick)
-        self.soft_reservations: Dict[Tuple[int, int], Reservation] = {}
+        # All reservations, SOFT and HARD, in one table: is_reserved() is a single lookup.
+        # A tile holds at most one reservation; HARD replaces SOFT on upgrade.
+        self.reservations: Dict[Tuple[int, int], Reservation] = {}
+        
+        # Tiles that got a SOFT entry this tick (cleared each tick)
+        self._soft_keys: Set[Tuple[int, int]] = set()
         
-        # HARD reservations (persist with TTL)
-        self.hard_reservations: Dict[Tuple[int, int], Reservation] = {}
+        # Min-heap of (expiry_tick, pos) so expiry only touches due entries; entries are
+        # validated against the table on pop (re-reserved/rolled back ones are stale)
+        self._expiry_heap: List[Tuple[int, Tuple[int, int]]] = []
         
-        # Track reservations by owner for rollback
-        self.owner_reservations: Dict[str, Set[Tuple[int, int]]] = {}
+        # Tiles each owner holds, for rollback. A bomber holds 1-3 tiles, so a short list
+        # with linear scans beats a set (no tuple hashing). SOFT tiles are tracked apart
+        # and dropped wholesale each tick; HARD tiles leave their list on expiry/takeover.
+        self.soft_owner_reservations: Dict[str, List[Tuple[int, int]]] = {}
+        self.hard_owner_reservations: Dict[str, List[Tuple[int, int]]] = {}
+    
+    @staticmethod
+    def _track(by_owner: Dict[str, List[Tuple[int, int]]], owner: str, pos_tuple: Tuple[int, int]):
+        """Record that owner holds pos_tuple"""
+        owned = by_owner.get(owner)
+        if owned is None:
+            by_owner[owner] = [pos_tuple]
+        elif pos_tuple not in owned:
+            owned.append(pos_tuple)
+    
+    @staticmethod
+    def _untrack(by_owner: Dict[str, List[Tuple[int, int]]], owner: str, pos_tuple: Tuple[int, int]):
+        """Forget that owner holds pos_tuple"""
+        owned = by_owner.get(owner)
+        if owned is not None and pos_tuple in owned:
+            owned.remove(pos_tuple)
+    
+    def clear(self):
+        """Drop every SOFT and HARD reservation (new round)"""
+        self.reservations.clear()
+        self._soft_keys.clear()
+        self._expiry_heap.clear()
+        self.soft_owner_reservations.clear()
+        self.hard_owner_reservations.clear()
     
     def reset_soft_reservations(self):
         """Clear all SOFT reservations (called at start of each tick)"""
-        self.soft_reservations.clear()
-        logger.debug(f"🔄 Cleared {len(self.soft_reservations)} SOFT reservations")
+        cleared = 0
+        for pos_tuple in self._soft_keys:
+            existing = self.reservations.get(pos_tuple)
+            if existing is not None and existing.reservation_type is ReservationType.SOFT:
+                del self.reservations[pos_tuple]
+                cleared += 1
+        self._soft_keys.clear()
+        self.soft_owner_reservations.clear()
+        logger.debug("🔄 Cleared %d SOFT reservations", cleared)
+    
+    def _conflict(self, pos_tuple: Tuple[int, int], owner: str) -> Optional[Reservation]:
+        """Reservation of pos_tuple held by another owner, if any"""
+        existing = self.reservations.get(pos_tuple)
+        if existing is not None and existing.owner != owner:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("⏸️  %s: Position %s %s reserved by %s", _short(owner), pos_tuple,
+                             existing.reservation_type.value, _short(existing.owner))
+            return existing
+        return None
+    
+    def _put_soft(self, pos_tuple: Tuple[int, int], owner: str,
+                  next_step: Optional[Tuple[int, int]], current_tick: int):
+        """Write a SOFT entry (caller checked conflicts); an own HARD entry is kept as is"""
+        existing = self.reservations.get(pos_tuple)
+        if existing is None or existing.reservation_type is ReservationType.SOFT:
+            self.reservations[pos_tuple] = Reservation(
+                pos=pos_tuple,
+                owner=owner,
+                reservation_type=ReservationType.SOFT,
+                tick_created=current_tick,
+                ttl=1,  # SOFT reservations last only current tick
+                next_step=next_step
+            )
+            self._soft_keys.add(pos_tuple)
+            self._track(self.soft_owner_reservations, owner, pos_tuple)
     
     def soft_reserve(self, pos: Position, owner: str, next_step: Optional[Position] = None, 
                     current_tick: int = 0) -> bool:
@@ -56,41 +137,36 @@ class ReservationManager:
         Returns True if successful, False if already reserved by another agent.
         """
         pos_tuple = pos.to_tuple()
+        if self._conflict(pos_tuple, owner):
+            return False
         
-        # Check if already reserved by another agent
-        if pos_tuple in self.soft_reservations:
-            existing = self.soft_reservations[pos_tuple]
-            if existing.owner != owner:
-                logger.debug(f"⏸️  {owner[:8]}: Position {pos_tuple} SOFT reserved by {existing.owner[:8]}")
-                return False
-        
-        # Check HARD reservations
-        if pos_tuple in self.hard_reservations:
-            existing = self.hard_reservations[pos_tuple]
-            if existing.owner != owner:
-                logger.debug(f"⏸️  {owner[:8]}: Position {pos_tuple} HARD reserved by {existing.owner[:8]}")
+        self._put_soft(pos_tuple, owner, next_step.to_tuple() if next_step else None, current_tick)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📍 %s: SOFT reserved %s", _short(owner), pos_tuple)
+        return True
+
+    def soft_reserve_pair(self, dest: Position, first_step: Optional[Position], owner: str,
+                          current_tick: int = 0) -> bool:
+        """
+        SOFT reserve destination and first step together (all-or-nothing).
+        Both tiles are checked before either is written, so a conflict on the
+        first step no longer leaves the destination reserved.
+        """
+        dest_tuple = dest.to_tuple()
+        step_tuple = first_step.to_tuple() if first_step else None
+        wanted = (dest_tuple,) if step_tuple is None or step_tuple == dest_tuple else (dest_tuple, step_tuple)
+
+        for pos_tuple in wanted:
+            if self._conflict(pos_tuple, owner):
                 return False
-        
-        # Create SOFT reservation
-        reservation = Reservation(
-            pos=pos_tuple,
-            owner=owner,
-            reservation_type=ReservationType.SOFT,
-            tick_created=current_tick,
-            ttl=1,  # SOFT reservations last only current tick
-            next_step=next_step.to_tuple() if next_step else None
-        )
-        
-        self.soft_reservations[pos_tuple] = reservation
-        
-        # Track by owner
-        if owner not in self.owner_reservations:
-            self.owner_reservations[owner] = set()
-        self.owner_reservations[owner].add(pos_tuple)
-        
-        logger.debug(f"📍 {owner[:8]}: SOFT reserved {pos_tuple}")
+
+        for pos_tuple in wanted:
+            self._put_soft(pos_tuple, owner, step_tuple if pos_tuple == dest_tuple else None, current_tick)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📍 %s: SOFT reserved %s", _short(owner), wanted)
         return True
-    
+
     def hard_reserve(self, pos: Position, owner: str, next_step: Optional[Position] = None,
                     current_tick: int = 0, ttl: int = 3) -> bool:
         """
@@ -99,11 +175,12 @@ class ReservationManager:
         """
         pos_tuple = pos.to_tuple()
         
-        # Remove SOFT reservation if exists (upgrade to HARD)
-        if pos_tuple in self.soft_reservations:
-            soft = self.soft_reservations.pop(pos_tuple)
-            if soft.owner != owner:
-                logger.warning(f"⚠️  {owner[:8]}: Upgrading SOFT reservation from different owner {soft.owner[:8]}")
+        # Replaces a SOFT reservation if one exists (upgrade to HARD)
+        existing = self.reservations.get(pos_tuple)
+        if existing is not None and existing.owner != owner:
+            if existing.reservation_type is ReservationType.SOFT:
+                logger.warning("⚠️  %s: Upgrading SOFT reservation from different owner %s", _short(owner), _short(existing.owner))
+            self._untrack(self.hard_owner_reservations, existing.owner, pos_tuple)
         
         # Create HARD reservation
         reservation = Reservation(
@@ -115,14 +192,12 @@ class ReservationManager:
             next_step=next_step.to_tuple() if next_step else None
         )
         
-        self.hard_reservations[pos_tuple] = reservation
+        self.reservations[pos_tuple] = reservation
+        heapq.heappush(self._expiry_heap, (reservation.expiry_tick, pos_tuple))
         
-        # Track by owner
-        if owner not in self.owner_reservations:
-            self.owner_reservations[owner] = set()
-        self.owner_reservations[owner].add(pos_tuple)
+        self._track(self.hard_owner_reservations, owner, pos_tuple)
         
-        logger.info(f"✅ {owner[:8]}: HARD reserved {pos_tuple} (TTL={ttl})")
+        logger.info("✅ %s: HARD reserved %s (TTL=%d)", _short(owner), pos_tuple, ttl)
         return True
     
     def is_reserved(self, pos: Position, owner: Optional[str] = None) -> bool:
@@ -130,72 +205,54 @@ class ReservationManager:
         Check if position is reserved.
         If owner is provided, returns False if reserved by that owner (self-reservation allowed).
         """
-        pos_tuple = pos.to_tuple()
-        
-        # Check SOFT reservations
-        if pos_tuple in self.soft_reservations:
-            existing = self.soft_reservations[pos_tuple]
-            if owner and existing.owner == owner:
-                return False  # Self-reservation is allowed
-            return True
-        
-        # Check HARD reservations
-        if pos_tuple in self.hard_reservations:
-            existing = self.hard_reservations[pos_tuple]
-            if owner and existing.owner == owner:
-                return False  # Self-reservation is allowed
-            return True
-        
-        return False
+        return self.is_reserved_xy(pos.x, pos.y, owner)
+    
+    def is_reserved_xy(self, x: int, y: int, owner: Optional[str] = None) -> bool:
+        """is_reserved() on raw coordinates, for hot loops that avoid Position allocation"""
+        existing = self.reservations.get((x, y))
+        if existing is None:
+            return False
+        return not (owner and existing.owner == owner)  # Self-reservation is allowed
     
     def rollback_owner(self, owner: str, current_tick: int = 0):
         """
         Rollback all reservations for an owner (e.g., on API failure).
         """
-        if owner not in self.owner_reservations:
-            return
-        
+        owned = self.soft_owner_reservations.pop(owner, []) + self.hard_owner_reservations.pop(owner, [])
         rolled_back = 0
-        for pos_tuple in list(self.owner_reservations[owner]):
-            if pos_tuple in self.soft_reservations:
-                del self.soft_reservations[pos_tuple]
-                rolled_back += 1
-            if pos_tuple in self.hard_reservations:
-                del self.hard_reservations[pos_tuple]
+        for pos_tuple in owned:
+            existing = self.reservations.get(pos_tuple)
+            if existing is not None and existing.owner == owner:
+                del self.reservations[pos_tuple]
                 rolled_back += 1
         
-        del self.owner_reservations[owner]
-        
         if rolled_back > 0:
-            logger.warning(f"🔄 {owner[:8]}: Rolled back {rolled_back} reservations (API failure)")
+            logger.warning("🔄 %s: Rolled back %d reservations (API failure)", _short(owner), rolled_back)
     
     def expire_old_reservations(self, current_tick: int):
         """
         Remove expired HARD reservations (TTL expired).
         """
-        expired = []
-        for pos_tuple, reservation in list(self.hard_reservations.items()):
-            age = current_tick - reservation.tick_created
-            if age >= reservation.ttl:
-                expired.append(pos_tuple)
-                # Remove from owner tracking
-                if reservation.owner in self.owner_reservations:
-                    self.owner_reservations[reservation.owner].discard(pos_tuple)
-        
-        for pos_tuple in expired:
-            del self.hard_reservations[pos_tuple]
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] <= current_tick:
+            _, pos_tuple = heapq.heappop(heap)
+            reservation = self.reservations.get(pos_tuple)
+            if (reservation is None or reservation.reservation_type is not ReservationType.HARD
+                    or reservation.expiry_tick > current_tick):
+                continue  # Stale entry: rolled back, expired already, or re-reserved since
+            del self.reservations[pos_tuple]
+            expired += 1
+            self._untrack(self.hard_owner_reservations, reservation.owner, pos_tuple)
         
         if expired:
-            logger.debug(f"⏰ Expired {len(expired)} HARD reservations (TTL)")
+            logger.debug("⏰ Expired %d HARD reservations (TTL)", expired)
     
     def get_reservation_info(self, pos: Position) -> Optional[str]:
         """Get reservation info for logging"""
-        pos_tuple = pos.to_tuple()
-        if pos_tuple in self.soft_reservations:
-            r = self.soft_reservations[pos_tuple]
-            return f"SOFT by {r.owner[:8]}"
-        if pos_tuple in self.hard_reservations:
-            r = self.hard_reservations[pos_tuple]
-            return f"HARD by {r.owner[:8]} (age={r.tick_created})"
-        return None
-
+        r = self.reservations.get(pos.to_tuple())
+        if r is None:
+            return None
+        if r.reservation_type is ReservationType.SOFT:
+            return f"SOFT by {_short(r.owner)}"
+        return f"HARD by {_short(r.owner)} (age={r.tick_created})"
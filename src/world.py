@@ -1,7 +1,7 @@
 """
 Global map memory - union of all observed tiles
 """
-from typing import Set, Dict, Tuple, Optional
+from typing import FrozenSet, Set, Dict, Tuple, Optional
 from dataclasses import dataclass
 from src.models import Position, ArenaState
 
@@ -15,88 +15,113 @@ class TileInfo:
     last_obstacle_tick: Optional[int] = None  # When obstacle was last seen
 
 
+_VISION_OFFSETS: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+
+def _vision_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """(dx, dy) offsets with |dx|+|dy| <= radius (cached per radius)"""
+    offsets = _VISION_OFFSETS.get(radius)
+    if offsets is None:
+        offsets = tuple(
+            (dx, dy)
+            for dx in range(-radius, radius + 1)
+            for dy in range(-radius, radius + 1)
+            if abs(dx) + abs(dy) <= radius
+        )
+        _VISION_OFFSETS[radius] = offsets
+    return offsets
+
+
 class WorldMemory:
     """Global map memory tracking observed tiles"""
     
     def __init__(self):
         self.tiles: Dict[Tuple[int, int], TileInfo] = {}
         self.obstacle_memory: Dict[Tuple[int, int], int] = {}  # Track when obstacles were destroyed
+        self.observed: Set[Tuple[int, int]] = set()  # Observed tiles (observation never reverts)
+        self.current_tick = 0
+    
+    def reset(self):
+        """Forget the observed map (new round: a different map)"""
+        self.tiles.clear()
+        self.obstacle_memory.clear()
+        self.observed.clear()
         self.current_tick = 0
     
     def update(self, state: ArenaState, tick: int):
         """Update world memory from current arena state"""
         self.current_tick = tick
         
+        # Obstacle/wall sets are built once when the state is parsed and passed by
+        # reference, so visibility marking probes hashed tuples, not the state lists
+        current_obstacles = state.obstacle_set
+        current_walls = state.wall_set
+        
         # Mark all visible tiles as observed
         vision_radius = 5  # Default vision radius
         
         for bomber in state.bombers:
             if bomber.alive:
-                self._mark_visible(bomber.pos, vision_radius, state)
+                self._mark_visible(bomber.pos, vision_radius, state.map_size, current_obstacles, current_walls)
         
         # Update obstacles - if not in current state, mark as destroyed
-        current_obstacles = {obs.to_tuple() for obs in state.obstacles}
         for pos_tuple, tile_info in self.tiles.items():
             if tile_info.is_obstacle and pos_tuple not in current_obstacles:
                 # Obstacle was destroyed
                 self.obstacle_memory[pos_tuple] = tick
                 tile_info.is_obstacle = False
     
-    def _mark_visible(self, center: Position, radius: int, state: ArenaState):
-        """Mark tiles in vision radius as observed"""
+    def _mark_visible(self, center: Position, radius: int, map_size: Tuple[int, int],
+                      obstacles: FrozenSet[Tuple[int, int]], walls: FrozenSet[Tuple[int, int]]):
+        """Mark tiles in vision radius (Manhattan distance) as observed"""
         cx, cy = center.x, center.y
+        map_w, map_h = map_size
+        tiles = self.tiles
         
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                # Check if within vision radius (Manhattan distance)
-                if abs(dx) + abs(dy) > radius:
-                    continue
-                
-                x, y = cx + dx, cy + dy
-                if x < 0 or x >= state.map_size[0] or y < 0 or y >= state.map_size[1]:
-                    continue
-                
-                pos_tuple = (x, y)
-                if pos_tuple not in self.tiles:
-                    self.tiles[pos_tuple] = TileInfo(is_observed=False)
-                
-                tile = self.tiles[pos_tuple]
+        for dx, dy in _vision_offsets(radius):
+            x, y = cx + dx, cy + dy
+            if x < 0 or x >= map_w or y < 0 or y >= map_h:
+                continue
+            
+            pos_tuple = (x, y)
+            tile = tiles.get(pos_tuple)
+            if tile is None:
+                tile = tiles[pos_tuple] = TileInfo()
+            if not tile.is_observed:
                 tile.is_observed = True
-                
-                # Update obstacle status
-                pos_obj = Position(x, y)
-                if pos_obj in state.obstacles:
-                    tile.is_obstacle = True
-                    tile.last_obstacle_tick = self.current_tick
-                elif pos_obj in state.walls:
-                    tile.is_wall = True
+                self.observed.add(pos_tuple)
+            
+            # Update obstacle status
+            if pos_tuple in obstacles:
+                tile.is_obstacle = True
+                tile.last_obstacle_tick = self.current_tick
+            elif pos_tuple in walls:
+                tile.is_wall = True
     
     def is_blocked(self, pos: Position) -> bool:
         """Check if position is blocked. Unknown is considered free to allow exploration."""
-        pos_tuple = pos.to_tuple()
-        
-        if pos_tuple not in self.tiles:
+        return self.is_blocked_xy(pos.x, pos.y)
+    
+    def is_blocked_xy(self, x: int, y: int) -> bool:
+        """is_blocked() on raw coordinates, for hot loops that avoid Position allocation"""
+        tile = self.tiles.get((x, y))
+        if tile is None:
             return False  # Unknown -> explore
         
-        tile = self.tiles[pos_tuple]
         # Block walls and known obstacles; allow empty/unknown for exploration
         return tile.is_wall or tile.is_obstacle
     
     def is_obstacle(self, pos: Position) -> bool:
         """Check if position has an obstacle"""
-        pos_tuple = pos.to_tuple()
-        if pos_tuple not in self.tiles:
-            return False
-        return self.tiles[pos_tuple].is_obstacle
+        tile = self.tiles.get(pos)
+        return tile is not None and tile.is_obstacle
     
     def was_obstacle_destroyed(self, pos: Position, since_tick: int) -> bool:
         """Check if obstacle was destroyed since given tick"""
-        pos_tuple = pos.to_tuple()
-        if pos_tuple not in self.obstacle_memory:
-            return False
-        return self.obstacle_memory[pos_tuple] > since_tick
+        destroyed_tick = self.obstacle_memory.get(pos)
+        return destroyed_tick is not None and destroyed_tick > since_tick
     
     def get_observed_area(self) -> Set[Tuple[int, int]]:
-        """Get set of all observed tile positions"""
-        return {pos for pos, tile in self.tiles.items() if tile.is_observed}
+        """Get set of all observed tile positions (maintained incrementally; don't mutate)"""
+        return self.observed
 
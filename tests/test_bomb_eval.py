@@ -1,6 +1,7 @@
 """
 Tests for bomb evaluation and scoring
 """
+import dataclasses
 import pytest
 from bot.models import Position
 from bot.strategy.planner import Planner
@@ -61,6 +62,34 @@ def test_k_value_calculation():
     assert k == 2
 
 
+def test_bomb_tile_evaluation_shared_per_state(monkeypatch):
+    """Bombers planning against the same state reuse each tile's retreat search"""
+    state = ArenaState(
+        bombers=[], enemies=[], mobs=[],
+        obstacles=[Position(5, 4), Position(6, 5)],
+        walls=[], bombs=[], map_size=(20, 20),
+        round_name="test", raw_score=0, player_name="test"
+    )
+    danger = DangerMap()
+    danger.update(state)
+    planner = Planner()
+
+    searches = []
+    original = danger.get_safe_retreat_position
+    monkeypatch.setattr(danger, "get_safe_retreat_position",
+                        lambda *args, **kwargs: searches.append(args[0]) or original(*args, **kwargs))
+
+    first = planner._evaluate_bomb_tile(Position(5, 5), None, state, None, danger, False)
+    second = planner._evaluate_bomb_tile(Position(5, 5), None, state, None, danger, True)
+    assert first == second and first[2] == 2
+    assert len(searches) == 1
+
+    # A new state starts a fresh memo
+    next_state = dataclasses.replace(state)
+    planner._evaluate_bomb_tile(Position(5, 5), None, next_state, None, danger, False)
+    assert len(searches) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
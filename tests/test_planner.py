@@ -4,7 +4,7 @@ Unit tests for planner module
 import pytest
 from src.models import Position, ArenaState, Bomber, Bomb
 from src.planner import Planner
-from src.world import WorldMemory
+from src.world import TileInfo, WorldMemory
 
 
 def test_bomb_tile_scoring_single_obstacle():
@@ -182,6 +182,370 @@ def test_bfs_path_max_length():
         assert len(path) <= 30
 
 
+def test_escape_cache_invalidated_by_world_change():
+    """Cached escape search must not survive a change in blocking tiles"""
+    planner = Planner()
+    world = WorldMemory()
+    
+    state = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(5, 5), Position(3, 5)],
+        walls=[],
+        bombs=[],
+        map_size=(20, 20),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    first = planner.score_bomb_tile(Position(4, 5), state, world)
+    again = planner.score_bomb_tile(Position(4, 5), state, world)
+    assert first is not None and again is not None
+    assert again.escape_pos == first.escape_pos
+    
+    # Surround the bomb tile so no escape exists any more
+    walled = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(5, 5), Position(3, 5), Position(4, 4), Position(4, 6)],
+        walls=[],
+        bombs=[],
+        map_size=(20, 20),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    target = planner.score_bomb_tile(Position(4, 5), walled, world)
+    assert target is None or target.escape_pos != first.escape_pos
+
+
+def test_path_cache_invalidated_by_new_bomb():
+    """A cached path must not be reused once a bomb blocks it"""
+    planner = Planner()
+    world = WorldMemory()
+    
+    def corridor(bombs):
+        return ArenaState(
+            bombers=[],
+            enemies=[],
+            mobs=[],
+            obstacles=[],
+            walls=[],
+            bombs=bombs,
+            map_size=(5, 1),
+            round_name="test",
+            raw_score=0,
+            player_name="test"
+        )
+    
+    open_state = corridor([])
+    path = planner.bfs_path(Position(0, 0), Position(4, 0), open_state, world)
+    assert path is not None and len(path) == 4
+    
+    blocked_state = corridor([Bomb(pos=Position(2, 0), timer=3.0, range=1)])
+    assert planner.bfs_path(Position(0, 0), Position(4, 0), blocked_state, world) is None
+
+
+def test_blacklist_cleanup_keeps_refreshed_entries():
+    """Re-blacklisting a tile extends its cooldown past the old heap entry"""
+    planner = Planner()
+    target = Position(3, 3)
+    
+    planner._blacklist_target(target, current_tick=0)
+    planner._blacklist_target(target, current_tick=5)
+    
+    # First expiry passed, refreshed expiry still pending
+    planner._cleanup_blacklist(planner.target_cooldown)
+    assert target.to_tuple() in planner.target_blacklist
+    
+    planner._cleanup_blacklist(5 + planner.target_cooldown)
+    assert target.to_tuple() not in planner.target_blacklist
+
+
+def test_assign_roles_reassigns_on_roster_swap():
+    """Same headcount but different alive ids must still reassign roles"""
+    planner = Planner()
+    
+    def bomber(bid: str, alive: bool = True) -> Bomber:
+        return Bomber(id=bid, pos=Position(0, 0), alive=alive, can_move=True,
+                      bombs_available=1, armor=0, safe_time=0)
+    
+    planner.assign_roles([bomber("a"), bomber("b"), bomber("c")])
+    assert set(planner.roles) == {"a", "b", "c"}
+    
+    planner.assign_roles([bomber("a", alive=False), bomber("b"), bomber("c"), bomber("d")])
+    assert set(planner.roles) == {"b", "c", "d"}
+
+
+def test_obstacles_near_matches_linear_scan():
+    """Bucketed obstacle lookup returns the same obstacles, in state order"""
+    planner = Planner()
+    world = WorldMemory()
+    obstacles = [Position(x, y) for x in range(0, 40, 3) for y in range(0, 40, 5)]
+    state = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=obstacles,
+        walls=[],
+        bombs=[],
+        map_size=(40, 40),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    for (x, y, radius) in [(0, 0, 8), (17, 21, 8), (39, 39, 25), (20, 20, 2)]:
+        expected = [o for o in obstacles if abs(o.x - x) + abs(o.y - y) <= radius]
+        assert planner._obstacles_near(state, world, x, y, radius) == expected
+
+
+def test_first_obstacle_on_ray():
+    """Ray lookup finds the nearest obstacle within range and respects known walls"""
+    from src.world import TileInfo
+    planner = Planner()
+    world = WorldMemory()
+    state = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(5, 3), Position(8, 3), Position(3, 0)],
+        walls=[],
+        bombs=[],
+        map_size=(10, 10),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    assert planner._first_obstacle_on_ray(state, world, 3, 3, 1, 0, 3) == 2
+    assert planner._first_obstacle_on_ray(state, world, 3, 3, 1, 0, 1) is None
+    assert planner._first_obstacle_on_ray(state, world, 3, 3, -1, 0, 3) is None
+    assert planner._first_obstacle_on_ray(state, world, 3, 3, 0, -1, 3) == 3
+    
+    # A known wall in between stops the ray (seen on the next tick)
+    world.tiles[(4, 3)] = TileInfo(is_wall=True, is_observed=True)
+    world.current_tick = 1
+    assert planner._first_obstacle_on_ray(state, world, 3, 3, 1, 0, 3) is None
+
+
+def test_ally_blast_risk_marks_cross_around_allies():
+    """Bomb tiles next to an alive ally map to that ally's id"""
+    planner = Planner()
+    world = WorldMemory()
+    state = ArenaState(
+        bombers=[
+            Bomber(id="a", pos=Position(2, 2), alive=True, can_move=True,
+                   bombs_available=1, armor=0, safe_time=0),
+            Bomber(id="b", pos=Position(0, 0), alive=True, can_move=True,
+                   bombs_available=1, armor=0, safe_time=0),
+            Bomber(id="dead", pos=Position(6, 6), alive=False, can_move=True,
+                   bombs_available=1, armor=0, safe_time=0),
+        ],
+        enemies=[],
+        mobs=[],
+        obstacles=[],
+        walls=[],
+        bombs=[],
+        map_size=(10, 10),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    risk = planner._ally_blast_risk(state, world)
+    for tile in [(2, 1), (2, 3), (1, 2), (3, 2)]:
+        assert risk[tile] == ["a"]
+    assert risk[(1, 0)] == ["b"] and risk[(0, 1)] == ["b"]
+    assert (2, 2) not in risk  # Range-1 cross doesn't include the ally's own tile
+    assert (6, 5) not in risk  # Dead bombers don't count
+
+
+def test_density_grid_matches_count_obstacles_near():
+    """Per-tick density grid agrees with the per-tile disc count"""
+    planner = Planner()
+    world = WorldMemory()
+    state = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(0, 0), Position(3, 4), Position(4, 4), Position(9, 2), Position(6, 8)],
+        walls=[],
+        bombs=[],
+        map_size=(10, 10),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    
+    density = planner._density_grid(state, world, 3)
+    for y in range(10):
+        for x in range(10):
+            assert density[y * 10 + x] == planner._count_obstacles_near(state, world, x, y, 3)
+
+
+def test_distance_field_answers_bfs_path():
+    """Paths read from a precomputed distance field match a fresh search"""
+    from src.world import TileInfo
+    world = WorldMemory()
+    state = ArenaState(
+        bombers=[],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(2, y) for y in range(0, 8)] + [Position(5, 3)],
+        walls=[],
+        bombs=[Bomb(pos=Position(4, 8), range=1, timer=2.0)],
+        map_size=(10, 10),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    for obs in state.obstacles:
+        world.tiles[obs.to_tuple()] = TileInfo(is_obstacle=True, is_observed=True)
+    start = Position(0, 0)
+    with_field = Planner()
+    with_field._distance_field(start, state, world)
+    plain = Planner()
+    
+    for goal in [Position(9, 9), Position(6, 3), Position(5, 3), Position(4, 8), Position(1, 9)]:
+        for max_length in (5, 14, 30):
+            a = with_field.bfs_path(start, goal, state, world, max_length=max_length)
+            b = plain.bfs_path(start, goal, state, world, max_length=max_length)
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert len(a) == len(b) and a[-1] == goal
+    # The obstacle column forces a detour down through row 8/9
+    assert len(with_field.bfs_path(start, Position(3, 0), state, world, max_length=30)) > 3
+
+
+def test_strategy_stats_collected_only_at_debug(caplog):
+    """plan_move times its strategies only while DEBUG logging is enabled"""
+    import logging
+    state = ArenaState(
+        bombers=[Bomber(id="farmer01", pos=Position(1, 1), alive=True, can_move=True,
+                        bombs_available=1, armor=0, safe_time=0)],
+        enemies=[],
+        mobs=[],
+        obstacles=[Position(6, 6)],
+        walls=[],
+        bombs=[],
+        map_size=(10, 10),
+        round_name="test",
+        raw_score=0,
+        player_name="test"
+    )
+    bomber = state.bombers[0]
+    
+    planner = Planner()
+    planner.assign_roles(state.bombers)
+    with caplog.at_level(logging.INFO, logger="src.planner"):
+        planner.plan_move(bomber, state, WorldMemory(), 1)
+    assert planner.strategy_stats == {}
+    
+    planner = Planner()
+    planner.assign_roles(state.bombers)
+    with caplog.at_level(logging.DEBUG, logger="src.planner"):
+        planner.plan_move(bomber, state, WorldMemory(), 1)
+        stats = dict(planner.strategy_stats)
+        planner.log_strategy_stats()
+    assert stats["_strat_immediate_bomb"][0] == 1
+    assert sum(hits for _, hits, _ in stats.values()) <= 1
+    assert planner.strategy_stats == {}
+    assert "Strategy time" in caplog.text
+
+
+def test_parse_reuses_unchanged_geometry():
+    """Equal wall/obstacle lists across ticks share parsed Positions; a changed list is re-parsed"""
+    from src.models import parse_arena_response
+    
+    def arena(obstacles):
+        return {"arena": {"walls": [[0, 0], [1, 0]], "obstacles": obstacles}, "map_size": [5, 5]}
+    
+    first = parse_arena_response(arena([[2, 2], [3, 3]]))
+    second = parse_arena_response(arena([[2, 2], [3, 3]]))
+    assert second.walls is first.walls and second.wall_set is first.wall_set
+    assert second.obstacles is first.obstacles
+    
+    third = parse_arena_response(arena([[2, 2]]))
+    assert third.obstacles == [Position(2, 2)] and third.obstacle_set == {(2, 2)}
+    assert third.walls is first.walls
+
+
+def test_reset_round_plans_like_a_fresh_planner():
+    """After reset_round() a reused Planner/WorldMemory plan a new map exactly as new instances do"""
+    def arena(round_name, bomber_pos, obstacles, map_size):
+        bomber = Bomber(id="bomber1", pos=bomber_pos, alive=True, can_move=True,
+                        bombs_available=1, armor=0, safe_time=0)
+        return ArenaState(bombers=[bomber], enemies=[], mobs=[], obstacles=obstacles, walls=[],
+                          bombs=[], map_size=map_size, round_name=round_name, raw_score=0,
+                          player_name="test")
+    
+    def plan_ticks(planner, world, state, ticks):
+        plans = []
+        for tick in ticks:
+            planner.reset_soft_reservations()
+            world.update(state, tick)
+            planner.assign_roles(state.bombers)
+            plans.append(planner.plan_all(state.bombers, state, world, tick))
+        return plans
+    
+    first = arena("round-1", Position(3, 3), [Position(4, 3), Position(3, 5)], (12, 12))
+    second = arena("round-2", Position(10, 10), [Position(11, 10), Position(10, 12)], (20, 16))
+    
+    planner, world = Planner(), WorldMemory()
+    plan_ticks(planner, world, first, range(1, 6))
+    # Round-1 leftovers that would skew round 2: blacklisted tiles and a wall on its path
+    for obstacle in second.obstacles:
+        planner._blacklist_target(obstacle, 5)
+    world.tiles[(10, 11)] = TileInfo(is_wall=True, is_observed=True)
+    world.reset()
+    planner.reset_round()
+    assert planner.reservation_manager.reservations == {}
+    assert planner.target_blacklist == {} and planner.roles == {}
+    reused = plan_ticks(planner, world, second, range(1, 4))
+    
+    fresh = plan_ticks(Planner(), WorldMemory(), second, range(1, 4))
+    assert reused == fresh
+
+
+def test_tick_lookups_not_shared_with_a_new_state_at_the_same_tick():
+    """Each fresh state gets its own lookups and signature, even when it reuses a freed state's id()"""
+    planner = Planner()
+    world = WorldMemory()
+    probe = ArenaState(bombers=[], enemies=[], mobs=[], obstacles=[], walls=[], bombs=[],
+                       map_size=(20, 20), round_name="test", raw_score=0, player_name="test")
+    signatures = set()
+    state = None
+    for x in range(1, 20):
+        obstacles = [Position(x, 1)]
+        del state  # Freed right before the next state is allocated, so its id() is reused
+        state = ArenaState(bombers=[], enemies=[], mobs=[], obstacles=obstacles, walls=[],
+                           bombs=[], map_size=(20, 20), round_name="test", raw_score=0,
+                           player_name="test")
+        assert planner._lookups(state, world)['obstacles'] == {(x, 1)}
+        signatures.add(planner._get_world_signature(state, world))
+        planner._lookups(probe, world)  # Lookups let go of the state; only the signature holds it
+    assert len(signatures) == 19
+
+
+def test_obstacle_buckets_follow_the_obstacle_list():
+    """A same-sized obstacle list in a new state (even at a reused id()) gets fresh buckets"""
+    planner = Planner()
+    world = WorldMemory()
+    state = None
+    for x in range(1, 20):
+        obstacles = [Position(x, 1)]
+        del state  # Freed right before the next state is allocated, so its id() is reused
+        state = ArenaState(bombers=[], enemies=[], mobs=[], obstacles=obstacles, walls=[],
+                           bombs=[], map_size=(20, 20), round_name="test", raw_score=0,
+                           player_name="test")
+        assert planner._obstacles_near(state, world, x, 1, 2) == obstacles
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -3,9 +3,23 @@ Tests for rate limiter
 """
 import pytest
 import time
+from types import SimpleNamespace
+
+import bot.rate_limiter
 from bot.rate_limiter import RateLimiter
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Manually advanced clock behind bot.rate_limiter, so refill/backoff tests don't sleep"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(bot.rate_limiter, "time", SimpleNamespace(
+        time=lambda: clock.now,
+        monotonic=lambda: clock.now,
+    ))
+    return clock
+
+
 def test_rate_limiter_initial_state():
     """Test rate limiter initial state"""
     limiter = RateLimiter(rate=3.0, capacity=3.0)
@@ -19,7 +33,7 @@ def test_rate_limiter_initial_state():
     assert not limiter.acquire()
 
 
-def test_rate_limiter_token_refill():
+def test_rate_limiter_token_refill(fake_clock):
     """Test that tokens refill over time"""
     limiter = RateLimiter(rate=3.0, capacity=3.0)
     
@@ -30,13 +44,31 @@ def test_rate_limiter_token_refill():
     assert not limiter.acquire()
     
     # Wait for refill (1 second = 3 tokens at rate 3.0)
-    time.sleep(1.1)
+    fake_clock.now += 1.1
     
     # Should have tokens again
     assert limiter.acquire()
 
 
-def test_rate_limiter_429_handling():
+def test_rate_limiter_lazy_refill_keeps_credit(fake_clock):
+    """Skipping refill on full buckets / in wait_time neither overfills nor loses tokens"""
+    limiter = RateLimiter(rate=3.0, capacity=3.0)
+
+    # Idle full bucket stays at capacity
+    fake_clock.now += 10.0
+    assert limiter.acquire()
+
+    # Partial refill time is still credited after a wait_time() check
+    fake_clock.now += 0.2
+    assert limiter.wait_time() == 0.0
+    fake_clock.now += 0.2
+    assert limiter.acquire()
+    assert limiter.acquire()
+    assert limiter.acquire()
+    assert not limiter.acquire()
+
+
+def test_rate_limiter_429_handling(fake_clock):
     """Test 429 (rate limit) handling"""
     limiter = RateLimiter(rate=3.0, capacity=3.0)
     
@@ -51,7 +83,7 @@ def test_rate_limiter_429_handling():
     assert not limiter.acquire()
     
     # Wait for backoff to expire
-    time.sleep(1.1)
+    fake_clock.now += 1.1
     
     # Should be able to acquire again
     assert limiter.acquire()
@@ -72,5 +104,107 @@ def test_rate_limiter_reset_429():
     # This test verifies the counter is reset
 
 
+def test_decorrelated_jitter_backoff_bounds():
+    """Jittered 429 backoff stays within [base, 3 * previous] and under the cap"""
+    from src.rate_limiter import RateLimiter as SchedulerRateLimiter
+    limiter = SchedulerRateLimiter()
+    limiter.max_backoff = 4.0
+    
+    prev = 0.5
+    for n in range(20):
+        limiter.handle_429(base_backoff=0.5)
+        # Also bounded by the exponential schedule for the current streak (n + 1 429s)
+        assert 0.5 <= limiter.prev_backoff <= min(4.0, prev * 3, 0.5 * 2 ** min(n + 1, 5))
+        prev = limiter.prev_backoff
+    
+    limiter.reset_429()
+    assert limiter.consecutive_429s == 0
+    assert limiter.prev_backoff is None
+    
+    # Limiters throttled together must not all wait the same time, not even on the first 429
+    first_waits = set()
+    for _ in range(20):
+        fresh = SchedulerRateLimiter()
+        fresh.handle_429(base_backoff=0.5)
+        first_waits.add(fresh.prev_backoff)
+    assert len(first_waits) > 1
+
+
+def test_requeued_move_does_not_block_newer_requests():
+    """A move requeued during backoff waits out its ready time while newer moves go first"""
+    from src.rate_limiter import RateLimiter as SchedulerRateLimiter, RequestScheduler
+    limiter = SchedulerRateLimiter()
+    scheduler = RequestScheduler(limiter)
+    sent = []
+    
+    # First attempt loses the race against a fresh 429: acquire fails after the wait
+    def lose_race(tokens=1.0):
+        limiter.backoff_until = time.monotonic() + 10.0
+        return False
+    limiter.acquire = lose_race
+    limiter.wait_time = lambda tokens=1.0: 0.0
+    assert scheduler.schedule_move([{"id": "old"}])
+    assert scheduler.process_queue(lambda bombers: sent.append(bombers) or {}) is None
+    
+    del limiter.acquire  # Back to the real token bucket
+    limiter.backoff_until = 0.0
+    assert scheduler.schedule_move([{"id": "new"}])
+    assert scheduler.process_queue(lambda bombers: sent.append(bombers) or {}) == {}
+    assert sent == [[{"id": "new"}]]
+    assert len(scheduler.move_queue) == 1  # "old" still parked until its ready time
+
+
+def test_429_defers_whole_queue_to_backoff_end():
+    """After a 429 every queued move waits for the same backoff deadline, none is popped early"""
+    from src.rate_limiter import RateLimiter as SchedulerRateLimiter, RequestScheduler
+    limiter = SchedulerRateLimiter()
+    scheduler = RequestScheduler(limiter)
+    assert scheduler.schedule_move([{"id": "a"}])
+    assert scheduler.schedule_move([{"id": "b"}])
+    
+    def rate_limited(bombers):
+        limiter.handle_429(retry_after=5.0)
+        return None
+    
+    assert scheduler.process_queue(rate_limited) is None
+    assert [entry[2] for entry in scheduler.move_queue] == [[{"id": "b"}]]
+    assert all(entry[0] >= limiter.backoff_until for entry in scheduler.move_queue)
+    # Still backing off: the queue is left alone
+    assert scheduler.process_queue(lambda bombers: {}) is None
+    assert len(scheduler.move_queue) == 1
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    """Retry-After accepts delay-seconds and HTTP-date forms"""
+    from email.utils import format_datetime
+    from datetime import datetime, timedelta, timezone
+    from src.rate_limiter import parse_retry_after
+    
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_ten = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    assert 8.0 <= parse_retry_after(in_ten) <= 10.0
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=10), usegmt=True)
+    assert parse_retry_after(past) == 0.0
+
+
+def test_client_token_bucket_reserve_allows_burst_then_paces(monkeypatch):
+    """Idle credit covers a burst with no sleep; each later request waits out only its own deficit"""
+    import src.client
+    from src.client import TokenBucket
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(src.client, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    bucket = TokenBucket(rate=3.0, capacity=3.0)
+    
+    clock.now += 2.0  # Stalled loop: credit is capped at capacity
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1 / 3)
+    assert bucket.reserve() == pytest.approx(2 / 3)  # Queued behind the previous reservation
+    
+    clock.now += 2 / 3  # Both sleeps done
+    assert bucket.reserve() == pytest.approx(1 / 3)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -105,6 +105,72 @@ def test_hard_reservation_persists_across_ticks():
     assert manager.is_reserved(pos, None) == False
 
 
+def test_is_reserved_xy_matches_is_reserved():
+    """Raw-coordinate check agrees with the Position-based one"""
+    manager = ReservationManager()
+    manager.soft_reserve(Position(3, 4), "agent1", None, 1)
+    manager.hard_reserve(Position(5, 6), "agent2", None, 1, ttl=3)
+    
+    for x, y in [(3, 4), (5, 6), (7, 7)]:
+        for owner in (None, "agent1", "agent2"):
+            assert manager.is_reserved_xy(x, y, owner) == manager.is_reserved(Position(x, y), owner)
+
+
+def test_hard_reservation_renewed_before_expiry_survives():
+    """Re-reserving a tile pushes its expiry out; the earlier expiry entry is ignored"""
+    manager = ReservationManager()
+    pos = Position(10, 10)
+    
+    manager.hard_reserve(pos, "agent1", None, current_tick=1, ttl=2)
+    manager.hard_reserve(pos, "agent1", None, current_tick=2, ttl=3)
+    
+    manager.expire_old_reservations(3)  # First reservation's expiry tick
+    assert manager.is_reserved(pos, None) == True
+    
+    manager.expire_old_reservations(5)
+    assert manager.is_reserved(pos, None) == False
+
+
+def test_soft_reserve_pair_is_all_or_nothing():
+    """A conflict on the first step leaves the destination unreserved"""
+    manager = ReservationManager()
+    dest, step = Position(5, 5), Position(4, 5)
+    manager.soft_reserve(step, "agent2", None, 1)
+
+    assert manager.soft_reserve_pair(dest, step, "agent1", 1) == False
+    assert manager.is_reserved(dest, "agent2") == False
+
+    manager.reset_soft_reservations()
+    assert manager.soft_reserve_pair(dest, step, "agent1", 1) == True
+    assert manager.is_reserved(dest, "agent2") == True
+    assert manager.is_reserved(step, "agent2") == True
+    assert manager.reservations[dest.to_tuple()].next_step == step.to_tuple()
+
+
+def test_owner_tracking_follows_live_reservations():
+    """SOFT ownership is dropped each tick; expired and taken-over HARD tiles leave the owner's list"""
+    manager = ReservationManager()
+    manager.soft_reserve(Position(1, 1), "agent1", None, 1)
+    manager.soft_reserve(Position(1, 1), "agent1", None, 1)
+    manager.hard_reserve(Position(2, 2), "agent1", None, current_tick=1, ttl=2)
+    manager.hard_reserve(Position(3, 3), "agent2", None, current_tick=1, ttl=5)
+    assert manager.soft_owner_reservations["agent1"] == [(1, 1)]
+    assert manager.hard_owner_reservations["agent1"] == [(2, 2)]
+
+    manager.hard_reserve(Position(3, 3), "agent1", None, current_tick=1, ttl=5)
+    assert manager.hard_owner_reservations["agent2"] == []
+
+    manager.reset_soft_reservations()
+    assert manager.soft_owner_reservations == {}
+
+    manager.expire_old_reservations(3)
+    assert manager.hard_owner_reservations["agent1"] == [(3, 3)]
+
+    manager.soft_reserve(Position(4, 4), "agent1", None, 3)
+    manager.rollback_owner("agent1", 3)
+    assert manager.reservations == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
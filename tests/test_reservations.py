@@ -60,6 +60,34 @@ def test_reservation_prevents_clustering():
         assert first_step1 != first_step2, f"Both units chose same first step: {first_step1}"
 
 
+def test_plan_all_matches_sequential_plan_move():
+    """Batch planning gives each bomber the plan it would get planned alone, in order"""
+    bombers = [
+        Bomber(id=f"bomber{i}", pos=Position(10 + i, 10), alive=True, can_move=True,
+               bombs_available=1, armor=0, safe_time=0)
+        for i in range(3)
+    ]
+    state = ArenaState(
+        bombers=bombers, enemies=[], mobs=[],
+        obstacles=[Position(13, 10), Position(10, 12)], walls=[], bombs=[],
+        map_size=(50, 50), round_name="test", player_name="test", raw_score=0
+    )
+    
+    plans = []
+    for batch in (True, False):
+        planner = Planner()
+        world = WorldMemory()
+        world.update(state, 1)
+        planner.assign_roles(state.bombers)
+        if batch:
+            plans.append(planner.plan_all(bombers + bombers[:1], state, world, 1))
+        else:
+            plans.append({b.id: planner.plan_move(b, state, world, 1) for b in bombers})
+    
+    assert list(plans[0]) == [b.id for b in bombers]
+    assert plans[0] == plans[1]
+
+
 def test_escape_path_with_no_bombs():
     """Test that escape path works when there are 0 bombs (should always find escape)"""
     planner = Planner()
@@ -105,14 +133,13 @@ def test_escape_path_with_no_bombs():
 def test_rate_limit_handling():
     """Test that rate limit tracking works correctly"""
     from src.bot import Bot
-    from src.client import APIClient
-    from unittest.mock import Mock, patch
     
-    # Create a mock client that returns None (simulating rate limit)
-    mock_client = Mock(spec=APIClient)
-    mock_client.get_arena.return_value = None
+    # Plain fake client whose arena fetch returns None (simulating rate limit)
+    class _FakeClient:
+        def get_arena(self, rate_limiter=None):
+            return None
     
-    bot = Bot(mock_client)
+    bot = Bot(_FakeClient())
     bot.rate_limited = False
     
     # First tick - should mark as rate limited
@@ -95,6 +95,29 @@ def test_mob_danger():
     assert danger.mob_danger[(10, 10)] > 0
 
 
+def test_reused_danger_map_forgets_expired_bombs():
+    """Updating the same DangerMap clears last tick's blasts and picks up new geometry"""
+    danger = DangerMap()
+    
+    def arena(bombs, obstacles):
+        return ArenaState(
+            bombers=[], enemies=[], mobs=[], obstacles=obstacles, walls=[],
+            bombs=bombs, map_size=(20, 20), round_name="test", raw_score=0, player_name="test"
+        )
+    
+    danger.update(arena([Bomb(pos=Position(5, 5), range=2, timer=5.0)], []))
+    assert not danger.is_safe(Position(5, 7))
+    
+    # Bomb gone: its cross is safe again
+    danger.update(arena([], []))
+    assert danger.is_safe(Position(5, 7)) and danger.is_safe(Position(5, 5))
+    
+    # A new obstacle now stops the southern ray
+    danger.update(arena([Bomb(pos=Position(5, 5), range=2, timer=5.0)], [Position(5, 6)]))
+    assert not danger.is_safe(Position(5, 6))
+    assert danger.is_safe(Position(5, 7))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 